@@ -0,0 +1,83 @@
+# ruff: noqa: D100, D103, T201
+"""
+Decoding benchmark.
+
+Builds tracks, playlists and load results from the raw test payloads, and compares decoding into mappings, with decoding into msgspec structs.
+
+Run from the root of the repository, with `python -m benchmarks.decoding`.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+from ongaku.builders import EntityBuilder
+from ongaku.internal.converters import json_dumps
+from ongaku.internal.structs import STRUCTS_AVAILABLE
+from tests import payloads
+
+NUMBER = 2000
+"""The amount of times each payload is built."""
+LARGE_PLAYLIST = 1000
+"""The amount of tracks in the large playlist."""
+
+
+def build_cases() -> list[tuple[str, str, bytes]]:
+    large_playlist = dict(payloads.PLAYLIST_PAYLOAD)
+    large_playlist["tracks"] = [payloads.TRACK_PAYLOAD] * LARGE_PLAYLIST
+
+    return [
+        ("track", "build_track", json_dumps(payloads.TRACK_PAYLOAD)),
+        ("playlist", "build_playlist", json_dumps(payloads.PLAYLIST_PAYLOAD)),
+        (
+            "load (track)",
+            "build_load_result",
+            json_dumps({"loadType": "track", "data": payloads.TRACK_PAYLOAD}),
+        ),
+        (
+            "load (search)",
+            "build_load_result",
+            json_dumps({"loadType": "search", "data": [payloads.TRACK_PAYLOAD] * 10}),
+        ),
+        (
+            f"load ({LARGE_PLAYLIST} tracks)",
+            "build_load_result",
+            json_dumps({"loadType": "playlist", "data": large_playlist}),
+        ),
+    ]
+
+
+def measure(builder: EntityBuilder, method: str, payload: bytes) -> float:
+    build: typing.Callable[[bytes], typing.Any] = getattr(builder, method)
+
+    number = NUMBER // 100 if len(payload) > 100000 else NUMBER
+
+    return timeit.timeit(lambda: build(payload), number=number) / number
+
+
+def main() -> None:
+    if not STRUCTS_AVAILABLE:
+        print("msgspec is not installed, only the mapping backend is measured.")
+
+    mapping_builder = EntityBuilder(structs=False)
+    struct_builder = EntityBuilder(structs=True) if STRUCTS_AVAILABLE else None
+
+    print(f"{'payload':>22} {'mapping':>12} {'structs':>12} {'speedup':>8}")
+
+    for name, method, payload in build_cases():
+        mapping_time = measure(mapping_builder, method, payload)
+
+        if struct_builder is None:
+            print(f"{name:>22} {mapping_time * 1e6:>10.1f}us {'-':>12} {'-':>8}")
+            continue
+
+        struct_time = measure(struct_builder, method, payload)
+
+        print(
+            f"{name:>22} {mapping_time * 1e6:>10.1f}us {struct_time * 1e6:>10.1f}us {mapping_time / struct_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
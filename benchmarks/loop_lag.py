@@ -0,0 +1,121 @@
+# ruff: noqa: D100, D103, T201
+"""
+Loop lag benchmark.
+
+Loads a large playlist through `load_track`, while a ticker measures how late the event loop wakes it up, and compares decoding on the event loop, with decoding in a worker thread.
+
+Run from the root of the repository, with `python -m benchmarks.loop_lag`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest import mock
+
+from ongaku.builders import EntityBuilder
+from ongaku.internal.converters import json_dumps
+from ongaku.rest import DEFAULT_OFFLOAD_THRESHOLD
+from ongaku.rest import RESTClient
+
+ENCODED_TRACK = "QAAAuQMAGURFQUQgQUhFQUQgfCBEcmVkZ2UgU29uZyEADlRoZSBTdHVwZW5kaXVtAAAAAAAExqgAC2QzQlEtVVpoMGE4AAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZDNCUS1VWmgwYTgBADRodHRwczovL2kueXRpbWcuY29tL3ZpL2QzQlEtVVpoMGE4L21heHJlc2RlZmF1bHQuanBnAAAHeW91dHViZQAAAAAAAAAA"
+"""The encoded track, used for every track in the playlist."""
+TICK = 0.001
+"""The interval the ticker sleeps for, in seconds."""
+ROUNDS = 5
+"""The amount of times each playlist is loaded."""
+
+
+def build_response(tracks: int) -> str:
+    return json_dumps(
+        {
+            "loadType": "playlist",
+            "data": {
+                "info": {"name": "playlist", "selectedTrack": -1},
+                "pluginInfo": {},
+                "tracks": [
+                    {
+                        "encoded": f"{ENCODED_TRACK}{index}",
+                        "info": {
+                            "identifier": f"identifier{index}",
+                            "isSeekable": True,
+                            "author": "The Stupendium",
+                            "length": 321000,
+                            "isStream": False,
+                            "position": 0,
+                            "title": f"DEAD AHEAD | Dredge Song! {index}",
+                            "uri": f"https://www.youtube.com/watch?v={index}",
+                            "artworkUrl": None,
+                            "isrc": None,
+                            "sourceName": "youtube",
+                        },
+                        "pluginInfo": {},
+                        "userData": {},
+                    }
+                    for index in range(tracks)
+                ],
+            },
+        }
+    ).decode()
+
+
+async def tick(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+
+        await asyncio.sleep(TICK)
+
+        lags.append(time.perf_counter() - started - TICK)
+
+
+async def load(response: str, offload_threshold: int | None) -> tuple[float, float]:
+    rest = RESTClient(
+        mock.Mock(entity_builder=EntityBuilder()),
+        offload_threshold=offload_threshold,
+    )
+
+    load_time = 0.0
+    max_lag = 0.0
+
+    for _ in range(ROUNDS):
+        session = mock.Mock(request=mock.AsyncMock(return_value=response))
+
+        lags: list[float] = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(tick(lags, stop))
+
+        # Let the ticker start, before the load blocks the loop.
+        await asyncio.sleep(TICK)
+
+        started = time.perf_counter()
+
+        await rest.load_track("query", session=session)
+
+        load_time += time.perf_counter() - started
+
+        stop.set()
+        await ticker
+
+        max_lag = max(max_lag, *lags)
+
+    return load_time / ROUNDS, max_lag
+
+
+async def main() -> None:
+    print(
+        f"{'tracks':>8} {'loop load':>12} {'loop lag':>12} {'thread load':>12} {'thread lag':>12}"
+    )
+
+    for tracks in (500, 1000, 5000):
+        response = build_response(tracks)
+
+        loop_time, loop_lag = await load(response, None)
+        thread_time, thread_lag = await load(response, DEFAULT_OFFLOAD_THRESHOLD)
+
+        print(
+            f"{tracks:>8} {loop_time * 1000:>10.2f}ms {loop_lag * 1000:>10.2f}ms {thread_time * 1000:>10.2f}ms {thread_lag * 1000:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+# ruff: noqa: D100, D101, D103, T201
+"""
+Memory benchmark.
+
+Builds a large queue of tracks from a lavalink payload, and compares the memory used for each queued track, with the old layout, where every model carried a `__dict__`, and every track its own empty plugin info and user data dicts.
+
+Run from the root of the repository, with `python -m benchmarks.memory`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gc
+import itertools
+import tracemalloc
+import typing
+
+from ongaku.builders import EntityBuilder
+from ongaku.impl import track
+from ongaku.internal.converters import json_dumps
+from ongaku.internal.converters import json_loads
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+ENCODED_TRACK: typing.Final[str] = (
+    "QAAAuQMAGURFQUQgQUhFQUQgfCBEcmVkZ2UgU29uZyEADlRoZSBTdHVwZW5kaXVtAAAAAAAExqgAC2QzQlEtVVpoMGE4AAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZDNCUS1VWmgwYTgBADRodHRwczovL2kueXRpbWcuY29tL3ZpL2QzQlEtVVpoMGE4L21heHJlc2RlZmF1bHQuanBnAAAHeW91dHViZQAAAAAAAAAA"
+)
+"""The encoded track, used for every track in the payload."""
+
+
+class DictTrack(track.Track):
+    pass
+
+
+class DictTrackInfo(track.TrackInfo):
+    pass
+
+
+class DictQueueEntry(track.QueueEntry):
+    pass
+
+
+def build_payload(tracks: int) -> bytes:
+    return json_dumps(
+        [
+            {
+                "encoded": f"{ENCODED_TRACK}{index}",
+                "info": {
+                    "identifier": f"identifier{index}",
+                    "isSeekable": True,
+                    "author": "The Stupendium",
+                    "length": 321000,
+                    "isStream": False,
+                    "position": 0,
+                    "title": f"DEAD AHEAD | Dredge Song! {index}",
+                    "uri": f"https://www.youtube.com/watch?v={index}",
+                    "artworkUrl": None,
+                    "isrc": None,
+                    "sourceName": "youtube",
+                },
+                "pluginInfo": {},
+                "userData": {},
+            }
+            for index in range(tracks)
+        ]
+    )
+
+
+def build_slotted(
+    payloads: typing.Sequence[typing.Mapping[str, typing.Any]],
+) -> list[track_.QueueEntry]:
+    builder = EntityBuilder()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    entry_ids = itertools.count()
+
+    return [
+        track.QueueEntry(builder.build_track(payload), None, next(entry_ids), now)
+        for payload in payloads
+    ]
+
+
+def build_dict(
+    payloads: typing.Sequence[typing.Mapping[str, typing.Any]],
+) -> list[track_.QueueEntry]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    entry_ids = itertools.count()
+
+    entries: list[track_.QueueEntry] = []
+
+    for payload in payloads:
+        info = payload["info"]
+
+        track_info = DictTrackInfo(
+            info["identifier"],
+            info["isSeekable"],
+            info["author"],
+            info["length"],
+            info["isStream"],
+            info["position"],
+            info["title"],
+            info["sourceName"],
+            info["uri"],
+            info["artworkUrl"],
+            info["isrc"],
+        )
+
+        entries.append(
+            DictQueueEntry(
+                DictTrack(payload["encoded"], track_info, {}, {}, None),
+                None,
+                next(entry_ids),
+                now,
+            )
+        )
+
+    return entries
+
+
+def measure(
+    build: typing.Callable[
+        [typing.Sequence[typing.Mapping[str, typing.Any]]], list[track_.QueueEntry]
+    ],
+    payload: bytes,
+) -> float:
+    # The payload is kept alive, so only the models are measured, not the strings they share with it.
+    payloads = json_loads(payload)
+
+    gc.collect()
+    tracemalloc.start()
+
+    started, _ = tracemalloc.get_traced_memory()
+
+    entries = build(payloads)
+
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return (current - started) / len(entries)
+
+
+def main() -> None:
+    print(f"{'tracks':>8} {'dict':>12} {'slotted':>12} {'reduction':>10}")
+
+    for tracks in (1000, 10000, 100000):
+        payload = build_payload(tracks)
+
+        dict_bytes = measure(build_dict, payload)
+        slotted_bytes = measure(build_slotted, payload)
+
+        print(
+            f"{tracks:>8} {dict_bytes:>10.1f}B {slotted_bytes:>10.1f}B {dict_bytes / slotted_bytes:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
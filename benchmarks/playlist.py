@@ -0,0 +1,107 @@
+# ruff: noqa: D100, D103, T201
+"""
+Playlist benchmark.
+
+Loads a large playlist through `load_track`, and compares building every track up front, with building each track lazily, when its info is first accessed.
+
+Run from the root of the repository, with `python -m benchmarks.playlist`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+from unittest import mock
+
+from ongaku.builders import EntityBuilder
+from ongaku.rest import RESTClient
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import playlist as playlist_
+
+ENCODED_TRACK: typing.Final[str] = (
+    "QAAAuQMAGURFQUQgQUhFQUQgfCBEcmVkZ2UgU29uZyEADlRoZSBTdHVwZW5kaXVtAAAAAAAExqgAC2QzQlEtVVpoMGE4AAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZDNCUS1VWmgwYTgBADRodHRwczovL2kueXRpbWcuY29tL3ZpL2QzQlEtVVpoMGE4L21heHJlc2RlZmF1bHQuanBnAAAHeW91dHViZQAAAAAAAAAA"
+)
+"""The encoded track, used for every track in the playlist."""
+DISPLAYED = 10
+"""The amount of tracks that are displayed, after the playlist is loaded."""
+ROUNDS = 5
+"""The amount of times each playlist is loaded."""
+
+
+def build_response(tracks: int) -> typing.Mapping[str, typing.Any]:
+    return {
+        "loadType": "playlist",
+        "data": {
+            "info": {"name": "playlist", "selectedTrack": -1},
+            "pluginInfo": {},
+            "tracks": [
+                {
+                    "encoded": f"{ENCODED_TRACK}{index}",
+                    "info": {
+                        "identifier": f"identifier{index}",
+                        "isSeekable": True,
+                        "author": "The Stupendium",
+                        "length": 321000,
+                        "isStream": False,
+                        "position": 0,
+                        "title": f"DEAD AHEAD | Dredge Song! {index}",
+                        "uri": f"https://www.youtube.com/watch?v={index}",
+                        "artworkUrl": None,
+                        "isrc": None,
+                        "sourceName": "youtube",
+                    },
+                    "pluginInfo": {},
+                    "userData": {},
+                }
+                for index in range(tracks)
+            ],
+        },
+    }
+
+
+async def load(tracks: int, *, lazy: bool) -> tuple[float, float]:
+    rest = RESTClient(mock.Mock(entity_builder=EntityBuilder(lazy=lazy)))
+
+    load_time = 0.0
+    display_time = 0.0
+
+    for _ in range(ROUNDS):
+        session = mock.Mock(request=mock.AsyncMock(return_value=build_response(tracks)))
+
+        started = time.perf_counter()
+
+        playlist = typing.cast(
+            "playlist_.Playlist", await rest.load_track("query", session=session)
+        )
+
+        loaded = time.perf_counter()
+
+        for track in playlist.tracks[:DISPLAYED]:
+            _ = track.info.title
+
+        displayed = time.perf_counter()
+
+        load_time += loaded - started
+        display_time += displayed - loaded
+
+    return load_time / ROUNDS, display_time / ROUNDS
+
+
+async def main() -> None:
+    print(
+        f"{'tracks':>8} {'eager load':>12} {'lazy load':>12} {'lazy display':>14} {'speedup':>8}"
+    )
+
+    for tracks in (100, 1000, 5000):
+        eager_time, _ = await load(tracks, lazy=False)
+        lazy_time, display_time = await load(tracks, lazy=True)
+
+        print(
+            f"{tracks:>8} {eager_time * 1000:>10.2f}ms {lazy_time * 1000:>10.2f}ms {display_time * 1000:>12.2f}ms {eager_time / lazy_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+# ruff: noqa: D100, D103, T201
+"""
+Serialization benchmark.
+
+Serializes a queue of tracks, and compares the size, and the time to serialize and rebuild them, between the lavalink payload, pickle, and the compact dump format.
+
+Run from the root of the repository, with `python -m benchmarks.serialization`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import timeit
+import typing
+
+from ongaku.builders import EntityBuilder
+from ongaku.internal.converters import json_dumps
+
+if typing.TYPE_CHECKING:
+    from ongaku.abc import track as track_
+
+ENCODED_TRACK: typing.Final[str] = (
+    "QAAAuQMAGURFQUQgQUhFQUQgfCBEcmVkZ2UgU29uZyEADlRoZSBTdHVwZW5kaXVtAAAAAAAExqgAC2QzQlEtVVpoMGE4AAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZDNCUS1VWmgwYTgBADRodHRwczovL2kueXRpbWcuY29tL3ZpL2QzQlEtVVpoMGE4L21heHJlc2RlZmF1bHQuanBnAAAHeW91dHViZQAAAAAAAAAA"
+)
+"""The encoded track, used for every track in the queue."""
+ROUNDS = 20
+"""The amount of times each queue is serialized, and rebuilt."""
+
+
+def build_payloads(tracks: int) -> list[typing.Mapping[str, typing.Any]]:
+    return [
+        {
+            "encoded": f"{ENCODED_TRACK}{index}",
+            "info": {
+                "identifier": f"identifier{index}",
+                "isSeekable": True,
+                "author": "The Stupendium",
+                "length": 321000,
+                "isStream": False,
+                "position": 0,
+                "title": f"DEAD AHEAD | Dredge Song! {index}",
+                "uri": f"https://www.youtube.com/watch?v={index}",
+                "artworkUrl": None,
+                "isrc": None,
+                "sourceName": "youtube",
+            },
+            "pluginInfo": {},
+            "userData": {},
+        }
+        for index in range(tracks)
+    ]
+
+
+def measure(
+    dump: typing.Callable[[], bytes],
+    load: typing.Callable[[bytes], typing.Any],
+) -> tuple[int, float, float]:
+    dumped = dump()
+
+    dump_time = timeit.timeit(dump, number=ROUNDS) / ROUNDS
+    load_time = timeit.timeit(lambda: load(dumped), number=ROUNDS) / ROUNDS
+
+    return len(dumped), dump_time, load_time
+
+
+def main() -> None:
+    builder = EntityBuilder(structs=False)
+
+    print(
+        f"{'tracks':>8} {'format':>10} {'size':>10} {'per track':>10} {'dump':>10} {'load':>10}"
+    )
+
+    for tracks in (100, 1000, 10000):
+        track_payloads = build_payloads(tracks)
+        built: typing.Sequence[track_.Track] = builder.build_tracks(track_payloads)
+
+        results = {
+            "lavalink": measure(
+                lambda: json_dumps(track_payloads), builder.build_tracks
+            ),
+            "pickle": measure(lambda: pickle.dumps(built), pickle.loads),
+            "compact": measure(
+                lambda: builder.dump_tracks(built), builder.build_dumped_tracks
+            ),
+        }
+
+        for name, (size, dump_time, load_time) in results.items():
+            print(
+                f"{tracks:>8} {name:>10} {size / 1024:>8.1f}KB {size / tracks:>9.1f}B {dump_time * 1000:>8.2f}ms {load_time * 1000:>8.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# ruff: noqa: D100, D103, T201
+"""
+Tracks benchmark.
+
+Builds a sequence of decoded track payloads, and compares building each track with `build_track`, with building all of them at once with `build_tracks`.
+
+Run from the root of the repository, with `python -m benchmarks.tracks`.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+from ongaku.builders import EntityBuilder
+from tests import payloads
+
+ROUNDS = 20
+"""The amount of times each sequence is built."""
+
+
+def build_each(
+    builder: EntityBuilder, track_payloads: typing.Sequence[typing.Any]
+) -> None:
+    for track_payload in track_payloads:
+        builder.build_track(track_payload)
+
+
+def build_bulk(
+    builder: EntityBuilder, track_payloads: typing.Sequence[typing.Any]
+) -> None:
+    builder.build_tracks(track_payloads)
+
+
+def main() -> None:
+    builder = EntityBuilder(structs=False)
+
+    print(f"{'tracks':>8} {'build_track':>14} {'build_tracks':>14} {'speedup':>8}")
+
+    for tracks in (100, 1000, 10000):
+        track_payloads = [payloads.TRACK_PAYLOAD] * tracks
+
+        each_time = (
+            timeit.timeit(lambda: build_each(builder, track_payloads), number=ROUNDS)
+            / ROUNDS
+        )
+        bulk_time = (
+            timeit.timeit(lambda: build_bulk(builder, track_payloads), number=ROUNDS)
+            / ROUNDS
+        )
+
+        print(
+            f"{tracks:>8} {each_time * 1000:>12.2f}ms {bulk_time * 1000:>12.2f}ms {each_time / bulk_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
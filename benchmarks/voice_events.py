@@ -0,0 +1,148 @@
+# ruff: noqa: D100, D103, T201
+"""
+Voice events benchmark.
+
+Simulates a storm of gateway voice events while many guilds connect at the same time, and compares the voice event collector, with waiting on each event type with a predicate.
+
+Run from the root of the repository, with `python -m benchmarks.voice_events`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import typing
+from unittest import mock
+
+import hikari
+from hikari.events.voice_events import VoiceServerUpdateEvent
+from hikari.events.voice_events import VoiceStateUpdateEvent
+
+from ongaku.internal.voice import VoiceEventCollector
+
+BOT_ID = hikari.Snowflake(1)
+"""The user id of the simulated bot."""
+NOISE = 5
+"""The amount of voice state updates from other users, for each guild."""
+
+
+def build_events(guilds: int) -> list[hikari.Event]:
+    storm: list[hikari.Event] = []
+
+    for guild in range(guilds):
+        guild_id = hikari.Snowflake(guild)
+
+        for user in range(NOISE):
+            storm.append(
+                VoiceStateUpdateEvent(
+                    shard=mock.Mock(),
+                    old_state=None,
+                    state=mock.Mock(
+                        guild_id=guild_id, user_id=hikari.Snowflake(user + 2)
+                    ),
+                )
+            )
+
+        storm.append(
+            VoiceStateUpdateEvent(
+                shard=mock.Mock(),
+                old_state=None,
+                state=mock.Mock(guild_id=guild_id, user_id=BOT_ID),
+            )
+        )
+        storm.append(
+            VoiceServerUpdateEvent(
+                app=mock.Mock(),
+                shard=mock.Mock(),
+                guild_id=guild_id,
+                token="token",
+                raw_endpoint="c-fra06-1a.discord.media:443",
+            )
+        )
+
+    random.shuffle(storm)
+
+    return storm
+
+
+async def collector(storm: typing.Sequence[hikari.Event], guilds: int) -> float:
+    voice_events = VoiceEventCollector(mock.Mock())
+
+    started = time.perf_counter()
+
+    futures = [
+        voice_events.expect(hikari.Snowflake(guild), BOT_ID) for guild in range(guilds)
+    ]
+
+    for event in storm:
+        if isinstance(event, VoiceStateUpdateEvent):
+            await voice_events._state_event(event)
+        elif isinstance(event, VoiceServerUpdateEvent):
+            await voice_events._server_event(event)
+
+    await asyncio.gather(*futures)
+
+    return time.perf_counter() - started
+
+
+async def predicate(storm: typing.Sequence[hikari.Event], guilds: int) -> float:
+    # Every event is checked against every waiter, like `event_manager.wait_for` with a predicate.
+    waiters: list[
+        tuple[
+            type[hikari.Event],
+            typing.Callable[[typing.Any], bool],
+            asyncio.Future[typing.Any],
+        ]
+    ] = []
+
+    loop = asyncio.get_running_loop()
+
+    started = time.perf_counter()
+
+    for guild in range(guilds):
+        guild_id = hikari.Snowflake(guild)
+
+        waiters.append(
+            (
+                VoiceStateUpdateEvent,
+                lambda event, guild_id=guild_id: event.guild_id == guild_id
+                and event.state.user_id == BOT_ID,
+                loop.create_future(),
+            )
+        )
+        waiters.append(
+            (
+                VoiceServerUpdateEvent,
+                lambda event, guild_id=guild_id: event.guild_id == guild_id,
+                loop.create_future(),
+            )
+        )
+
+    for event in storm:
+        for waiter in tuple(waiters):
+            event_type, check, future = waiter
+
+            if isinstance(event, event_type) and check(event):
+                future.set_result(event)
+                waiters.remove(waiter)
+
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    print(f"{'guilds':>8} {'events':>8} {'collector':>12} {'predicate':>12}")
+
+    for guilds in (10, 100, 500, 1000):
+        storm = build_events(guilds)
+
+        collector_time = await collector(storm, guilds)
+        predicate_time = await predicate(storm, guilds)
+
+        print(
+            f"{guilds:>8} {len(storm):>8} {collector_time * 1000:>10.2f}ms {predicate_time * 1000:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
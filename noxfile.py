@@ -13,6 +13,7 @@ SCRIPT_PATHS = [
     EXAMPLES_PATH,
     "noxfile.py",
     os.path.join(".", "tests"),
+    os.path.join(".", "benchmarks"),
 ]
 
 options.default_venv_backend = "uv"
@@ -17,10 +17,13 @@ from ongaku.abc.filters import BandType
 from ongaku.abc.playlist import Playlist
 from ongaku.abc.routeplanner import IPBlockType
 from ongaku.abc.routeplanner import RoutePlannerType
+from ongaku.abc.session import SessionHealth
 from ongaku.abc.session import SessionStatus
+from ongaku.abc.track import QueueEntry
 from ongaku.abc.track import Track
 from ongaku.client import Client
 from ongaku.errors import BuildError
+from ongaku.errors import BulkBuildError
 from ongaku.errors import ClientAliveError
 from ongaku.errors import ClientError
 from ongaku.errors import NoSessionsError
@@ -43,6 +46,8 @@ from ongaku.events import PlayerUpdateEvent
 from ongaku.events import QueueEmptyEvent
 from ongaku.events import QueueNextEvent
 from ongaku.events import ReadyEvent
+from ongaku.events import SessionDrainEvent
+from ongaku.events import SessionTransferEvent
 from ongaku.events import StatisticsEvent
 from ongaku.events import TrackEndEvent
 from ongaku.events import TrackExceptionEvent
@@ -50,6 +55,10 @@ from ongaku.events import TrackStartEvent
 from ongaku.events import TrackStuckEvent
 from ongaku.events import WebsocketClosedEvent
 from ongaku.impl.filters import Filters
+from ongaku.impl.handlers import BalancedSessionHandler
+from ongaku.impl.handlers import BasicSessionHandler
+from ongaku.impl.handlers import ConsistentHashSessionHandler
+from ongaku.impl.handlers import RegionSessionHandler
 from ongaku.internal.about import __author__
 from ongaku.internal.about import __author_email__
 from ongaku.internal.about import __license__
@@ -77,12 +86,18 @@ __all__ = (  # noqa: RUF022
     "Player",
     # .session
     "Session",
+    # .handlers
+    "BasicSessionHandler",
+    "BalancedSessionHandler",
+    "RegionSessionHandler",
+    "ConsistentHashSessionHandler",
     # .enums
     "SeverityType",
     "TrackEndReasonType",
     "RoutePlannerType",
     "IPBlockType",
     "SessionStatus",
+    "SessionHealth",
     # .errors
     "OngakuError",
     "RestError",
@@ -101,6 +116,7 @@ __all__ = (  # noqa: RUF022
     "PlayerQueueError",
     "PlayerMissingError",
     "BuildError",
+    "BulkBuildError",
     "TimeoutError",
     # .events
     "PayloadEvent",
@@ -114,11 +130,14 @@ __all__ = (  # noqa: RUF022
     "TrackStuckEvent",
     "QueueEmptyEvent",
     "QueueNextEvent",
+    "SessionDrainEvent",
+    "SessionTransferEvent",
     # .filters
     "Filters",
     "BandType",
     # .track
     "Track",
+    "QueueEntry",
     # .playlist
     "Playlist",
 )
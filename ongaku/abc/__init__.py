@@ -38,11 +38,13 @@ from ongaku.abc.routeplanner import RoutePlannerDetails
 from ongaku.abc.routeplanner import RoutePlannerStatus
 from ongaku.abc.routeplanner import RoutePlannerType
 from ongaku.abc.session import Session
+from ongaku.abc.session import SessionHealth
 from ongaku.abc.session import SessionStatus
 from ongaku.abc.statistics import Cpu
 from ongaku.abc.statistics import FrameStatistics
 from ongaku.abc.statistics import Memory
 from ongaku.abc.statistics import Statistics
+from ongaku.abc.track import QueueEntry
 from ongaku.abc.track import Track
 from ongaku.abc.track import TrackInfo
 
@@ -89,12 +91,14 @@ __all__ = (  # noqa: RUF022
     # .session
     "Session",
     "SessionStatus",
+    "SessionHealth",
     # .statistics
     "Statistics",
     "Memory",
     "Cpu",
     "FrameStatistics",
     # .track
+    "QueueEntry",
     "TrackInfo",
     "Track",
 )
@@ -121,6 +121,57 @@ class SessionHandler(abc.ABC):
         """
         ...
 
+    def fetch_player_session(
+        self, guild: hikari.SnowflakeishOr[hikari.Guild]
+    ) -> Session:
+        """Fetch a player session.
+
+        Returns the session a new player for a guild should use.
+
+        !!! note
+            By default, this is the same as [fetch_session][ongaku.abc.handler.SessionHandler.fetch_session] without a name.
+
+        Parameters
+        ----------
+        guild
+            The `guild`, or `guild id` the player is being created for.
+
+        Returns
+        -------
+        Session
+            The session to use.
+
+        Raises
+        ------
+        NoSessionError
+            Raised when there is no available sessions for the handler to return.
+        """
+        return self.fetch_session()
+
+    def fetch_voice_session(self, player: Player, endpoint: str) -> Session:
+        """Fetch a voice session.
+
+        Returns the session a player should use, once its voice server is known.
+
+        This is called by the player when connecting, before anything is played. If a different session is returned, the player is moved to it.
+
+        !!! note
+            By default, the players current session is kept.
+
+        Parameters
+        ----------
+        player
+            The player that is connecting.
+        endpoint
+            The voice server endpoint the player is connecting to.
+
+        Returns
+        -------
+        Session
+            The session to use.
+        """
+        return player.session
+
     @abc.abstractmethod
     async def delete_session(self, name: str) -> None:
         """Delete a session.
@@ -150,6 +201,8 @@ class SessionHandler(abc.ABC):
 
         Add a new player to the session handler.
 
+        If the guild already has a player that is no longer alive, for example after it was transferred, it is replaced.
+
         Parameters
         ----------
         player
@@ -12,6 +12,7 @@ import typing
 
 __all__ = (
     "Session",
+    "SessionHealth",
     "SessionStatus",
 )
 
@@ -62,6 +63,21 @@ class SessionStatus(int, enum.Enum):
     """A failure occurred connecting to the lavalink server."""
 
 
+class SessionHealth(int, enum.Enum):
+    """
+    Session Health.
+
+    How well the lavalink server of a session is responding.
+    """
+
+    HEALTHY = 0
+    """The server is responding normally."""
+    DEGRADED = 1
+    """The server is responding slowly, or its websocket messages are late."""
+    UNHEALTHY = 2
+    """The server is not responding, or the session is not connected."""
+
+
 class WebsocketOPCode(str, enum.Enum):
     READY = "ready"
     PLAYER_UPDATE = "playerUpdate"
@@ -21,6 +21,15 @@ class Statistics(abc.ABC):
     ![Lavalink](../../assets/lavalink_logo.png){ .twemoji } [Reference](https://lavalink.dev/api/websocket.html#stats-object)
     """
 
+    __slots__: typing.Sequence[str] = (
+        "_cpu",
+        "_frame_statistics",
+        "_memory",
+        "_players",
+        "_playing_players",
+        "_uptime",
+    )
+
     @property
     @abc.abstractmethod
     def players(self) -> int:
@@ -10,9 +10,12 @@ import abc
 import typing
 
 if typing.TYPE_CHECKING:
+    import datetime
+
     import hikari
 
 __all__ = (
+    "QueueEntry",
     "Track",
     "TrackInfo",
 )
@@ -64,10 +67,37 @@ class Track(abc.ABC):
         """The person who requested this track."""
         return self._requestor
 
+    def same_audio(self, other: Track) -> bool:
+        """
+        Same audio.
+
+        Whether both tracks play the same audio, ignoring who requested them, and their user data.
+
+        Example
+        -------
+        ```py
+        if any(entry.same_audio(track) for entry in player.queue):
+            print("This track is already queued.")
+        ```
+
+        Parameters
+        ----------
+        other
+            The track to compare against.
+        """
+        return self.encoded == other.encoded
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Track):
             return False
 
+        # Queue entries are only equal to other entries.
+        if isinstance(other, QueueEntry):
+            return False
+
         if self.encoded != other.encoded:
             return False
 
@@ -82,6 +112,81 @@ class Track(abc.ABC):
 
         return self.requestor == other.requestor
 
+    def __hash__(self) -> int:
+        # Strings cache their own hash, so this is only calculated once per track.
+        return hash(self.encoded)
+
+
+class QueueEntry(Track):
+    """
+    Queue entry.
+
+    A track that has been added to a players queue.
+
+    The entry only holds a reference to its track, so the same track can be queued in many players, each entry with its own requestor.
+
+    Two entries are only equal if they are the same entry, even if they hold the same track, and an entry is never equal to a plain track. Use [same_audio][ongaku.abc.track.Track.same_audio] to check if they play the same audio.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_enqueued_at",
+        "_entry_id",
+        "_track",
+    )
+
+    _enqueued_at: datetime.datetime
+    _entry_id: int
+    _track: Track
+
+    @property
+    def track(self) -> Track:
+        """The track that was queued."""
+        return self._track
+
+    @property
+    def entry_id(self) -> int:
+        """The unique id of this entry."""
+        return self._entry_id
+
+    @property
+    def enqueued_at(self) -> datetime.datetime:
+        """When this entry was added to the queue."""
+        return self._enqueued_at
+
+    @property
+    def encoded(self) -> str:
+        """The BASE-64 encoded track data."""
+        return self._track.encoded
+
+    @property
+    def info(self) -> TrackInfo:
+        """Information about the track."""
+        return self._track.info
+
+    @property
+    def plugin_info(self) -> typing.Mapping[str, typing.Any]:
+        """Additional track info provided by plugins."""
+        return self._track.plugin_info
+
+    @property
+    def user_data(self) -> typing.Mapping[str, typing.Any]:
+        """Additional track data.
+
+        !!! warning
+            If you store a value of any type under the name `ongaku_requestor` it will be overridden.
+        """
+        return self._track.user_data
+
+    def __eq__(self, other: object) -> bool:
+        # Entries are only compared with entries, so equality stays transitive.
+        if not isinstance(other, QueueEntry):
+            return False
+
+        return self.entry_id == other.entry_id
+
+    def __hash__(self) -> int:
+        return hash(self.encoded)
+
 
 class TrackInfo(abc.ABC):
     """
@@ -6,7 +6,9 @@ The builder, to convert most abstract classes from a payload.
 from __future__ import annotations
 
 import datetime
+import sys
 import typing
+import weakref
 
 import hikari
 
@@ -21,6 +23,8 @@ from ongaku.abc import routeplanner as routeplanner_
 from ongaku.abc import session as session_
 from ongaku.abc import statistics as statistics_
 from ongaku.abc import track as track_
+from ongaku.errors import BuildError
+from ongaku.errors import BulkBuildError
 from ongaku.errors import RestExceptionError
 from ongaku.errors import RestRequestError
 from ongaku.impl import filters
@@ -31,12 +35,16 @@ from ongaku.impl import routeplanner
 from ongaku.impl import session
 from ongaku.impl import statistics
 from ongaku.impl import track
+from ongaku.internal import structs as structs_
 from ongaku.internal.converters import DumpType
 from ongaku.internal.converters import LoadType
 from ongaku.internal.converters import json_dumps
 from ongaku.internal.converters import json_loads
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
+from ongaku.internal.schema import Field
+from ongaku.internal.schema import compile_schema
+from ongaku.internal.types import EMPTY_MAPPING
 
 if typing.TYPE_CHECKING:
     from ongaku.internal import types
@@ -44,6 +52,356 @@ if typing.TYPE_CHECKING:
 
 _logger = logger.getChild("builders")
 
+_DUMP_VERSION: typing.Final[int] = 1
+"""The version of the compact track format, written by `EntityBuilder.dump_tracks`."""
+
+
+def _timestamp(value: typing.Any) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(int(value) / 1000, datetime.timezone.utc)
+
+
+def _snowflake(value: typing.Any) -> hikari.Snowflake:
+    return hikari.Snowflake(int(value))
+
+
+# Schemas
+
+_REST_ERROR = compile_schema(
+    RestRequestError,
+    (
+        Field("timestamp", "timestamp", converter=_timestamp),
+        Field("status", "status"),
+        Field("error", "error"),
+        Field("message", "message"),
+        Field("path", "path"),
+        Field("trace", "trace", optional=True),
+    ),
+)
+
+_EXCEPTION_ERROR = compile_schema(
+    RestExceptionError,
+    (
+        Field("message", "message", optional=True),
+        Field("severity", "severity", converter=errors_.SeverityType),
+        Field("cause", "cause"),
+    ),
+)
+
+_FILTERS = compile_schema(
+    filters.Filters,
+    (
+        Field("volume", "volume", optional=True),
+        Field(
+            "equalizer",
+            "equalizer",
+            optional=True,
+            nested="build_filters_equalizer",
+            sequence=True,
+        ),
+        Field("karaoke", "karaoke", optional=True, nested="build_filters_karaoke"),
+        Field(
+            "timescale", "timescale", optional=True, nested="build_filters_timescale"
+        ),
+        Field("tremolo", "tremolo", optional=True, nested="build_filters_tremolo"),
+        Field("vibrato", "vibrato", optional=True, nested="build_filters_vibrato"),
+        Field("rotation", "rotation", optional=True, nested="build_filters_rotation"),
+        Field(
+            "distortion", "distortion", optional=True, nested="build_filters_distortion"
+        ),
+        Field(
+            "channel_mix",
+            "channelMix",
+            optional=True,
+            nested="build_filters_channel_mix",
+        ),
+        Field("low_pass", "lowPass", optional=True, nested="build_filters_low_pass"),
+        Field("plugin_filters", "pluginFilters", optional=True),
+    ),
+)
+
+_FILTERS_EQUALIZER = compile_schema(
+    filters.Equalizer,
+    (
+        Field("band", "band", converter=filters_.BandType),
+        Field("gain", "gain"),
+    ),
+)
+
+_FILTERS_KARAOKE = compile_schema(
+    filters.Karaoke,
+    (
+        Field("level", "level", optional=True),
+        Field("mono_level", "monoLevel", optional=True),
+        Field("filter_band", "filterBand", optional=True),
+        Field("filter_width", "filterWidth", optional=True),
+    ),
+)
+
+_FILTERS_TIMESCALE = compile_schema(
+    filters.Timescale,
+    (
+        Field("speed", "speed", optional=True),
+        Field("pitch", "pitch", optional=True),
+        Field("rate", "rate", optional=True),
+    ),
+)
+
+_FILTERS_TREMOLO = compile_schema(
+    filters.Tremolo,
+    (
+        Field("frequency", "frequency", optional=True),
+        Field("depth", "depth", optional=True),
+    ),
+)
+
+_FILTERS_VIBRATO = compile_schema(
+    filters.Vibrato,
+    (
+        Field("frequency", "frequency", optional=True),
+        Field("depth", "depth", optional=True),
+    ),
+)
+
+_FILTERS_ROTATION = compile_schema(
+    filters.Rotation,
+    (Field("rotation_hz", "rotationHz", optional=True),),
+)
+
+_FILTERS_DISTORTION = compile_schema(
+    filters.Distortion,
+    (
+        Field("sin_offset", "sinOffset", optional=True),
+        Field("sin_scale", "sinScale", optional=True),
+        Field("cos_offset", "cosOffset", optional=True),
+        Field("cos_scale", "cosScale", optional=True),
+        Field("tan_offset", "tanOffset", optional=True),
+        Field("tan_scale", "tanScale", optional=True),
+        Field("offset", "offset", optional=True),
+        Field("scale", "scale", optional=True),
+    ),
+)
+
+_FILTERS_CHANNEL_MIX = compile_schema(
+    filters.ChannelMix,
+    (
+        Field("left_to_left", "leftToLeft", optional=True),
+        Field("left_to_right", "leftToRight", optional=True),
+        Field("right_to_left", "rightToLeft", optional=True),
+        Field("right_to_right", "rightToRight", optional=True),
+    ),
+)
+
+_FILTERS_LOW_PASS = compile_schema(
+    filters.LowPass,
+    (Field("smoothing", "smoothing", optional=True),),
+)
+
+_INFO = compile_schema(
+    info.Info,
+    (
+        Field("version", "version", nested="build_info_version"),
+        Field("build_time", "buildTime", converter=_timestamp),
+        Field("git", "git", nested="build_info_git"),
+        Field("jvm", "jvm"),
+        Field("lavaplayer", "lavaplayer"),
+        Field("source_managers", "sourceManagers", converter=list),
+        Field("filters", "filters", converter=list),
+        Field("plugins", "plugins", nested="build_info_plugin", sequence=True),
+    ),
+)
+
+_INFO_VERSION = compile_schema(
+    info.Version,
+    (
+        Field("semver", "semver"),
+        Field("major", "major"),
+        Field("minor", "minor"),
+        Field("patch", "patch"),
+        Field("pre_release", "preRelease"),
+        Field("build", "build", optional=True),
+    ),
+)
+
+_INFO_GIT = compile_schema(
+    info.Git,
+    (
+        Field("branch", "branch"),
+        Field("commit", "commit"),
+        Field("commit_time", "commitTime", converter=_timestamp),
+    ),
+)
+
+_INFO_PLUGIN = compile_schema(
+    info.Plugin,
+    (
+        Field("name", "name"),
+        Field("version", "version"),
+    ),
+)
+
+_PLAYER = compile_schema(
+    player.Player,
+    (
+        Field("guild_id", "guildId", converter=_snowflake),
+        Field("track", "track", optional=True, nested="build_track"),
+        Field("volume", "volume"),
+        Field("is_paused", "paused"),
+        Field("state", "state", nested="build_player_state"),
+        Field("voice", "voice", nested="build_player_voice"),
+        Field("filters", "filters", optional=True, nested="build_filters"),
+    ),
+)
+
+_PLAYER_STATE = compile_schema(
+    player.State,
+    (
+        Field("time", "time", converter=_timestamp),
+        Field("position", "position"),
+        Field("connected", "connected"),
+        Field("ping", "ping"),
+    ),
+)
+
+_PLAYER_VOICE = compile_schema(
+    player.Voice,
+    (
+        Field("token", "token"),
+        Field("endpoint", "endpoint"),
+        Field("session_id", "sessionId"),
+    ),
+)
+
+_PLAYLIST_INFO = compile_schema(
+    playlist.PlaylistInfo,
+    (
+        Field("name", "name"),
+        Field("selected_track", "selectedTrack"),
+    ),
+)
+
+_ROUTEPLANNER_STATUS = compile_schema(
+    routeplanner.RoutePlannerStatus,
+    (
+        Field("cls", "class", converter=routeplanner_.RoutePlannerType),
+        Field("details", "details", nested="build_routeplanner_details"),
+    ),
+)
+
+_ROUTEPLANNER_DETAILS = compile_schema(
+    routeplanner.RoutePlannerDetails,
+    (
+        Field("ip_block", "ipBlock", nested="build_routeplanner_ipblock"),
+        Field(
+            "failing_addresses",
+            "failingAddresses",
+            nested="build_routeplanner_failing_address",
+            sequence=True,
+        ),
+        Field("rotate_index", "rotateIndex", optional=True),
+        Field("ip_index", "ipIndex", optional=True),
+        Field("current_address", "currentAddress", optional=True),
+        Field("current_address_index", "currentAddressIndex", optional=True),
+        Field("block_index", "blockIndex", optional=True),
+    ),
+)
+
+_ROUTEPLANNER_IPBLOCK = compile_schema(
+    routeplanner.IPBlock,
+    (
+        Field("type", "type", converter=routeplanner_.IPBlockType),
+        Field("size", "size"),
+    ),
+)
+
+_ROUTEPLANNER_FAILING_ADDRESS = compile_schema(
+    routeplanner.FailingAddress,
+    (
+        Field("address", "failingAddress"),
+        Field("timestamp", "failingTimestamp", converter=_timestamp),
+        Field("time", "failingTime"),
+    ),
+)
+
+_SESSION = compile_schema(
+    session.Session,
+    (
+        Field("resuming", "resuming"),
+        Field("timeout", "timeout"),
+    ),
+)
+
+_STATISTICS = compile_schema(
+    statistics.Statistics,
+    (
+        Field("players", "players"),
+        Field("playing_players", "playingPlayers"),
+        Field("uptime", "uptime"),
+        Field("memory", "memory", nested="build_statistics_memory"),
+        Field("cpu", "cpu", nested="build_statistics_cpu"),
+        Field(
+            "frame_statistics",
+            "frameStats",
+            optional=True,
+            nested="build_statistics_frame_statistics",
+        ),
+    ),
+)
+
+_STATISTICS_MEMORY = compile_schema(
+    statistics.Memory,
+    (
+        Field("free", "free"),
+        Field("used", "used"),
+        Field("allocated", "allocated"),
+        Field("reservable", "reservable"),
+    ),
+)
+
+_STATISTICS_CPU = compile_schema(
+    statistics.Cpu,
+    (
+        Field("cores", "cores"),
+        Field("system_load", "systemLoad"),
+        Field("lavalink_load", "lavalinkLoad"),
+    ),
+)
+
+_STATISTICS_FRAME_STATISTICS = compile_schema(
+    statistics.FrameStatistics,
+    (
+        Field("sent", "sent"),
+        Field("nulled", "nulled"),
+        Field("deficit", "deficit"),
+    ),
+)
+
+_TRACK_INFO = compile_schema(
+    track.TrackInfo,
+    (
+        Field("identifier", "identifier"),
+        Field("is_seekable", "isSeekable"),
+        Field("author", "author"),
+        Field("length", "length"),
+        Field("is_stream", "isStream"),
+        Field("position", "position"),
+        Field("title", "title"),
+        Field("source_name", "sourceName"),
+        Field("uri", "uri", optional=True),
+        Field("artwork_url", "artworkUrl", optional=True),
+        Field("isrc", "isrc", optional=True),
+    ),
+)
+
+
+def _sizeof_track(built: track_.Track) -> int:
+    size = sys.getsizeof(built) + sys.getsizeof(built.encoded)
+
+    # Lazy tracks may not have built their info yet, and it should not be built just to be measured.
+    if not isinstance(built, track.LazyTrack):
+        size += sys.getsizeof(built.info)
+
+    return size
+
 
 class EntityBuilder:
     """Entity Builder.
@@ -56,11 +414,30 @@ class EntityBuilder:
         The dumping method to use when dumping payloads.
     loads
         The loading method to use when loading payloads.
+    lazy
+        Whether tracks keep their payload, and only build their info, plugin info and user data when first accessed.
+    intern
+        Whether tracks with the same encoded data share one instance, while any of them are still in use.
+    structs
+        Whether raw track payloads are decoded straight into typed structs with msgspec. By default, this is used when msgspec is installed, and tracks are not lazy.
+
+    Raises
+    ------
+    ImportError
+        Raised when `structs` is `True`, but msgspec is not installed.
+    ValueError
+        Raised when `structs` and `lazy` are both `True`.
     """
 
     __slots__: typing.Sequence[str] = (
         "_dumps",
+        "_intern_hits",
+        "_intern_misses",
+        "_intern_pool",
+        "_intern_saved_bytes",
+        "_lazy",
         "_loads",
+        "_structs",
     )
 
     def __init__(
@@ -68,9 +445,57 @@ class EntityBuilder:
         *,
         dumps: DumpType = json_dumps,
         loads: LoadType = json_loads,
+        lazy: bool = False,
+        intern: bool = False,
+        structs: bool | None = None,
     ) -> None:
+        if structs and not structs_.STRUCTS_AVAILABLE:
+            raise ImportError("msgspec is required for you to use structs.")
+
+        if structs and lazy:
+            raise ValueError("Structs can not be used with lazy tracks.")
+
         self._dumps = dumps
         self._loads = loads
+        self._lazy = lazy
+        self._intern_pool: weakref.WeakValueDictionary[str, track_.Track] | None = (
+            weakref.WeakValueDictionary() if intern else None
+        )
+        self._intern_hits = 0
+        self._intern_misses = 0
+        self._intern_saved_bytes = 0
+        # Lazy tracks keep their payload mapping, so structs are only used by default, when tracks are built eagerly.
+        self._structs = (
+            structs_.STRUCTS_AVAILABLE and not lazy if structs is None else structs
+        )
+
+    @property
+    def uses_structs(self) -> bool:
+        """Whether raw track payloads are decoded with msgspec structs."""
+        return self._structs
+
+    @property
+    def intern_hit_ratio(self) -> float:
+        """
+        Intern hit ratio.
+
+        The ratio of tracks that were found in the intern pool, out of all the tracks that could be interned.
+        """
+        total = self._intern_hits + self._intern_misses
+
+        if total == 0:
+            return 0.0
+
+        return self._intern_hits / total
+
+    @property
+    def intern_saved_bytes(self) -> int:
+        """
+        Intern saved bytes.
+
+        The approximate amount of bytes saved, by reusing tracks from the intern pool.
+        """
+        return self._intern_saved_bytes
 
     def _ensure_mapping(
         self,
@@ -122,19 +547,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into RestError")
-
-        return RestRequestError(
-            datetime.datetime.fromtimestamp(
-                int(data["timestamp"]) / 1000,
-                datetime.timezone.utc,
-            ),
-            data["status"],
-            data["error"],
-            data["message"],
-            data["path"],
-            data.get("trace", None),
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into RestError")
+
+        return _REST_ERROR(self, data)
 
     def build_exception_error(
         self,
@@ -163,13 +579,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into ExceptionError")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into ExceptionError")
 
-        return RestExceptionError(
-            data.get("message", None),
-            errors_.SeverityType(data["severity"]),
-            data["cause"],
-        )
+        return _EXCEPTION_ERROR(self, data)
 
     # Events
 
@@ -522,43 +935,10 @@ class EntityBuilder:
     def build_filters(self, payload: types.PayloadMappingT) -> filters_.Filters:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters")
-
-        equalizer: list[filters_.Equalizer] = []
-
-        if data.get("equalizer", None) is not None:
-            for eq in data["equalizer"]:
-                equalizer.append(self.build_filters_equalizer(eq))
-
-        return filters.Filters(
-            volume=data.get("volume", None),
-            equalizer=equalizer,
-            karaoke=self.build_filters_karaoke(data["karaoke"])
-            if data.get("karaoke", None)
-            else None,
-            timescale=self.build_filters_timescale(data["timescale"])
-            if data.get("timescale", None)
-            else None,
-            tremolo=self.build_filters_tremolo(data["tremolo"])
-            if data.get("tremolo", None)
-            else None,
-            vibrato=self.build_filters_vibrato(data["vibrato"])
-            if data.get("vibrato", None)
-            else None,
-            rotation=self.build_filters_rotation(data["rotation"])
-            if data.get("rotation", None)
-            else None,
-            distortion=self.build_filters_distortion(data["distortion"])
-            if data.get("distortion", None)
-            else None,
-            channel_mix=self.build_filters_channel_mix(data["channelMix"])
-            if data.get("channelMix", None)
-            else None,
-            low_pass=self.build_filters_low_pass(data["lowPass"])
-            if data.get("lowPass", None)
-            else None,
-            plugin_filters=data.get("pluginFilters", None),
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters")
+
+        return _FILTERS(self, data)
 
     def build_filters_equalizer(
         self,
@@ -566,21 +946,22 @@ class EntityBuilder:
     ) -> filters_.Equalizer:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Equalizer")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Equalizer"
+            )
 
-        return filters.Equalizer(filters_.BandType(data["band"]), data["gain"])
+        return _FILTERS_EQUALIZER(self, data)
 
     def build_filters_karaoke(self, payload: types.PayloadMappingT) -> filters_.Karaoke:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Karaoke")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Karaoke"
+            )
 
-        return filters.Karaoke(
-            data.get("level", None),
-            data.get("monoLevel", None),
-            data.get("filterBand", None),
-            data.get("filterWidth", None),
-        )
+        return _FILTERS_KARAOKE(self, data)
 
     def build_filters_timescale(
         self,
@@ -588,33 +969,32 @@ class EntityBuilder:
     ) -> filters_.Timescale:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Timescale")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Timescale"
+            )
 
-        return filters.Timescale(
-            data.get("speed", None),
-            data.get("pitch", None),
-            data.get("rate", None),
-        )
+        return _FILTERS_TIMESCALE(self, data)
 
     def build_filters_tremolo(self, payload: types.PayloadMappingT) -> filters_.Tremolo:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Tremolo")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Tremolo"
+            )
 
-        return filters.Tremolo(
-            data.get("frequency", None),
-            data.get("depth", None),
-        )
+        return _FILTERS_TREMOLO(self, data)
 
     def build_filters_vibrato(self, payload: types.PayloadMappingT) -> filters_.Vibrato:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Vibrato")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Vibrato"
+            )
 
-        return filters.Vibrato(
-            data.get("frequency", None),
-            data.get("depth", None),
-        )
+        return _FILTERS_VIBRATO(self, data)
 
     def build_filters_rotation(
         self,
@@ -622,11 +1002,12 @@ class EntityBuilder:
     ) -> filters_.Rotation:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Rotation")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Rotation"
+            )
 
-        return filters.Rotation(
-            data.get("rotationHz", None),
-        )
+        return _FILTERS_ROTATION(self, data)
 
     def build_filters_distortion(
         self,
@@ -634,18 +1015,12 @@ class EntityBuilder:
     ) -> filters_.Distortion:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters Distortion")
-
-        return filters.Distortion(
-            data.get("sinOffset", None),
-            data.get("sinScale", None),
-            data.get("cosOffset", None),
-            data.get("cosScale", None),
-            data.get("tanOffset", None),
-            data.get("tanScale", None),
-            data.get("offset", None),
-            data.get("scale", None),
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters Distortion"
+            )
+
+        return _FILTERS_DISTORTION(self, data)
 
     def build_filters_channel_mix(
         self,
@@ -653,14 +1028,12 @@ class EntityBuilder:
     ) -> filters_.ChannelMix:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters ChannelMix")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters ChannelMix"
+            )
 
-        return filters.ChannelMix(
-            data.get("leftToLeft", None),
-            data.get("leftToRight", None),
-            data.get("rightToLeft", None),
-            data.get("rightToRight", None),
-        )
+        return _FILTERS_CHANNEL_MIX(self, data)
 
     def build_filters_low_pass(
         self,
@@ -668,11 +1041,12 @@ class EntityBuilder:
     ) -> filters_.LowPass:
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Filters LowPass")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Filters LowPass"
+            )
 
-        return filters.LowPass(
-            data.get("smoothing", None),
-        )
+        return _FILTERS_LOW_PASS(self, data)
 
     # info
 
@@ -700,36 +1074,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Info")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Info")
 
-        source_managers: list[str] = []
-
-        for manager in data["sourceManagers"]:
-            source_managers.append(manager)
-
-        filters: list[str] = []
-
-        for filter in data["filters"]:
-            filters.append(filter)
-
-        plugins: list[info_.Plugin] = []
-
-        for plugin in data["plugins"]:
-            plugins.append(self.build_info_plugin(plugin))
-
-        return info.Info(
-            self.build_info_version(data["version"]),
-            datetime.datetime.fromtimestamp(
-                int(data["buildTime"]) / 1000,
-                datetime.timezone.utc,
-            ),
-            self.build_info_git(data["git"]),
-            data["jvm"],
-            data["lavaplayer"],
-            source_managers,
-            filters,
-            plugins,
-        )
+        return _INFO(self, data)
 
     def build_info_version(self, payload: types.PayloadMappingT) -> info_.Version:
         """Build Version Information.
@@ -755,19 +1103,13 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(
-            TRACE_LEVEL,
-            f"Decoding payload: {payload} into Information Version",
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL,
+                f"Decoding payload: {payload} into Information Version",
+            )
 
-        return info.Version(
-            data["semver"],
-            data["major"],
-            data["minor"],
-            data["patch"],
-            data["preRelease"],
-            data.get("build", None),
-        )
+        return _INFO_VERSION(self, data)
 
     def build_info_git(self, payload: types.PayloadMappingT) -> info_.Git:
         """Build Git Information.
@@ -793,16 +1135,12 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Information Git")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Information Git"
+            )
 
-        return info.Git(
-            data["branch"],
-            data["commit"],
-            datetime.datetime.fromtimestamp(
-                int(data["commitTime"]) / 1000,
-                datetime.timezone.utc,
-            ),
-        )
+        return _INFO_GIT(self, data)
 
     def build_info_plugin(self, payload: types.PayloadMappingT) -> info_.Plugin:
         """Build Plugin Information.
@@ -828,9 +1166,12 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Information Plugin")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Information Plugin"
+            )
 
-        return info.Plugin(data["name"], data["version"])
+        return _INFO_PLUGIN(self, data)
 
     # Player
 
@@ -858,17 +1199,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player")
 
-        return player.Player(
-            hikari.Snowflake(int(data["guildId"])),
-            self.build_track(data["track"]) if data.get("track", None) else None,
-            data["volume"],
-            data["paused"],
-            self.build_player_state(data["state"]),
-            self.build_player_voice(data["voice"]),
-            self.build_filters(data["filters"]) if data.get("filters", False) else None,
-        )
+        return _PLAYER(self, data)
 
     def build_player_state(self, payload: types.PayloadMappingT) -> player_.State:
         """Build Player State.
@@ -894,17 +1228,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player State")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player State")
 
-        return player.State(
-            datetime.datetime.fromtimestamp(
-                int(data["time"]) / 1000,
-                datetime.timezone.utc,
-            ),
-            data["position"],
-            data["connected"],
-            data["ping"],
-        )
+        return _PLAYER_STATE(self, data)
 
     def build_player_voice(self, payload: types.PayloadMappingT) -> player_.Voice:
         """Build Player Voice.
@@ -930,9 +1257,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player Voice")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Player Voice")
 
-        return player.Voice(data["token"], data["endpoint"], data["sessionId"])
+        return _PLAYER_VOICE(self, data)
 
     # playlist
 
@@ -957,20 +1285,31 @@ class EntityBuilder:
             Raised when the payload could not be turned into a mapping.
         KeyError
             Raised when a value was not found in the payload.
+        BulkBuildError
+            Raised when any of the tracks failed to build.
         """
-        data = self._ensure_mapping(payload)
+        if self._structs and isinstance(payload, str | bytes):
+            return self._build_playlist_struct(structs_.decode_playlist(payload))
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Playlist")
-
-        tracks: list[track_.Track] = []
+        data = self._ensure_mapping(payload)
 
-        for track_payload in data["tracks"]:
-            tracks.append(self.build_track(track_payload))
+        # Playlists can hold thousands of tracks, so the payload is only formatted when it will be logged.
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Playlist")
 
         return playlist.Playlist(
             self.build_playlist_info(data["info"]),
-            tracks,
-            data["pluginInfo"],
+            self._build_tracks_mapping(data["tracks"]),
+            data["pluginInfo"] or EMPTY_MAPPING,
+        )
+
+    def _build_playlist_struct(
+        self, struct: structs_.PlaylistStruct
+    ) -> playlist_.Playlist:
+        return playlist.Playlist(
+            playlist.PlaylistInfo(struct.info.name, struct.info.selected_track),
+            [self._build_track_struct(track_struct) for track_struct in struct.tracks],
+            struct.plugin_info or EMPTY_MAPPING,
         )
 
     def build_playlist_info(
@@ -1000,9 +1339,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Playlist Info")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Playlist Info")
 
-        return playlist.PlaylistInfo(data["name"], data["selectedTrack"])
+        return _PLAYLIST_INFO(self, data)
 
     # route planner
 
@@ -1033,12 +1373,12 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into RoutePlannerStatus")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into RoutePlannerStatus"
+            )
 
-        return routeplanner.RoutePlannerStatus(
-            routeplanner_.RoutePlannerType(data["class"]),
-            self.build_routeplanner_details(data["details"]),
-        )
+        return _ROUTEPLANNER_STATUS(self, data)
 
     def build_routeplanner_details(
         self,
@@ -1067,27 +1407,13 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(
-            TRACE_LEVEL,
-            f"Decoding payload: {payload} into RoutePlannerDetails",
-        )
-
-        failing_addresses: list[routeplanner_.FailingAddress] = []
-
-        for failing_address in data["failingAddresses"]:
-            failing_addresses.append(
-                self.build_routeplanner_failing_address(failing_address),
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL,
+                f"Decoding payload: {payload} into RoutePlannerDetails",
             )
 
-        return routeplanner.RoutePlannerDetails(
-            self.build_routeplanner_ipblock(data["ipBlock"]),
-            failing_addresses,
-            data.get("rotateIndex", None),
-            data.get("ipIndex", None),
-            data.get("currentAddress", None),
-            data.get("currentAddressIndex", None),
-            data.get("blockIndex", None),
-        )
+        return _ROUTEPLANNER_DETAILS(self, data)
 
     def build_routeplanner_ipblock(
         self,
@@ -1116,12 +1442,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into IPBlock")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into IPBlock")
 
-        return routeplanner.IPBlock(
-            routeplanner_.IPBlockType(data["type"]),
-            data["size"],
-        )
+        return _ROUTEPLANNER_IPBLOCK(self, data)
 
     def build_routeplanner_failing_address(
         self,
@@ -1150,16 +1474,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into FailingAddress")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into FailingAddress")
 
-        return routeplanner.FailingAddress(
-            data["failingAddress"],
-            datetime.datetime.fromtimestamp(
-                int(data["failingTimestamp"]) / 1000,
-                datetime.timezone.utc,
-            ),
-            data["failingTime"],
-        )
+        return _ROUTEPLANNER_FAILING_ADDRESS(self, data)
 
     # session
 
@@ -1187,9 +1505,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Session")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Session")
 
-        return session.Session(data["resuming"], data["timeout"])
+        return _SESSION(self, data)
 
     # statistics
 
@@ -1220,18 +1539,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics")
-
-        return statistics.Statistics(
-            data["players"],
-            data["playingPlayers"],
-            data["uptime"],
-            self.build_statistics_memory(data["memory"]),
-            self.build_statistics_cpu(data["cpu"]),
-            self.build_statistics_frame_statistics(data["frameStats"])
-            if data.get("frameStats", None) is not None
-            else None,
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics")
+
+        return _STATISTICS(self, data)
 
     def build_statistics_memory(
         self,
@@ -1260,14 +1571,12 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics Memory")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL, f"Decoding payload: {payload} into Statistics Memory"
+            )
 
-        return statistics.Memory(
-            data["free"],
-            data["used"],
-            data["allocated"],
-            data["reservable"],
-        )
+        return _STATISTICS_MEMORY(self, data)
 
     def build_statistics_cpu(self, payload: types.PayloadMappingT) -> statistics_.Cpu:
         """Build Cpu Statistics.
@@ -1293,9 +1602,10 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics Cpu")
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Statistics Cpu")
 
-        return statistics.Cpu(data["cores"], data["systemLoad"], data["lavalinkLoad"])
+        return _STATISTICS_CPU(self, data)
 
     def build_statistics_frame_statistics(
         self,
@@ -1324,20 +1634,119 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(
-            TRACE_LEVEL,
-            f"Decoding payload: {payload} into Statistics FrameStatistics",
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(
+                TRACE_LEVEL,
+                f"Decoding payload: {payload} into Statistics FrameStatistics",
+            )
 
-        return statistics.FrameStatistics(data["sent"], data["nulled"], data["deficit"])
+        return _STATISTICS_FRAME_STATISTICS(self, data)
 
     # track
 
+    def build_load_result(
+        self,
+        payload: types.PayloadMappingT,
+    ) -> playlist_.Playlist | typing.Sequence[track_.Track] | track_.Track | None:
+        """Build Load Result.
+
+        Builds the result of loading tracks, from a payload.
+
+        Parameters
+        ----------
+        payload
+            The payload you provide.
+
+        Returns
+        -------
+        typing.Sequence[track_.Track]
+            A sequence of tracks (a search result)
+        playlist_.Playlist
+            A Playlist object.
+        track_.Track
+            A Track object.
+        None
+            No result was returned.
+
+        Raises
+        ------
+        RestExceptionError
+            Raised when lavalink failed to load the tracks.
+        BuildError
+            Raised when an unknown load type was received, or any of the tracks failed to build.
+        TypeError
+            Raised when the payload could not be turned into a mapping.
+        KeyError
+            Raised when a value was not found in the payload.
+        """
+        if self._structs and isinstance(payload, str | bytes):
+            return self._build_load_result_struct(structs_.decode_load_result(payload))
+
+        data = self._ensure_mapping(payload)
+
+        load_type: str = data["loadType"]
+
+        if load_type == "empty":
+            _logger.log(TRACE_LEVEL, "loadType is empty.")
+            return None
+
+        if load_type == "error":
+            _logger.log(TRACE_LEVEL, "loadType caused an error.")
+            raise RestExceptionError.from_error(
+                self.build_exception_error(data["data"])
+            )
+
+        if load_type == "search":
+            _logger.log(TRACE_LEVEL, "loadType was a search result.")
+            return self._build_tracks_mapping(data["data"])
+
+        if load_type == "track":
+            _logger.log(TRACE_LEVEL, "loadType was a track link.")
+            return self.build_track(data["data"])
+
+        if load_type == "playlist":
+            _logger.log(TRACE_LEVEL, "loadType was a playlist link.")
+            return self.build_playlist(data["data"])
+
+        raise BuildError(None, f"An unknown loadType was received: {load_type}")
+
+    def _build_load_result_struct(
+        self, struct: structs_.LoadResultStruct
+    ) -> playlist_.Playlist | typing.Sequence[track_.Track] | track_.Track | None:
+        if struct.load_type == "empty":
+            _logger.log(TRACE_LEVEL, "loadType is empty.")
+            return None
+
+        if struct.load_type == "error":
+            _logger.log(TRACE_LEVEL, "loadType caused an error.")
+            raise RestExceptionError.from_error(
+                self.build_exception_error(bytes(struct.data))
+            )
+
+        if struct.load_type == "search":
+            _logger.log(TRACE_LEVEL, "loadType was a search result.")
+            return [
+                self._build_track_struct(track_struct)
+                for track_struct in structs_.decode_tracks(struct.data)
+            ]
+
+        if struct.load_type == "track":
+            _logger.log(TRACE_LEVEL, "loadType was a track link.")
+            return self._build_track_struct(structs_.decode_track(struct.data))
+
+        if struct.load_type == "playlist":
+            _logger.log(TRACE_LEVEL, "loadType was a playlist link.")
+            return self._build_playlist_struct(structs_.decode_playlist(struct.data))
+
+        raise BuildError(None, f"An unknown loadType was received: {struct.load_type}")
+
     def build_track(self, payload: types.PayloadMappingT) -> track_.Track:
         """Build Track.
 
         Builds a [`Track`][ongaku.abc.track.Track] object, from a payload.
 
+        If the builder is lazy, the track only builds its info, plugin info and user data when they are first accessed. If the builder interns tracks, and a track with the same encoded data is still in use, that track is returned instead.
+
         Parameters
         ----------
         payload
@@ -1355,24 +1764,200 @@ class EntityBuilder:
         KeyError
             Raised when a value was not found in the payload.
         """
-        data = self._ensure_mapping(payload)
+        if self._structs and isinstance(payload, str | bytes):
+            return self._build_track_struct(structs_.decode_track(payload))
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Track")
+        data = self._ensure_mapping(payload)
 
-        user_data: typing.MutableMapping[str, typing.Any] = (
-            data["userData"] if data.get("userData", None) else {}
+        return self._intern_track(
+            data["encoded"],
+            data.get("userData", None),
+            lambda: self._build_track_mapping(data),
         )
 
+    def build_tracks(
+        self, payload: types.PayloadSequenceT
+    ) -> typing.Sequence[track_.Track]:
+        """Build Tracks.
+
+        Builds a sequence of [`Track`][ongaku.abc.track.Track] objects, from a payload.
+
+        The sequence is only checked once, and every track is built in a single loop, which is faster than calling [`build_track`][ongaku.builders.EntityBuilder.build_track] for each track. A track that fails to build does not stop the others from being built.
+
+        Parameters
+        ----------
+        payload
+            The payload you provide.
+
+        Returns
+        -------
+        typing.Sequence[track_.Track]
+            The tracks from the payload, in their original order.
+
+        Raises
+        ------
+        TypeError
+            Raised when the payload could not be turned into a sequence.
+        BulkBuildError
+            Raised when any of the tracks failed to build. The tracks that were built, and the exception for each index that failed, are on the error.
+        """
+        if self._structs and isinstance(payload, str | bytes):
+            try:
+                track_structs = structs_.decode_tracks(payload)
+            except Exception:
+                # A single invalid track fails the whole struct decode, so the mapping path finds which ones failed.
+                pass
+            else:
+                return [
+                    self._build_track_struct(track_struct)
+                    for track_struct in track_structs
+                ]
+
+        data = self._ensure_sequence(payload)
+
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into Tracks")
+
+        return self._build_tracks_mapping(data)
+
+    def _build_tracks_mapping(
+        self, data: typing.Sequence[typing.Any]
+    ) -> typing.Sequence[track_.Track]:
+        tracks: list[track_.Track] = []
+        failures: dict[int, Exception] = {}
+
+        # Everything used for each track is looked up once, before the loop.
+        append = tracks.append
+        pool = self._intern_pool
+        lazy = self._lazy
+        build_info = _TRACK_INFO
+        lazy_track = track.LazyTrack
+        built_track = track.Track
+        snowflake = hikari.Snowflake
+
+        for index, track_payload in enumerate(data):
+            try:
+                encoded: str = track_payload["encoded"]
+                user_data = track_payload.get("userData", None)
+
+                # Tracks with user data (or a requestor) are not identical to each other, so they are never interned.
+                track_pool = None if user_data else pool
+
+                if track_pool is not None:
+                    pooled = track_pool.get(encoded)
+
+                    if pooled is not None:
+                        self._intern_hits += 1
+                        self._intern_saved_bytes += _sizeof_track(pooled)
+                        append(pooled)
+                        continue
+
+                if lazy:
+                    built: track_.Track = lazy_track(track_payload, self)
+                else:
+                    requestor = None
+
+                    # The requestor is removed from a copy, so building the same payload again gives the same tracks.
+                    if user_data and "ongaku_requestor" in user_data:
+                        user_data = dict(user_data)
+                        requestor = user_data.pop("ongaku_requestor")
+
+                    built = built_track(
+                        encoded,
+                        build_info(self, track_payload["info"]),
+                        track_payload["pluginInfo"] or EMPTY_MAPPING,
+                        user_data or EMPTY_MAPPING,
+                        snowflake(requestor) if requestor else None,
+                    )
+            except Exception as e:
+                failures[index] = e
+                continue
+
+            if track_pool is not None:
+                self._intern_misses += 1
+                track_pool[encoded] = built
+
+            append(built)
+
+        if failures:
+            raise BulkBuildError(tracks, failures)
+
+        return tracks
+
+    def _build_track_mapping(
+        self, data: typing.Mapping[str, typing.Any]
+    ) -> track_.Track:
+        if self._lazy:
+            return track.LazyTrack(data, self)
+
+        _logger.log(TRACE_LEVEL, f"Decoding payload: {data} into Track")
+
+        user_data = dict(data.get("userData", None) or EMPTY_MAPPING)
+
         requestor = user_data.pop("ongaku_requestor", None)
 
         return track.Track(
             data["encoded"],
             self.build_track_info(data["info"]),
-            data["pluginInfo"],
-            user_data,
+            data["pluginInfo"] or EMPTY_MAPPING,
+            user_data or EMPTY_MAPPING,
             hikari.Snowflake(requestor) if requestor else None,
         )
 
+    def _build_track_struct(self, struct: structs_.TrackStruct) -> track_.Track:
+        def build() -> track_.Track:
+            requestor = struct.user_data.pop("ongaku_requestor", None)
+            info = struct.info
+
+            return track.Track(
+                struct.encoded,
+                track.TrackInfo(
+                    info.identifier,
+                    info.is_seekable,
+                    info.author,
+                    info.length,
+                    info.is_stream,
+                    info.position,
+                    info.title,
+                    info.source_name,
+                    info.uri,
+                    info.artwork_url,
+                    info.isrc,
+                ),
+                struct.plugin_info or EMPTY_MAPPING,
+                struct.user_data or EMPTY_MAPPING,
+                hikari.Snowflake(requestor) if requestor else None,
+            )
+
+        return self._intern_track(struct.encoded, struct.user_data, build)
+
+    def _intern_track(
+        self,
+        encoded: str,
+        user_data: typing.Mapping[str, typing.Any] | None,
+        build: typing.Callable[[], track_.Track],
+    ) -> track_.Track:
+        # Tracks with user data (or a requestor) are not identical to each other, so they are never interned.
+        pool = None if user_data else self._intern_pool
+
+        if pool is None:
+            return build()
+
+        pooled = pool.get(encoded)
+
+        if pooled is not None:
+            self._intern_hits += 1
+            self._intern_saved_bytes += _sizeof_track(pooled)
+            return pooled
+
+        self._intern_misses += 1
+
+        built = build()
+
+        pool[encoded] = built
+
+        return built
+
     def build_track_info(self, payload: types.PayloadMappingT) -> track_.TrackInfo:
         """Build Track Information.
 
@@ -1397,21 +1982,113 @@ class EntityBuilder:
         """
         data = self._ensure_mapping(payload)
 
-        _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackInfo")
-
-        return track.TrackInfo(
-            data["identifier"],
-            data["isSeekable"],
-            data["author"],
-            data["length"],
-            data["isStream"],
-            data["position"],
-            data["title"],
-            data["sourceName"],
-            data.get("uri", None),
-            data.get("artworkUrl", None),
-            data.get("isrc", None),
-        )
+        if _logger.isEnabledFor(TRACE_LEVEL):
+            _logger.log(TRACE_LEVEL, f"Decoding payload: {payload} into TrackInfo")
+
+        return _TRACK_INFO(self, data)
+
+    # dumped tracks
+
+    def dump_tracks(self, tracks: typing.Sequence[track_.Track]) -> bytes:
+        """Dump Tracks.
+
+        Dumps tracks into a compact format, that can be stored, or sent to another process, and built again with [`build_dumped_tracks`][ongaku.builders.EntityBuilder.build_dumped_tracks].
+
+        Each track is stored as a flat array, without the keys of the lavalink payload, and empty plugin info and user data are left out.
+
+        Parameters
+        ----------
+        tracks
+            The tracks to dump.
+
+        Returns
+        -------
+        bytes
+            The dumped tracks.
+
+        Raises
+        ------
+        TypeError
+            Raised when the plugin info or user data of a track could not be dumped.
+        """
+        dumped: list[typing.Any] = []
+        append = dumped.append
+
+        for dumped_track in tracks:
+            info = dumped_track.info
+
+            append(
+                [
+                    dumped_track.encoded,
+                    [
+                        info.identifier,
+                        info.is_seekable,
+                        info.author,
+                        info.length,
+                        info.is_stream,
+                        info.position,
+                        info.title,
+                        info.source_name,
+                        info.uri,
+                        info.artwork_url,
+                        info.isrc,
+                    ],
+                    dict(dumped_track.plugin_info) or None,
+                    dict(dumped_track.user_data) or None,
+                    int(dumped_track.requestor) if dumped_track.requestor else None,
+                ]
+            )
+
+        return self._dumps([_DUMP_VERSION, dumped])
+
+    def build_dumped_tracks(
+        self, payload: str | bytes
+    ) -> typing.Sequence[track_.Track]:
+        """Build Dumped Tracks.
+
+        Builds a sequence of [`Track`][ongaku.abc.track.Track] objects, from tracks dumped with [`dump_tracks`][ongaku.builders.EntityBuilder.dump_tracks].
+
+        Parameters
+        ----------
+        payload
+            The dumped tracks.
+
+        Returns
+        -------
+        typing.Sequence[track_.Track]
+            The tracks, in their original order.
+
+        Raises
+        ------
+        TypeError
+            Raised when the payload could not be turned into a sequence.
+        BuildError
+            Raised when the payload was dumped with a different version, or a track could not be built.
+        """
+        data = self._ensure_sequence(payload)
+
+        if len(data) != 2 or data[0] != _DUMP_VERSION:
+            raise BuildError(
+                None, f"The dumped tracks are not version {_DUMP_VERSION}."
+            )
+
+        track_info = track.TrackInfo
+        built_track = track.Track
+        snowflake = hikari.Snowflake
+
+        try:
+            return [
+                built_track(
+                    encoded,
+                    track_info(*info),
+                    plugin_info or EMPTY_MAPPING,
+                    user_data or EMPTY_MAPPING,
+                    snowflake(requestor) if requestor else None,
+                )
+                for encoded, info, plugin_info, user_data, requestor in data[1]
+            ]
+        except Exception as e:
+            raise BuildError(e)
 
 
 # MIT License
@@ -6,17 +6,26 @@ The base client for ongaku.
 
 from __future__ import annotations
 
+import asyncio
+import pathlib
 import typing
 
 import aiohttp
 import hikari
 
 from ongaku import errors
+from ongaku import events
+from ongaku.abc import session as session_
 from ongaku.builders import EntityBuilder
 from ongaku.impl.handlers import BasicSessionHandler
+from ongaku.internal.converters import json_dumps
+from ongaku.internal.converters import json_loads
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
+from ongaku.internal.voice import VoiceEventCollector
+from ongaku.internal.voice import VoiceStateScheduler
 from ongaku.player import Player
+from ongaku.rest import DEFAULT_OFFLOAD_THRESHOLD
 from ongaku.rest import RESTClient
 from ongaku.session import Session
 
@@ -32,6 +41,9 @@ _logger = logger.getChild("client")
 
 __all__ = ("Client",)
 
+_RESUME_TIMEOUT: typing.Final[int] = 60
+"""The time in seconds lavalink keeps the players after shutting down, so they can be adopted on the next start."""
+
 
 class Client:
     """
@@ -59,6 +71,12 @@ class Client:
         The log level for ongaku.
     attempts
         The amount of attempts a session will try to connect to the server.
+    state_file
+        The file to save the sessions and players to when shutting down. On the next start, the players still playing on lavalink are adopted, with their queues.
+    lazy_tracks
+        Whether tracks only build their info, plugin info and user data when first accessed. This makes loading large playlists faster.
+    intern_tracks
+        Whether tracks with the same encoded data share one instance. This saves memory, when the same tracks are queued in many guilds.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -68,7 +86,11 @@ class Client:
         "_entity_builder",
         "_is_alive",
         "_rest_client",
+        "_saved_players",
         "_session_handler",
+        "_state_file",
+        "_voice_events",
+        "_voice_scheduler",
     )
 
     def __init__(
@@ -78,23 +100,36 @@ class Client:
         session_handler: type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
         attempts: int = 3,
+        state_file: str | pathlib.Path | None = None,
+        lazy_tracks: bool = False,
+        intern_tracks: bool = False,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
     ) -> None:
         logger.setLevel(logs)
 
         self._attempts = attempts
+        self._state_file = pathlib.Path(state_file) if state_file else None
+        self._saved_players: typing.MutableMapping[
+            str, typing.Sequence[typing.Mapping[str, typing.Any]]
+        ] = {}
         self._app = app
         self._client_session: aiohttp.ClientSession | None = None
 
-        self._rest_client = RESTClient(self)
+        self._rest_client = RESTClient(self, offload_threshold=offload_threshold)
 
         self._is_alive = False
 
         self._session_handler = session_handler(self)
 
-        self._entity_builder = EntityBuilder()
+        self._entity_builder = EntityBuilder(lazy=lazy_tracks, intern=intern_tracks)
+
+        self._voice_events = VoiceEventCollector(app)
+
+        self._voice_scheduler = VoiceStateScheduler(app)
 
         app.event_manager.subscribe(hikari.StartedEvent, self._start_event)
         app.event_manager.subscribe(hikari.StoppingEvent, self._stop_event)
+        app.event_manager.subscribe(events.ReadyEvent, self._ready_event)
 
     @classmethod
     def from_arc(
@@ -104,6 +139,10 @@ class Client:
         session_handler: type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
         attempts: int = 3,
+        state_file: str | pathlib.Path | None = None,
+        lazy_tracks: bool = False,
+        intern_tracks: bool = False,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
     ) -> Client:
         """From Arc.
 
@@ -127,12 +166,24 @@ class Client:
             The log level for ongaku.
         attempts
             The amount of attempts a session will try to connect to the server.
+        state_file
+            The file to save the sessions and players to when shutting down.
+        lazy_tracks
+            Whether tracks only build their info, plugin info and user data when first accessed. This makes loading large playlists faster.
+        intern_tracks
+            Whether tracks with the same encoded data share one instance. This saves memory, when the same tracks are queued in many guilds.
+        offload_threshold
+            The length of a loaded tracks response, above which it is decoded in a worker thread, so large playlists do not block the event loop. The tracks are still built on the event loop. If `None`, responses are always decoded on the event loop.
         """
         cls = cls(
             client.app,
             session_handler=session_handler,
             logs=logs,
             attempts=attempts,
+            state_file=state_file,
+            lazy_tracks=lazy_tracks,
+            intern_tracks=intern_tracks,
+            offload_threshold=offload_threshold,
         )
 
         client.set_type_dependency(Client, cls)
@@ -149,6 +200,10 @@ class Client:
         session_handler: type[SessionHandler] = BasicSessionHandler,
         logs: str | int = "INFO",
         attempts: int = 3,
+        state_file: str | pathlib.Path | None = None,
+        lazy_tracks: bool = False,
+        intern_tracks: bool = False,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
     ) -> Client:
         """From Tanjun.
 
@@ -172,13 +227,30 @@ class Client:
             The log level for ongaku.
         attempts
             The amount of attempts a session will try to connect to the server.
+        state_file
+            The file to save the sessions and players to when shutting down.
+        lazy_tracks
+            Whether tracks only build their info, plugin info and user data when first accessed. This makes loading large playlists faster.
+        intern_tracks
+            Whether tracks with the same encoded data share one instance. This saves memory, when the same tracks are queued in many guilds.
+        offload_threshold
+            The length of a loaded tracks response, above which it is decoded in a worker thread, so large playlists do not block the event loop. The tracks are still built on the event loop. If `None`, responses are always decoded on the event loop.
         """
         try:
             app = client.get_type_dependency(hikari.GatewayBotAware)
         except KeyError:
             raise Exception("The gateway bot requested was not found.")
 
-        cls = cls(app, session_handler=session_handler, logs=logs, attempts=attempts)
+        cls = cls(
+            app,
+            session_handler=session_handler,
+            logs=logs,
+            attempts=attempts,
+            state_file=state_file,
+            lazy_tracks=lazy_tracks,
+            intern_tracks=intern_tracks,
+            offload_threshold=offload_threshold,
+        )
 
         client.set_type_dependency(Client, cls)
 
@@ -232,11 +304,13 @@ class Client:
 
     async def _start_event(self, event: hikari.StartedEvent) -> None:
         _logger.log(TRACE_LEVEL, "Starting up ongaku.")
+        await self._load_state()
         await self.session_handler.start()
         _logger.log(TRACE_LEVEL, "Successfully started ongaku.")
 
     async def _stop_event(self, event: hikari.StoppingEvent) -> None:
         _logger.log(TRACE_LEVEL, "Shutting down ongaku.")
+        await self._save_state()
         await self.session_handler.stop()
 
         if self._client_session:
@@ -244,6 +318,175 @@ class Client:
 
         _logger.log(TRACE_LEVEL, "Successfully shut down ongaku.")
 
+    async def _ready_event(self, event: events.ReadyEvent) -> None:
+        players = self._saved_players.pop(event.session.name, None)
+
+        if players is None:
+            return
+
+        if not event.resumed:
+            _logger.warning(
+                f"Session {event.session.name} could not be resumed, so its players could not be adopted."
+            )
+            return
+
+        try:
+            remote_players = await self.rest.fetch_players(
+                event.session_id, session=event.session
+            )
+        except errors.OngakuError as e:
+            _logger.warning(
+                f"Failed to fetch the players of session {event.session.name}: {e}"
+            )
+            return
+
+        saved_players = {
+            hikari.Snowflake(int(player["guild_id"])): player for player in players
+        }
+
+        for remote_player in remote_players:
+            try:
+                player = await Player._from_state(
+                    event.session,
+                    remote_player,
+                    saved_players.get(remote_player.guild_id, None),
+                )
+
+                self.session_handler.add_player(player)
+            except errors.OngakuError as e:
+                _logger.warning(
+                    f"Failed to adopt the player in {remote_player.guild_id}: {e}"
+                )
+                continue
+
+            _logger.log(
+                TRACE_LEVEL,
+                f"Adopted player in {remote_player.guild_id} from session {event.session.name}",
+            )
+
+    async def _load_state(self) -> None:
+        if self._state_file is None:
+            return
+
+        try:
+            state = json_loads(await asyncio.to_thread(self._state_file.read_bytes))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Failed to read the state file: {e}")
+            return
+
+        # A state file with the wrong shape is ignored, so the sessions still start normally.
+        saved_sessions = self._parse_state(state)
+
+        if saved_sessions is None:
+            _logger.warning("Failed to read the state file: Invalid state.")
+            return
+
+        for name, (session_id, players) in saved_sessions.items():
+            try:
+                session = self.session_handler.fetch_session(name)
+            except errors.SessionMissingError:
+                continue
+
+            session._session_id = session_id
+            self._saved_players.update({name: players})
+
+    @staticmethod
+    def _parse_state(
+        state: typing.Sequence[typing.Any] | typing.Mapping[str, typing.Any],
+    ) -> (
+        typing.Mapping[
+            str, tuple[str, typing.Sequence[typing.Mapping[str, typing.Any]]]
+        ]
+        | None
+    ):
+        if not isinstance(state, dict):
+            return None
+
+        sessions = typing.cast("typing.Mapping[str, typing.Any]", state).get(
+            "sessions", None
+        )
+
+        if not isinstance(sessions, typing.Mapping):
+            return None
+
+        saved_sessions: typing.MutableMapping[
+            str, tuple[str, typing.Sequence[typing.Mapping[str, typing.Any]]]
+        ] = {}
+
+        for name, saved_session in typing.cast(
+            "typing.Mapping[str, typing.Any]", sessions
+        ).items():
+            if not isinstance(saved_session, typing.Mapping):
+                return None
+
+            saved_session = typing.cast(
+                "typing.Mapping[str, typing.Any]", saved_session
+            )
+
+            session_id = saved_session.get("session_id", None)
+            players = saved_session.get("players", None)
+
+            if not isinstance(session_id, str) or not isinstance(players, list):
+                return None
+
+            players = typing.cast("list[typing.Any]", players)
+
+            for player in players:
+                if not isinstance(player, typing.Mapping) or "guild_id" not in player:
+                    return None
+
+            saved_sessions.update({name: (session_id, players)})
+
+        return saved_sessions
+
+    async def _save_state(self) -> None:
+        if self._state_file is None:
+            return
+
+        saved_sessions: typing.MutableMapping[str, typing.Mapping[str, typing.Any]] = {}
+
+        for session in self.session_handler.sessions:
+            if (
+                session.session_id is None
+                or session.status != session_.SessionStatus.CONNECTED
+            ):
+                continue
+
+            try:
+                await self.rest.update_session(
+                    session.session_id,
+                    resuming=True,
+                    timeout=_RESUME_TIMEOUT,
+                    session=session,
+                )
+            except errors.OngakuError as e:
+                _logger.warning(
+                    f"Failed to enable resuming for session {session.name}: {e}"
+                )
+                continue
+
+            saved_sessions.update(
+                {
+                    session.name: {
+                        "session_id": session.session_id,
+                        "players": [
+                            player._dump()
+                            for player in self.session_handler.players
+                            if player.session is session
+                        ],
+                    }
+                }
+            )
+
+        try:
+            await asyncio.to_thread(
+                self._state_file.write_bytes, json_dumps({"sessions": saved_sessions})
+            )
+        except OSError as e:
+            _logger.warning(f"Failed to write the state file: {e}")
+
     async def _arc_player_injector(
         self,
         ctx: arc.GatewayContext,
@@ -272,6 +515,7 @@ class Client:
         host: str = "127.0.0.1",
         port: int = 2333,
         password: str = "youshallnotpass",
+        region: str | None = None,
     ) -> Session:
         """
         Create Session.
@@ -301,8 +545,8 @@ class Client:
             The port of the lavalink server.
         password
             The password of the lavalink server.
-        attempts
-            The attempts that the session is allowed to use, before completely shutting down.
+        region
+            The voice region the lavalink server is closest to. Used by [RegionSessionHandler][ongaku.impl.handlers.RegionSessionHandler].
 
         Returns
         -------
@@ -321,6 +565,7 @@ class Client:
             port,
             password,
             self._attempts,
+            region,
         )
 
         return self.session_handler.add_session(new_session)
@@ -402,7 +647,7 @@ class Client:
         except errors.PlayerMissingError:
             pass
 
-        session = self.session_handler.fetch_session()
+        session = self.session_handler.fetch_player_session(hikari.Snowflake(guild))
 
         new_player = Player(session, hikari.Snowflake(guild))
 
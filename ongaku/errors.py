@@ -14,9 +14,11 @@ if typing.TYPE_CHECKING:
     import datetime
 
     from ongaku.abc.errors import SeverityType
+    from ongaku.abc.track import Track
 
 __all__ = (
     "BuildError",
+    "BulkBuildError",
     "ClientAliveError",
     "ClientError",
     "NoSessionsError",
@@ -96,6 +98,19 @@ class RestRequestError(RestError):
         self._path = path
         self._trace = trace
 
+    def __reduce__(self) -> tuple[type[RestRequestError], tuple[typing.Any, ...]]:
+        return (
+            RestRequestError,
+            (
+                self._timestamp,
+                self._status,
+                self._error,
+                self._message,
+                self._path,
+                self._trace,
+            ),
+        )
+
     @property
     def timestamp(self) -> datetime.datetime:
         """The timestamp of the error in milliseconds since the Unix epoch."""
@@ -146,6 +161,9 @@ class RestExceptionError(RestError, errors_.ExceptionError):
         self._severity = severity
         self._cause = cause
 
+    def __reduce__(self) -> tuple[type[RestExceptionError], tuple[typing.Any, ...]]:
+        return (RestExceptionError, (self._message, self._severity, self._cause))
+
     @classmethod
     def from_error(cls, error: errors_.ExceptionError):
         return cls(error.message, error.severity, error.cause)
@@ -272,6 +290,37 @@ class BuildError(OngakuError):
         return self._reason
 
 
+class BulkBuildError(BuildError):
+    """Raised when some of the tracks in a sequence fail to build.
+
+    The rest of the tracks are still built, and are available from [`tracks`][ongaku.errors.BulkBuildError.tracks].
+    """
+
+    __slots__: typing.Sequence[str] = ("_failures", "_tracks")
+
+    def __init__(
+        self,
+        tracks: typing.Sequence[Track],
+        failures: typing.Mapping[int, Exception],
+    ) -> None:
+        super().__init__(
+            next(iter(failures.values()), None),
+            f"{len(failures)} of {len(tracks) + len(failures)} tracks failed to build.",
+        )
+        self._tracks = tracks
+        self._failures = failures
+
+    @property
+    def tracks(self) -> typing.Sequence[Track]:
+        """The tracks that were built, in their original order."""
+        return self._tracks
+
+    @property
+    def failures(self) -> typing.Mapping[int, Exception]:
+        """The exceptions raised for each track that failed to build, by its index in the sequence."""
+        return self._failures
+
+
 class TimeoutError(OngakuError):
     """Raised when an event times out."""
 
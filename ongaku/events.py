@@ -763,6 +763,123 @@ class QueueNextEvent(events_.OngakuEvent):
         return self.old_track == other.old_track
 
 
+class SessionDrainEvent(events_.OngakuEvent):
+    """
+    Session drain event.
+
+    Dispatched while a session is being drained, after each batch of players is moved to another session.
+    """
+
+    __slots__: typing.Sequence[str] = ("_moved", "_remaining")
+
+    def __init__(
+        self,
+        app: hikari.RESTAware,
+        client: Client,
+        session: Session,
+        moved: int,
+        remaining: int,
+    ) -> None:
+        self._app = app
+        self._client = client
+        self._session = session
+        self._moved = moved
+        self._remaining = remaining
+
+    @classmethod
+    def from_session(
+        cls,
+        session: Session,
+        moved: int,
+        remaining: int,
+    ) -> SessionDrainEvent:
+        """Build the [PayloadEvent][ongaku.events.PayloadEvent] with just a session."""
+        return cls(session.app, session.client, session, moved, remaining)
+
+    @property
+    def moved(self) -> int:
+        """The amount of players moved off of the session so far."""
+        return self._moved
+
+    @property
+    def remaining(self) -> int:
+        """The amount of players still on the session."""
+        return self._remaining
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionDrainEvent):
+            return False
+
+        if self.moved != other.moved:
+            return False
+
+        return self.remaining == other.remaining
+
+
+class SessionTransferEvent(events_.OngakuEvent):
+    """
+    Session transfer event.
+
+    Dispatched while a session is being transferred, after each player is moved to its new session.
+    """
+
+    __slots__: typing.Sequence[str] = ("_moved", "_new_session", "_remaining")
+
+    def __init__(
+        self,
+        app: hikari.RESTAware,
+        client: Client,
+        session: Session,
+        new_session: Session,
+        moved: int,
+        remaining: int,
+    ) -> None:
+        self._app = app
+        self._client = client
+        self._session = session
+        self._new_session = new_session
+        self._moved = moved
+        self._remaining = remaining
+
+    @classmethod
+    def from_session(
+        cls,
+        session: Session,
+        new_session: Session,
+        moved: int,
+        remaining: int,
+    ) -> SessionTransferEvent:
+        """Build the [PayloadEvent][ongaku.events.PayloadEvent] with just a session."""
+        return cls(session.app, session.client, session, new_session, moved, remaining)
+
+    @property
+    def new_session(self) -> Session:
+        """The session the player was moved to, or the session being transferred, if none could be found."""
+        return self._new_session
+
+    @property
+    def moved(self) -> int:
+        """The amount of players successfully moved to their new session so far."""
+        return self._moved
+
+    @property
+    def remaining(self) -> int:
+        """The amount of players that have not been moved yet."""
+        return self._remaining
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionTransferEvent):
+            return False
+
+        if self.new_session != other.new_session:
+            return False
+
+        if self.moved != other.moved:
+            return False
+
+        return self.remaining == other.remaining
+
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypus
@@ -7,7 +7,10 @@ from __future__ import annotations
 
 from ongaku.abc.filters import BandType
 from ongaku.impl.filters import Filters
+from ongaku.impl.handlers import BalancedSessionHandler
 from ongaku.impl.handlers import BasicSessionHandler
+from ongaku.impl.handlers import ConsistentHashSessionHandler
+from ongaku.impl.handlers import RegionSessionHandler
 from ongaku.impl.info import Git
 from ongaku.impl.info import Info
 from ongaku.impl.info import Plugin
@@ -26,6 +29,8 @@ from ongaku.impl.statistics import Cpu
 from ongaku.impl.statistics import FrameStatistics
 from ongaku.impl.statistics import Memory
 from ongaku.impl.statistics import Statistics
+from ongaku.impl.track import LazyTrack
+from ongaku.impl.track import QueueEntry
 from ongaku.impl.track import Track
 from ongaku.impl.track import TrackInfo
 
@@ -35,6 +40,9 @@ __all__ = (  # noqa: RUF022
     "Filters",
     # .handlers
     "BasicSessionHandler",
+    "BalancedSessionHandler",
+    "RegionSessionHandler",
+    "ConsistentHashSessionHandler",
     # .info
     "Info",
     "Version",
@@ -60,6 +68,8 @@ __all__ = (  # noqa: RUF022
     "Cpu",
     "FrameStatistics",
     # .track
+    "LazyTrack",
+    "QueueEntry",
     "Track",
     "TrackInfo",
 )
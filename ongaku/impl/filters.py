@@ -39,6 +39,8 @@ class Filters(filters_.Filters):
 
     """
 
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         *,
@@ -540,6 +542,8 @@ class Filters(filters_.Filters):
 
 
 class Equalizer(filters_.Equalizer):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         band: filters_.BandType,
@@ -555,6 +559,8 @@ class Equalizer(filters_.Equalizer):
 
 
 class Karaoke(filters_.Karaoke):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         level: float | None,
@@ -581,6 +587,8 @@ class Karaoke(filters_.Karaoke):
 
 
 class Timescale(filters_.Timescale):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         speed: float | None,
@@ -600,6 +608,8 @@ class Timescale(filters_.Timescale):
 
 
 class Tremolo(filters_.Tremolo):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, frequency: float | None, depth: float | None) -> None:
         if frequency is not None and frequency < 0:
             raise ValueError("Frequency must be at or above 0.")
@@ -615,6 +625,8 @@ class Tremolo(filters_.Tremolo):
 
 
 class Vibrato(filters_.Vibrato):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, frequency: float | None, depth: float | None) -> None:
         if frequency is not None:
             if frequency > 14:
@@ -633,11 +645,15 @@ class Vibrato(filters_.Vibrato):
 
 
 class Rotation(filters_.Rotation):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, rotation_hz: float | None) -> None:
         self._rotation_hz = rotation_hz
 
 
 class Distortion(filters_.Distortion):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         sin_offset: float | None,
@@ -660,6 +676,8 @@ class Distortion(filters_.Distortion):
 
 
 class ChannelMix(filters_.ChannelMix):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(  # noqa: C901
         self,
         left_to_left: float | None,
@@ -698,6 +716,8 @@ class ChannelMix(filters_.ChannelMix):
 
 
 class LowPass(filters_.LowPass):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         smoothing: float | None,
@@ -7,11 +7,16 @@ The handler implemented classes.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import hashlib
+import re
+import time
 import typing
 
 import hikari
 
 from ongaku import errors
+from ongaku import events
 from ongaku.abc import handler as handler_
 from ongaku.abc import session as session_
 from ongaku.internal import logger
@@ -21,11 +26,72 @@ if typing.TYPE_CHECKING:
     from ongaku.player import Player
     from ongaku.session import Session
 
-__all__ = ("BasicSessionHandler",)
+__all__ = (
+    "DEFAULT_VOICE_REGIONS",
+    "BalancedSessionHandler",
+    "BasicSessionHandler",
+    "ConsistentHashSessionHandler",
+    "RegionSessionHandler",
+)
 
 
 _logger = logger.logger.getChild("handlers")
 
+_ENDPOINT_REGION_PATTERN: typing.Final[re.Pattern[str]] = re.compile(
+    r"^(?:c-)?([a-z-]+?)-?\d"
+)
+
+DEFAULT_VOICE_REGIONS: typing.Final[typing.Mapping[str, str]] = {
+    # Legacy region names.
+    "us-east": "us-east",
+    "us-central": "us-central",
+    "us-south": "us-south",
+    "us-west": "us-west",
+    "atlanta": "us-east",
+    "newark": "us-east",
+    "europe": "europe",
+    "rotterdam": "europe",
+    "amsterdam": "europe",
+    "frankfurt": "europe",
+    "london": "europe",
+    "russia": "russia",
+    "india": "india",
+    "singapore": "singapore",
+    "hongkong": "hongkong",
+    "japan": "japan",
+    "south-korea": "south-korea",
+    "sydney": "sydney",
+    "brazil": "brazil",
+    "southafrica": "southafrica",
+    # Airport codes.
+    "atl": "us-east",
+    "ewr": "us-east",
+    "iad": "us-east",
+    "ord": "us-central",
+    "dfw": "us-south",
+    "lax": "us-west",
+    "sea": "us-west",
+    "sjc": "us-west",
+    "ams": "europe",
+    "cdg": "europe",
+    "fra": "europe",
+    "lhr": "europe",
+    "mad": "europe",
+    "mil": "europe",
+    "rtm": "europe",
+    "waw": "europe",
+    "svo": "russia",
+    "bom": "india",
+    "sin": "singapore",
+    "hkg": "hongkong",
+    "nrt": "japan",
+    "icn": "south-korea",
+    "syd": "sydney",
+    "gru": "brazil",
+    "jnb": "southafrica",
+}
+"""The default mapping of discord voice server names, to voice regions."""
+
 
 class BasicSessionHandler(handler_.SessionHandler):
     """
@@ -96,15 +162,29 @@ class BasicSessionHandler(handler_.SessionHandler):
             except KeyError:
                 raise errors.SessionMissingError
 
-        if self._current_session:
+        if (
+            self._current_session
+            and self._current_session.health != session_.SessionHealth.UNHEALTHY
+            and not self._current_session.is_draining
+        ):
             return self._current_session
 
-        for session in self.sessions:
-            if session.status == session_.SessionStatus.CONNECTED:
-                self._current_session = session
-                return session
+        sessions = [
+            session
+            for session in self.sessions
+            if session.status == session_.SessionStatus.CONNECTED
+            and not session.is_draining
+        ]
 
-        raise errors.NoSessionsError
+        if len(sessions) == 0:
+            if self._current_session and not self._current_session.is_draining:
+                return self._current_session
+
+            raise errors.NoSessionsError
+
+        self._current_session = min(sessions, key=lambda session: session.health)
+
+        return self._current_session
 
     async def delete_session(self, name: str) -> None:
         try:
@@ -118,7 +198,9 @@ class BasicSessionHandler(handler_.SessionHandler):
         self,
         player: Player,
     ) -> Player:
-        if self._players.get(player.guild_id, None) is not None:
+        existing = self._players.get(player.guild_id, None)
+
+        if existing is not None and (existing is player or existing.is_alive):
             raise errors.UniqueError(
                 f"A player with the guild id {player.guild_id} has already been made.",
             )
@@ -144,6 +226,343 @@ class BasicSessionHandler(handler_.SessionHandler):
         await player.disconnect()
 
 
+class BalancedSessionHandler(BasicSessionHandler):
+    """
+    Balanced Session Handler.
+
+    This session handler gives each new player to the connected session with the lowest penalty.
+
+    The penalty of a session is calculated from the statistics lavalink sends every minute, using its playing players, lavalink cpu load, and nulled and deficit frames.
+    Players added since the last statistics were received are also counted.
+    If the statistics of a session are out of date, only the amount of players on that session is used.
+
+    !!! tip
+        To change the weights, subclass this handler, and pass them to `super().__init__()`.
+
+    Parameters
+    ----------
+    client
+        The base ongaku client.
+    player_weight
+        The weight of each playing player.
+    cpu_weight
+        The weight of the lavalink cpu load.
+    null_frame_weight
+        The weight of the nulled frames.
+    deficit_frame_weight
+        The weight of the deficit frames.
+    stale_after
+        The time in seconds, after which the statistics of a session are out of date.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_assigned",
+        "_cpu_weight",
+        "_deficit_frame_weight",
+        "_null_frame_weight",
+        "_player_weight",
+        "_stale_after",
+        "_statistics",
+    )
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        player_weight: float = 1.0,
+        cpu_weight: float = 1.0,
+        null_frame_weight: float = 1.0,
+        deficit_frame_weight: float = 1.0,
+        stale_after: float = 120.0,
+    ) -> None:
+        super().__init__(client)
+        self._player_weight = player_weight
+        self._cpu_weight = cpu_weight
+        self._null_frame_weight = null_frame_weight
+        self._deficit_frame_weight = deficit_frame_weight
+        self._stale_after = stale_after
+        self._statistics: typing.MutableMapping[
+            str, tuple[events.StatisticsEvent, float]
+        ] = {}
+        self._assigned: typing.MutableMapping[str, int] = {}
+
+        client.app.event_manager.subscribe(
+            events.StatisticsEvent, self._statistics_event
+        )
+
+    def fetch_session(self, name: str | None = None) -> Session:
+        if name is not None:
+            return super().fetch_session(name)
+
+        sessions = [
+            session
+            for session in self.sessions
+            if session.status == session_.SessionStatus.CONNECTED
+            and not session.is_draining
+        ]
+
+        if len(sessions) == 0:
+            raise errors.NoSessionsError
+
+        return min(
+            sessions,
+            key=lambda session: (session.health, self.calculate_penalty(session)),
+        )
+
+    async def delete_session(self, name: str) -> None:
+        self._statistics.pop(name, None)
+        self._assigned.pop(name, None)
+
+        await super().delete_session(name)
+
+    def add_player(self, player: Player) -> Player:
+        player = super().add_player(player)
+
+        name = player.session.name
+
+        self._assigned.update({name: self._assigned.get(name, 0) + 1})
+
+        return player
+
+    def calculate_penalty(self, session: Session) -> float:
+        """Calculate penalty.
+
+        Calculate the penalty of a session. The session with the lowest penalty will be used for new players.
+
+        Parameters
+        ----------
+        session
+            The session to calculate the penalty for.
+
+        Returns
+        -------
+        float
+            The penalty of the session.
+        """
+        statistics = self._statistics.get(session.name, None)
+
+        if statistics is None or time.monotonic() - statistics[1] > self._stale_after:
+            players = sum(1 for player in self.players if player.session is session)
+
+            return players * self._player_weight
+
+        event = statistics[0]
+
+        player_penalty = event.playing_players + self._assigned.get(session.name, 0)
+
+        cpu_penalty = 1.05 ** (100 * event.cpu.lavalink_load) * 10 - 10
+
+        null_frame_penalty = 0.0
+        deficit_frame_penalty = 0.0
+
+        if event.frame_stats is not None:
+            null_frame_penalty = (
+                1.03 ** (500 * (max(event.frame_stats.nulled, 0) / 3000)) * 300 - 300
+            ) * 2
+            deficit_frame_penalty = (
+                1.03 ** (500 * (max(event.frame_stats.deficit, 0) / 3000)) * 600 - 600
+            )
+
+        return (
+            player_penalty * self._player_weight
+            + cpu_penalty * self._cpu_weight
+            + null_frame_penalty * self._null_frame_weight
+            + deficit_frame_penalty * self._deficit_frame_weight
+        )
+
+    async def _statistics_event(self, event: events.StatisticsEvent) -> None:
+        if self._sessions.get(event.session.name, None) is not event.session:
+            return
+
+        _logger.log(
+            logger.TRACE_LEVEL,
+            f"Received statistics for session ({event.session.name})",
+        )
+
+        self._statistics.update({event.session.name: (event, time.monotonic())})
+        self._assigned.update({event.session.name: 0})
+
+
+class RegionSessionHandler(BasicSessionHandler):
+    """
+    Region Session Handler.
+
+    This session handler moves players to a session in the same voice region as their discord voice server, when they connect.
+
+    The region of a voice server is worked out from its endpoint, using the `regions` mapping. Sessions are given a region with the `region` argument of [create_session][ongaku.client.Client.create_session].
+    If no connected session is in the same region, the player stays on its current session.
+
+    Parameters
+    ----------
+    client
+        The base ongaku client.
+    regions
+        Additional voice server names, mapped to the region they are in. These override [DEFAULT_VOICE_REGIONS][ongaku.impl.handlers.DEFAULT_VOICE_REGIONS].
+    """
+
+    __slots__: typing.Sequence[str] = ("_regions",)
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        regions: typing.Mapping[str, str] | None = None,
+    ) -> None:
+        super().__init__(client)
+        self._regions: typing.Mapping[str, str] = {
+            **DEFAULT_VOICE_REGIONS,
+            **(regions or {}),
+        }
+
+    def fetch_region(self, endpoint: str) -> str | None:
+        """Fetch region.
+
+        Fetch the voice region of a discord voice server endpoint.
+
+        Parameters
+        ----------
+        endpoint
+            The voice server endpoint. For example `c-fra06-1a2b3c4d.discord.media:443`.
+
+        Returns
+        -------
+        str | None
+            The region, or `None` if it is not known.
+        """
+        match = _ENDPOINT_REGION_PATTERN.match(endpoint.lower())
+
+        if match is None:
+            return None
+
+        return self._regions.get(match.group(1), None)
+
+    def fetch_voice_session(self, player: Player, endpoint: str) -> Session:
+        region = self.fetch_region(endpoint)
+
+        if region is None or player.session.region == region:
+            return player.session
+
+        sessions = [
+            session
+            for session in self.sessions
+            if session.region == region
+            and session.health != session_.SessionHealth.UNHEALTHY
+            and not session.is_draining
+        ]
+
+        if len(sessions) == 0:
+            return player.session
+
+        _logger.log(
+            logger.TRACE_LEVEL,
+            f"Moving player in {player.guild_id} to region {region}",
+        )
+
+        return min(
+            sessions,
+            key=lambda session: sum(
+                1 for player in self.players if player.session is session
+            ),
+        )
+
+
+class ConsistentHashSessionHandler(BasicSessionHandler):
+    """
+    Consistent Hash Session Handler.
+
+    This session handler always gives a guild's player to the same session.
+
+    Sessions are placed on a hash ring many times over, and each guild uses the first connected session after its own place on the ring.
+    Adding or removing a session only moves the guilds around that session, so about `1/N` of guilds move, rather than all of them.
+    If the session a guild belongs to is not connected, the next session on the ring is used instead.
+
+    Parameters
+    ----------
+    client
+        The base ongaku client.
+    replicas
+        The amount of times each session is placed on the ring. Higher values spread guilds more evenly.
+    """
+
+    __slots__: typing.Sequence[str] = ("_replicas", "_ring", "_ring_keys")
+
+    def __init__(self, client: Client, *, replicas: int = 100) -> None:
+        if replicas <= 0:
+            raise ValueError(f"Replicas must be above 0. Value: {replicas}")
+
+        super().__init__(client)
+        self._replicas = replicas
+        self._ring: typing.Sequence[tuple[int, str]] = ()
+        self._ring_keys: typing.Sequence[int] = ()
+
+    def add_session(self, session: Session) -> Session:
+        session = super().add_session(session)
+
+        self._build_ring()
+
+        return session
+
+    async def delete_session(self, name: str) -> None:
+        try:
+            await super().delete_session(name)
+        finally:
+            self._build_ring()
+
+    def fetch_player_session(
+        self, guild: hikari.SnowflakeishOr[hikari.Guild]
+    ) -> Session:
+        if len(self._ring) == 0:
+            raise errors.NoSessionsError
+
+        index = bisect.bisect(self._ring_keys, _ring_hash(str(hikari.Snowflake(guild))))
+
+        checked: set[str] = set()
+        fallback: Session | None = None
+
+        for position in range(index, index + len(self._ring)):
+            name = self._ring[position % len(self._ring)][1]
+
+            if name in checked:
+                continue
+
+            checked.add(name)
+
+            session = self._sessions[name]
+
+            if session.is_draining:
+                continue
+
+            if session.health != session_.SessionHealth.UNHEALTHY:
+                return session
+
+            if fallback is None and session.status == session_.SessionStatus.CONNECTED:
+                fallback = session
+
+            if len(checked) == len(self._sessions):
+                break
+
+        if fallback is not None:
+            return fallback
+
+        raise errors.NoSessionsError
+
+    def _build_ring(self) -> None:
+        ring = sorted(
+            (_ring_hash(f"{name}-{replica}"), name)
+            for name in self._sessions
+            for replica in range(self._replicas)
+        )
+
+        self._ring = ring
+        self._ring_keys = [key for key, _ in ring]
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypus
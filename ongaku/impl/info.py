@@ -17,6 +17,8 @@ __all__ = ("Git", "Info", "Plugin", "Version")
 
 
 class Info(info_.Info):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         version: info_.Version,
@@ -39,6 +41,8 @@ class Info(info_.Info):
 
 
 class Version(info_.Version):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         semver: str,
@@ -57,6 +61,8 @@ class Version(info_.Version):
 
 
 class Git(info_.Git):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         branch: str,
@@ -69,6 +75,8 @@ class Git(info_.Git):
 
 
 class Plugin(info_.Plugin):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, name: str, version: str) -> None:
         self._name = name
         self._version = version
@@ -21,6 +21,8 @@ __all__ = ("Player", "State", "Voice")
 
 
 class Player(player_.Player):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         guild_id: hikari.Snowflake,
@@ -41,6 +43,8 @@ class Player(player_.Player):
 
 
 class State(player_.State):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         time: datetime.datetime,
@@ -55,6 +59,8 @@ class State(player_.State):
 
 
 class Voice(player_.Voice):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, token: str, endpoint: str, session_id: str) -> None:
         self._token = token
         self._endpoint = endpoint
@@ -15,6 +15,8 @@ __all__ = ("Playlist", "PlaylistInfo")
 
 
 class Playlist(playlist_.Playlist):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         info: playlist_.PlaylistInfo,
@@ -25,8 +27,14 @@ class Playlist(playlist_.Playlist):
         self._tracks = tracks
         self._plugin_info = plugin_info
 
+    def __reduce__(self) -> tuple[type[Playlist], tuple[typing.Any, ...]]:
+        # The plugin info may be the shared empty mapping, which can not be pickled.
+        return (Playlist, (self._info, list(self._tracks), dict(self._plugin_info)))
+
 
 class PlaylistInfo(playlist_.PlaylistInfo):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, name: str, selected_track: int) -> None:
         self._name = name
         self._selected_track = selected_track
@@ -17,6 +17,8 @@ __all__ = ("FailingAddress", "IPBlock", "RoutePlannerDetails", "RoutePlannerStat
 
 
 class RoutePlannerStatus(routeplanner_.RoutePlannerStatus):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         cls: routeplanner_.RoutePlannerType,
@@ -27,6 +29,8 @@ class RoutePlannerStatus(routeplanner_.RoutePlannerStatus):
 
 
 class RoutePlannerDetails(routeplanner_.RoutePlannerDetails):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         ip_block: routeplanner_.IPBlock,
@@ -47,12 +51,16 @@ class RoutePlannerDetails(routeplanner_.RoutePlannerDetails):
 
 
 class IPBlock(routeplanner_.IPBlock):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, type: routeplanner_.IPBlockType, size: str) -> None:
         self._type = type
         self._size = size
 
 
 class FailingAddress(routeplanner_.FailingAddress):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, address: str, timestamp: datetime.datetime, time: str) -> None:
         self._address = address
         self._timestamp = timestamp
@@ -6,12 +6,16 @@ The session implemented classes.
 
 from __future__ import annotations
 
+import typing
+
 from ongaku.abc import session as session_
 
 __all__ = ("Session",)
 
 
 class Session(session_.Session):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, resuming: bool, timeout: int) -> None:
         self._resuming = resuming
         self._timeout = timeout
@@ -14,14 +14,7 @@ __all__ = ("Cpu", "FrameStatistics", "Memory", "Statistics")
 
 
 class Statistics(statistics_.Statistics):
-    __slots__: typing.Sequence[str] = (
-        "_cpu",
-        "_frame_statistics",
-        "_memory",
-        "_players",
-        "_playing_players",
-        "_uptime",
-    )
+    __slots__: typing.Sequence[str] = ()
 
     def __init__(
         self,
@@ -71,6 +64,8 @@ class Statistics(statistics_.Statistics):
 
 
 class Memory(statistics_.Memory):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, free: int, used: int, allocated: int, reservable: int) -> None:
         self._free = free
         self._used = used
@@ -79,6 +74,8 @@ class Memory(statistics_.Memory):
 
 
 class Cpu(statistics_.Cpu):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, cores: int, system_load: float, lavalink_load: float) -> None:
         self._cores = cores
         self._system_load = system_load
@@ -86,6 +83,8 @@ class Cpu(statistics_.Cpu):
 
 
 class FrameStatistics(statistics_.FrameStatistics):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(self, sent: int, nulled: int, deficit: int) -> None:
         self._sent = sent
         self._nulled = nulled
@@ -8,15 +8,55 @@ from __future__ import annotations
 
 import typing
 
-if typing.TYPE_CHECKING:
-    import hikari
+import hikari
 
+from ongaku import errors
 from ongaku.abc import track as track_
+from ongaku.internal.types import EMPTY_MAPPING
+
+if typing.TYPE_CHECKING:
+    import datetime
+
+    from ongaku.builders import EntityBuilder
+
+__all__ = ("LazyTrack", "QueueEntry", "Track", "TrackInfo")
+
+
+def _rebuild_track(
+    encoded: str,
+    info: track_.TrackInfo,
+    plugin_info: typing.Mapping[str, typing.Any] | None,
+    user_data: typing.Mapping[str, typing.Any] | None,
+    requestor: int | None,
+) -> Track:
+    return Track(
+        encoded,
+        info,
+        plugin_info or EMPTY_MAPPING,
+        user_data or EMPTY_MAPPING,
+        hikari.Snowflake(requestor) if requestor else None,
+    )
 
-__all__ = ("Track", "TrackInfo")
+
+def _reduce_track(
+    track: track_.Track,
+) -> tuple[typing.Callable[..., Track], tuple[typing.Any, ...]]:
+    # Empty mappings are shared (and can not be pickled), so they are sent as None, and shared again when rebuilt.
+    return (
+        _rebuild_track,
+        (
+            track.encoded,
+            track.info,
+            dict(track.plugin_info) or None,
+            dict(track.user_data) or None,
+            int(track.requestor) if track.requestor else None,
+        ),
+    )
 
 
 class Track(track_.Track):
+    __slots__: typing.Sequence[str] = ("__weakref__",)
+
     def __init__(
         self,
         encoded: str,
@@ -31,8 +71,144 @@ class Track(track_.Track):
         self._user_data = user_data
         self._requestor = requestor
 
+    def __reduce__(self) -> tuple[typing.Callable[..., Track], tuple[typing.Any, ...]]:
+        return _reduce_track(self)
+
+
+class LazyTrack(track_.Track):
+    __slots__: typing.Sequence[str] = ("__weakref__", "_builder", "_payload")
+
+    def __init__(
+        self,
+        payload: typing.Mapping[str, typing.Any],
+        builder: EntityBuilder,
+    ) -> None:
+        self._encoded = payload["encoded"]
+        self._payload = payload
+        self._builder = builder
+        self._info = None
+        self._plugin_info = None
+        self._user_data = None
+        self._requestor = None
+
+    def __reduce__(self) -> tuple[typing.Callable[..., Track], tuple[typing.Any, ...]]:
+        # The builder is not sent, so the track is built, and rebuilt as a regular track.
+        return _reduce_track(self)
+
+    @property
+    def info(self) -> track_.TrackInfo:
+        """Information about the track.
+
+        Raises
+        ------
+        BuildError
+            Raised when the track information could not be built from the payload.
+        """
+        if self._info is None:
+            try:
+                self._info = self._builder.build_track_info(self._payload["info"])
+            except Exception as e:
+                raise errors.BuildError(e)
+
+            self._release()
+
+        return self._info
+
+    @property
+    def plugin_info(self) -> typing.Mapping[str, typing.Any]:
+        """Additional track info provided by plugins.
+
+        Raises
+        ------
+        BuildError
+            Raised when the plugin info could not be found in the payload.
+        """
+        if self._plugin_info is None:
+            try:
+                self._plugin_info = self._payload["pluginInfo"] or EMPTY_MAPPING
+            except Exception as e:
+                raise errors.BuildError(e)
+
+            self._release()
+
+        return self._plugin_info
+
+    @property
+    def user_data(self) -> typing.Mapping[str, typing.Any]:
+        """Additional track data.
+
+        !!! warning
+            If you store a value of any type under the name `ongaku_requestor` it will be overridden.
+
+        Raises
+        ------
+        BuildError
+            Raised when the user data could not be built from the payload.
+        """
+        if self._user_data is None:
+            return self._build_user_data()
+
+        return self._user_data
+
+    @property
+    def requestor(self) -> hikari.Snowflake | None:
+        """The person who requested this track.
+
+        Raises
+        ------
+        BuildError
+            Raised when the user data could not be built from the payload.
+        """
+        if self._user_data is None:
+            self._build_user_data()
+
+        return self._requestor
+
+    def _build_user_data(self) -> typing.Mapping[str, typing.Any]:
+        try:
+            user_data = dict(self._payload.get("userData", None) or EMPTY_MAPPING)
+
+            requestor = user_data.pop("ongaku_requestor", None)
+
+            self._requestor = hikari.Snowflake(requestor) if requestor else None
+        except Exception as e:
+            raise errors.BuildError(e)
+
+        self._user_data = user_data or EMPTY_MAPPING
+
+        self._release()
+
+        return self._user_data
+
+    def _release(self) -> None:
+        # Once everything is built, the payload is no longer needed.
+        if (
+            self._info is not None
+            and self._plugin_info is not None
+            and self._user_data is not None
+        ):
+            self._payload = EMPTY_MAPPING
+
+
+class QueueEntry(track_.QueueEntry):
+    __slots__: typing.Sequence[str] = ()
+
+    def __init__(
+        self,
+        track: track_.Track,
+        requestor: hikari.Snowflake | None,
+        entry_id: int,
+        enqueued_at: datetime.datetime,
+    ) -> None:
+        self._track = track
+        self._requestor = requestor
+        self._entry_id = entry_id
+        self._enqueued_at = enqueued_at
+
 
 class TrackInfo(track_.TrackInfo):
+    __slots__: typing.Sequence[str] = ()
+
     def __init__(
         self,
         identifier: str,
@@ -59,6 +235,24 @@ class TrackInfo(track_.TrackInfo):
         self._artwork_url = artwork_url
         self._isrc = isrc
 
+    def __reduce__(self) -> tuple[type[TrackInfo], tuple[typing.Any, ...]]:
+        return (
+            TrackInfo,
+            (
+                self._identifier,
+                self._is_seekable,
+                self._author,
+                self._length,
+                self._is_stream,
+                self._position,
+                self._title,
+                self._source_name,
+                self._uri,
+                self._artwork_url,
+                self._isrc,
+            ),
+        )
+
 
 # MIT License
 
@@ -0,0 +1,120 @@
+"""
+Rate limit.
+
+Rate limiting helpers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+import typing
+
+__all__ = ("SlidingWindowRateLimiter",)
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding window rate limiter.
+
+    Allows at most `limit` acquisitions in any `period` seconds.
+
+    Parameters
+    ----------
+    limit
+        The amount of acquisitions allowed per period.
+    period
+        The length of the window in seconds.
+    """
+
+    __slots__: typing.Sequence[str] = ("_limit", "_lock", "_period", "_timestamps")
+
+    def __init__(self, limit: int, period: float) -> None:
+        if limit <= 0:
+            raise ValueError(f"Limit must be above 0. Value: {limit}")
+
+        self._limit = limit
+        self._period = period
+        self._timestamps: collections.deque[float] = collections.deque()
+        self._lock = asyncio.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The amount of acquisitions allowed per period."""
+        return self._limit
+
+    @property
+    def period(self) -> float:
+        """The length of the window in seconds."""
+        return self._period
+
+    @property
+    def remaining(self) -> int:
+        """The amount of acquisitions that can be made right now, without waiting."""
+        self._expire(time.monotonic())
+
+        return self._limit - len(self._timestamps)
+
+    async def acquire(self, amount: int = 1) -> None:
+        """
+        Acquire.
+
+        Wait until `amount` acquisitions can be made without going over the limit, and then make them.
+
+        Parameters
+        ----------
+        amount
+            The amount of acquisitions to make.
+
+        Raises
+        ------
+        ValueError
+            Raised when the amount is above the limit.
+        """
+        if amount > self._limit:
+            raise ValueError(
+                f"Amount must not be above the limit of {self._limit}. Value: {amount}"
+            )
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                self._expire(now)
+
+                overflow = len(self._timestamps) + amount - self._limit
+
+                if overflow <= 0:
+                    break
+
+                await asyncio.sleep(self._timestamps[overflow - 1] + self._period - now)
+
+            self._timestamps.extend(now for _ in range(amount))
+
+    def _expire(self, now: float) -> None:
+        while self._timestamps and now - self._timestamps[0] >= self._period:
+            self._timestamps.popleft()
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -0,0 +1,203 @@
+"""
+Schema.
+
+The declarative field schemas, used to generate the entity builders.
+"""
+
+from __future__ import annotations
+
+import inspect
+import typing
+
+if typing.TYPE_CHECKING:
+    from ongaku.builders import EntityBuilder
+
+__all__ = ("Field", "SchemaBuilderT", "compile_schema")
+
+SchemaBuilderT: typing.TypeAlias = typing.Callable[
+    ["EntityBuilder", typing.Mapping[str, typing.Any]], typing.Any
+]
+"""Schema Builder Type.
+
+A generated builder, that takes the entity builder (for nested fields) and the payload.
+"""
+
+
+class Field:
+    """
+    Field.
+
+    A single field of a lavalink entity.
+
+    Parameters
+    ----------
+    name
+        The name of the parameter, on the implemented class.
+    key
+        The key of the field, in the payload.
+    optional
+        Whether the field can be missing from the payload. Optional fields with a converter or nested builder are only converted if they are truthy, otherwise the default is used.
+    converter
+        The converter to call on the value.
+    nested
+        The name of the [EntityBuilder][ongaku.builders.EntityBuilder] method, that builds the value.
+    sequence
+        Whether the value is a sequence of payloads, each built with the nested builder.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_converter",
+        "_key",
+        "_name",
+        "_nested",
+        "_optional",
+        "_sequence",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        key: str,
+        *,
+        optional: bool = False,
+        converter: typing.Callable[[typing.Any], typing.Any] | None = None,
+        nested: str | None = None,
+        sequence: bool = False,
+    ) -> None:
+        self._name = name
+        self._key = key
+        self._optional = optional
+        self._converter = converter
+        self._nested = nested
+        self._sequence = sequence
+
+    @property
+    def name(self) -> str:
+        """The name of the parameter, on the implemented class."""
+        return self._name
+
+    @property
+    def key(self) -> str:
+        """The key of the field, in the payload."""
+        return self._key
+
+    @property
+    def optional(self) -> bool:
+        """Whether the field can be missing from the payload."""
+        return self._optional
+
+    @property
+    def converter(self) -> typing.Callable[[typing.Any], typing.Any] | None:
+        """The converter to call on the value."""
+        return self._converter
+
+    @property
+    def nested(self) -> str | None:
+        """The name of the entity builder method, that builds the value."""
+        return self._nested
+
+    @property
+    def sequence(self) -> bool:
+        """Whether the value is a sequence of payloads."""
+        return self._sequence
+
+
+def _field_source(
+    field: Field, index: int, namespace: typing.MutableMapping[str, typing.Any]
+) -> str:
+    value = (
+        f"data.get({field.key!r}, None)" if field.optional else f"data[{field.key!r}]"
+    )
+
+    if field.converter is None and field.nested is None:
+        return value
+
+    if field.nested is not None:
+        call = f"builder.{field.nested}"
+    else:
+        namespace[f"_converter_{index}"] = field.converter
+        call = f"_converter_{index}"
+
+    # Optional values are bound once, so they are only looked up a single time.
+    source = "value" if field.optional else value
+
+    if field.sequence:
+        converted = f"[{call}(item) for item in {source}]"
+    else:
+        converted = f"{call}({source})"
+
+    if field.optional:
+        default = "[]" if field.sequence else "None"
+        return f"({converted} if (value := {value}) else {default})"
+
+    return converted
+
+
+def compile_schema(
+    cls: typing.Callable[..., typing.Any],
+    fields: typing.Sequence[Field],
+) -> SchemaBuilderT:
+    """
+    Compile schema.
+
+    Generates a builder for the class, from its fields. This is done once, when the schema is declared, so the builder only indexes the payload, and calls the class.
+
+    Parameters
+    ----------
+    cls
+        The implemented class to build.
+    fields
+        The fields of the class.
+
+    Raises
+    ------
+    TypeError
+        Raised when the fields do not match the parameters of the class.
+    """
+    parameters = inspect.signature(cls).parameters
+
+    names = [field.name for field in fields]
+
+    if set(names) != set(parameters) or len(names) != len(set(names)):
+        raise TypeError(
+            f"The fields {names} do not match the parameters of {cls.__name__}: {list(parameters)}"
+        )
+
+    namespace: dict[str, typing.Any] = {"_entity": cls}
+
+    arguments = ", ".join(
+        f"{field.name}={_field_source(field, index, namespace)}"
+        for index, field in enumerate(fields)
+    )
+
+    name = f"build_{cls.__name__}"
+
+    exec(
+        f"def {name}(builder, data):\n    return _entity({arguments})\n",
+        namespace,
+    )
+
+    return namespace[name]
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
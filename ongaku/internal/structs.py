@@ -0,0 +1,119 @@
+"""
+Structs.
+
+The typed structs used to decode lavalink payloads, when msgspec is installed.
+"""
+
+from __future__ import annotations
+
+import typing
+
+__all__ = (
+    "STRUCTS_AVAILABLE",
+    "LoadResultStruct",
+    "PlaylistInfoStruct",
+    "PlaylistStruct",
+    "TrackInfoStruct",
+    "TrackStruct",
+    "decode_load_result",
+    "decode_playlist",
+    "decode_track",
+    "decode_tracks",
+)
+
+try:
+    import msgspec
+
+    class TrackInfoStruct(msgspec.Struct, rename="camel"):
+        """The struct for a [TrackInfo][ongaku.abc.track.TrackInfo] payload."""
+
+        identifier: str
+        is_seekable: bool
+        author: str
+        length: int
+        is_stream: bool
+        position: int
+        title: str
+        source_name: str
+        uri: str | None = None
+        artwork_url: str | None = None
+        isrc: str | None = None
+
+    class TrackStruct(msgspec.Struct, rename="camel"):
+        """The struct for a [Track][ongaku.abc.track.Track] payload."""
+
+        encoded: str
+        info: TrackInfoStruct
+        plugin_info: dict[str, typing.Any] = {}
+        user_data: dict[str, typing.Any] = {}
+
+    class PlaylistInfoStruct(msgspec.Struct, rename="camel"):
+        """The struct for a [PlaylistInfo][ongaku.abc.playlist.PlaylistInfo] payload."""
+
+        name: str
+        selected_track: int
+
+    class PlaylistStruct(msgspec.Struct, rename="camel"):
+        """The struct for a [Playlist][ongaku.abc.playlist.Playlist] payload."""
+
+        info: PlaylistInfoStruct
+        tracks: list[TrackStruct]
+        plugin_info: dict[str, typing.Any] = {}
+
+    class LoadResultStruct(msgspec.Struct, rename="camel"):
+        """The struct for a track loading result. The data is decoded once the load type is known."""
+
+        load_type: str
+        data: msgspec.Raw = msgspec.Raw()
+
+    _load_result_decoder = msgspec.json.Decoder(LoadResultStruct)
+    _track_decoder = msgspec.json.Decoder(TrackStruct)
+    _tracks_decoder = msgspec.json.Decoder(list[TrackStruct])
+    _playlist_decoder = msgspec.json.Decoder(PlaylistStruct)
+
+    def decode_load_result(payload: str | bytes) -> LoadResultStruct:
+        """Decode a track loading result."""
+        return _load_result_decoder.decode(payload)
+
+    def decode_track(payload: str | bytes) -> TrackStruct:
+        """Decode a track."""
+        return _track_decoder.decode(payload)
+
+    def decode_tracks(payload: str | bytes) -> list[TrackStruct]:
+        """Decode a sequence of tracks."""
+        return _tracks_decoder.decode(payload)
+
+    def decode_playlist(payload: str | bytes) -> PlaylistStruct:
+        """Decode a playlist."""
+        return _playlist_decoder.decode(payload)
+
+    _available = True
+
+except ModuleNotFoundError:
+    _available = False
+
+STRUCTS_AVAILABLE: typing.Final[bool] = _available
+"""Whether msgspec is installed, and the structs can be used."""
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -7,10 +7,17 @@ All types for ongaku.
 from __future__ import annotations
 
 import typing
+from types import MappingProxyType
 
 import hikari
 
-__all__ = ("PayloadMappingT", "PayloadSequenceT", "RequestT", "RequestorT")
+__all__ = (
+    "EMPTY_MAPPING",
+    "PayloadMappingT",
+    "PayloadSequenceT",
+    "RequestT",
+    "RequestorT",
+)
 
 # Type Variables.
 
@@ -51,6 +58,14 @@ PayloadSequenceT: typing.TypeAlias = typing.Sequence[typing.Any] | str | bytes
 Supports string, bytes, or a sequence.
 """
 
+# Constants
+
+EMPTY_MAPPING: typing.Final[typing.Mapping[str, typing.Any]] = MappingProxyType({})
+"""Empty Mapping.
+
+A read-only empty mapping, shared by every track and playlist without plugin info or user data.
+"""
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypus
@@ -0,0 +1,305 @@
+"""
+Voice.
+
+Voice event helpers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import hikari
+
+from ongaku.internal.ratelimit import SlidingWindowRateLimiter
+
+__all__ = ("VoiceEventCollector", "VoiceStateScheduler")
+
+
+class _PendingVoice:
+    __slots__: typing.Sequence[str] = ("future", "server_event", "state_event")
+
+    def __init__(
+        self,
+        future: asyncio.Future[
+            tuple[hikari.VoiceStateUpdateEvent, hikari.VoiceServerUpdateEvent]
+        ],
+    ) -> None:
+        self.future = future
+        self.state_event: hikari.VoiceStateUpdateEvent | None = None
+        self.server_event: hikari.VoiceServerUpdateEvent | None = None
+
+    def resolve(self) -> None:
+        if self.future.done():
+            return
+
+        if self.state_event is not None and self.server_event is not None:
+            self.future.set_result((self.state_event, self.server_event))
+
+
+class VoiceEventCollector:
+    """
+    Voice event collector.
+
+    Collects the voice state and voice server update events, and hands them to whoever is expecting them, by guild.
+
+    Each event is matched with a single dictionary lookup, so any amount of guilds can wait for their events at the same time.
+
+    Parameters
+    ----------
+    app
+        The application to collect the voice events from.
+    """
+
+    __slots__: typing.Sequence[str] = ("_servers", "_states")
+
+    def __init__(self, app: hikari.GatewayBotAware) -> None:
+        self._states: typing.MutableMapping[
+            tuple[hikari.Snowflake, hikari.Snowflake], _PendingVoice
+        ] = {}
+        self._servers: typing.MutableMapping[hikari.Snowflake, _PendingVoice] = {}
+
+        app.event_manager.subscribe(hikari.VoiceStateUpdateEvent, self._state_event)
+        app.event_manager.subscribe(hikari.VoiceServerUpdateEvent, self._server_event)
+
+    def expect(
+        self,
+        guild: hikari.Snowflake,
+        user: hikari.Snowflake,
+    ) -> asyncio.Future[
+        tuple[hikari.VoiceStateUpdateEvent, hikari.VoiceServerUpdateEvent]
+    ]:
+        """
+        Expect.
+
+        Expect a voice state update for the user, and a voice server update, in the guild.
+
+        This should be called before the voice state is updated, so that no events are missed. If the guild is already expecting events, the older future is cancelled.
+
+        Parameters
+        ----------
+        guild
+            The guild the events are for.
+        user
+            The user the voice state update is for.
+
+        Returns
+        -------
+        asyncio.Future[tuple[hikari.VoiceStateUpdateEvent, hikari.VoiceServerUpdateEvent]]
+            The future, which is resolved once both events are received. Cancelling it stops expecting the events.
+        """
+        old_pending = self._servers.get(guild, None)
+
+        if old_pending is not None:
+            old_pending.future.cancel()
+
+        pending = _PendingVoice(asyncio.get_running_loop().create_future())
+
+        self._states[(guild, user)] = pending
+        self._servers[guild] = pending
+
+        def remove(
+            _: asyncio.Future[
+                tuple[hikari.VoiceStateUpdateEvent, hikari.VoiceServerUpdateEvent]
+            ],
+        ) -> None:
+            if self._states.get((guild, user), None) is pending:
+                del self._states[(guild, user)]
+
+            if self._servers.get(guild, None) is pending:
+                del self._servers[guild]
+
+        pending.future.add_done_callback(remove)
+
+        return pending.future
+
+    async def _state_event(self, event: hikari.VoiceStateUpdateEvent) -> None:
+        pending = self._states.get((event.guild_id, event.state.user_id), None)
+
+        if pending is None:
+            return
+
+        pending.state_event = event
+        pending.resolve()
+
+    async def _server_event(self, event: hikari.VoiceServerUpdateEvent) -> None:
+        pending = self._servers.get(event.guild_id, None)
+
+        if pending is None:
+            return
+
+        pending.server_event = event
+        pending.resolve()
+
+
+class _VoiceUpdate:
+    __slots__: typing.Sequence[str] = ("channel", "future", "self_deaf", "self_mute")
+
+    def __init__(
+        self,
+        future: asyncio.Future[None],
+        channel: hikari.Snowflake | None,
+        self_mute: hikari.UndefinedOr[bool],
+        self_deaf: hikari.UndefinedOr[bool],
+    ) -> None:
+        self.future = future
+        self.channel = channel
+        self.self_mute = self_mute
+        self.self_deaf = self_deaf
+
+
+class _ShardQueue:
+    __slots__: typing.Sequence[str] = ("high", "limiter", "low", "task")
+
+    def __init__(self, limiter: SlidingWindowRateLimiter) -> None:
+        self.high: typing.MutableMapping[hikari.Snowflake, _VoiceUpdate] = {}
+        self.low: typing.MutableMapping[hikari.Snowflake, _VoiceUpdate] = {}
+        self.limiter = limiter
+        self.task: asyncio.Task[None] | None = None
+
+
+class VoiceStateScheduler:
+    """
+    Voice state scheduler.
+
+    Sends voice state updates to the gateway, with a queue and rate limit for each shard.
+
+    If a guild already has an update waiting to be sent, it is replaced by the newer update, and only the newer update is sent. Updates with priority, such as a user joining a channel, are sent before updates without priority.
+
+    Parameters
+    ----------
+    app
+        The application to send the voice state updates with.
+    limit
+        The amount of voice state updates sent per shard, per period. Discord allows 120 gateway events per minute, so the default leaves room for other events.
+    period
+        The length of the period in seconds.
+    """
+
+    __slots__: typing.Sequence[str] = ("_app", "_limit", "_period", "_shards")
+
+    def __init__(
+        self,
+        app: hikari.GatewayBotAware,
+        *,
+        limit: int = 100,
+        period: float = 60.0,
+    ) -> None:
+        self._app = app
+        self._limit = limit
+        self._period = period
+        self._shards: typing.MutableMapping[int, _ShardQueue] = {}
+
+    async def update(
+        self,
+        guild: hikari.Snowflake,
+        channel: hikari.Snowflake | None,
+        *,
+        self_mute: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+        self_deaf: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+        priority: bool = True,
+    ) -> None:
+        """
+        Update.
+
+        Queue a voice state update, and wait for it to be sent.
+
+        Parameters
+        ----------
+        guild
+            The guild to update the voice state in.
+        channel
+            The channel to join, or `None` to leave the current channel.
+        self_mute
+            Whether the bot should be muted.
+        self_deaf
+            Whether the bot should be deafened.
+        priority
+            Whether the update should be sent before updates without priority.
+
+        Raises
+        ------
+        Exception
+            Any error raised while sending the update.
+        """
+        shard_id = hikari.snowflakes.calculate_shard_id(self._app, guild)
+
+        shard = self._shards.get(shard_id, None)
+
+        if shard is None:
+            shard = _ShardQueue(SlidingWindowRateLimiter(self._limit, self._period))
+            self._shards[shard_id] = shard
+
+        pending = shard.high.get(guild, None) or shard.low.get(guild, None)
+
+        if pending is not None:
+            pending.channel = channel
+            pending.self_mute = self_mute
+            pending.self_deaf = self_deaf
+
+            if priority and guild in shard.low:
+                shard.high[guild] = shard.low.pop(guild)
+        else:
+            pending = _VoiceUpdate(
+                asyncio.get_running_loop().create_future(),
+                channel,
+                self_mute,
+                self_deaf,
+            )
+
+            if priority:
+                shard.high[guild] = pending
+            else:
+                shard.low[guild] = pending
+
+        if shard.task is None or shard.task.done():
+            shard.task = asyncio.create_task(self._send(shard))
+
+        await asyncio.shield(pending.future)
+
+    async def _send(self, shard: _ShardQueue) -> None:
+        while shard.high or shard.low:
+            await shard.limiter.acquire()
+
+            queue = shard.high if shard.high else shard.low
+
+            guild = next(iter(queue))
+            pending = queue.pop(guild)
+
+            options: dict[str, bool] = {}
+
+            if pending.self_mute is not hikari.UNDEFINED:
+                options["self_mute"] = pending.self_mute
+
+            if pending.self_deaf is not hikari.UNDEFINED:
+                options["self_deaf"] = pending.self_deaf
+
+            try:
+                await self._app.update_voice_state(guild, pending.channel, **options)
+            except Exception as e:
+                pending.future.set_exception(e)
+            else:
+                pending.future.set_result(None)
+
+
+# MIT License
+
+# Copyright (c) 2023-present MPlatypus
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
@@ -6,11 +6,17 @@ The player function, for all player related things.
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import datetime
+import functools
+import hashlib
+import itertools
 import random
+import time
 import typing
 import typing as t
 from asyncio import TimeoutError
-from asyncio import gather
 
 import hikari
 
@@ -21,7 +27,9 @@ from ongaku.abc import track as track_
 from ongaku.abc.events import TrackEndReasonType
 from ongaku.events import PlayerUpdateEvent
 from ongaku.events import TrackEndEvent
+from ongaku.events import TrackStartEvent
 from ongaku.impl.player import Voice
+from ongaku.impl.track import QueueEntry
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
 
@@ -35,6 +43,65 @@ _logger = logger.getChild("player")
 
 __all__ = ("Player",)
 
+_P = typing.ParamSpec("_P")
+_T = typing.TypeVar("_T")
+
+_entry_ids = itertools.count(1)
+
+
+class _CommandLock:
+    """Command lock.
+
+    A lock that is re-entrant for the task that currently holds it.
+
+    Commands are ran in the order they acquired the lock, and a command may call other commands without deadlocking.
+    """
+
+    __slots__: typing.Sequence[str] = ("_depth", "_lock", "_owner")
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task[typing.Any] | None = None
+        self._depth = 0
+
+    def locked(self) -> bool:
+        """Whether a command currently holds the lock."""
+        return self._lock.locked()
+
+    async def __aenter__(self) -> None:
+        task = asyncio.current_task()
+
+        if task is not None and self._owner is task:
+            self._depth += 1
+            return
+
+        await self._lock.acquire()
+
+        self._owner = task
+        self._depth = 1
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        self._depth -= 1
+
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+
+def _command(
+    func: typing.Callable[typing.Concatenate[Player, _P], typing.Awaitable[_T]],
+) -> typing.Callable[
+    typing.Concatenate[Player, _P], typing.Coroutine[typing.Any, typing.Any, _T]
+]:
+    """Run the decorated player method through the players command pipeline."""
+
+    @functools.wraps(func)
+    async def wrapper(self: Player, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        async with self._command_lock:
+            return await func(self, *args, **kwargs)
+
+    return wrapper
+
 
 class Player:
     """
@@ -42,6 +109,14 @@ class Player:
 
     The class that allows the player, to play songs, and more.
 
+    !!! note
+        All methods that update lavalink are ran one at a time, in the order they were called.
+        Properties can be read at any time.
+
+    !!! note
+        [add][ongaku.player.Player.add], [remove][ongaku.player.Player.remove], [shuffle][ongaku.player.Player.shuffle] and [set_shuffle][ongaku.player.Player.set_shuffle] are synchronous, so they change the queue straight away, even while another method is waiting on lavalink.
+        Every method changes the queue before it waits on lavalink, so the queue is never left half changed. They must not be called from another thread.
+
     Parameters
     ----------
     session
@@ -53,6 +128,7 @@ class Player:
     __slots__: typing.Sequence[str] = (
         "_autoplay",
         "_channel_id",
+        "_command_lock",
         "_connected",
         "_filters",
         "_guild_id",
@@ -60,10 +136,17 @@ class Player:
         "_is_paused",
         "_loop",
         "_position",
+        "_prefetch",
         "_queue",
         "_session",
         "_session_id",
+        "_shuffle_keys",
+        "_shuffle_queue",
+        "_shuffle_seed",
         "_state",
+        "_state_received_at",
+        "_track_end_time",
+        "_transition_gap",
         "_voice",
         "_volume",
     )
@@ -80,7 +163,8 @@ class Player:
         self._is_paused = True
         self._voice: player_.Voice | None = None
         self._state: player_.State | None = None
-        self._queue: typing.MutableSequence[track_.Track] = []
+        self._state_received_at: float | None = None
+        self._queue: typing.MutableSequence[track_.QueueEntry] = []
         self._filters: Filters | None = None
         self._connected: bool = False
         self._session_id: str | None = None
@@ -88,8 +172,16 @@ class Player:
         self._autoplay: bool = True
         self._position: int = 0
         self._loop = False
+        self._prefetch = False
+        self._track_end_time: float | None = None
+        self._transition_gap: float | None = None
+        self._shuffle_seed: int | None = None
+        self._shuffle_queue: list[track_.QueueEntry] | None = None
+        self._shuffle_keys: dict[int, bytes] = {}
+        self._command_lock = _CommandLock()
 
         self.app.event_manager.subscribe(TrackEndEvent, self._track_end_event)
+        self.app.event_manager.subscribe(TrackStartEvent, self._track_start_event)
         self.app.event_manager.subscribe(PlayerUpdateEvent, self._player_update_event)
 
     @property
@@ -128,8 +220,23 @@ class Player:
         """Position.
 
         The position of the track in milliseconds.
+
+        This is calculated locally from the last known [state][ongaku.player.Player.state], the time since it was received, whether the player is paused, and the timescale filter, so it can be read as often as needed without any requests to lavalink.
         """
-        return self._position
+        if self._state is None or self._state_received_at is None:
+            return self._position
+
+        position = float(self._state.position)
+
+        if not self.is_paused and self.connected and len(self._queue) > 0:
+            elapsed = (time.monotonic() - self._state_received_at) * 1000
+
+            position += elapsed * self._playback_speed()
+
+        if len(self._queue) > 0 and not self._queue[0].info.is_stream:
+            position = min(position, self._queue[0].info.length)
+
+        return int(position)
 
     @property
     def volume(self) -> int:
@@ -157,6 +264,24 @@ class Player:
         """Whether the current track will play again."""
         return self._loop
 
+    @property
+    def prefetch(self) -> bool:
+        """Prefetch.
+
+        Whether the next track in the queue is checked, and resolved again if needed, while the current track is playing.
+        """
+        return self._prefetch
+
+    @property
+    def transition_gap(self) -> float | None:
+        """Transition gap.
+
+        The time in milliseconds, between the last track ending, and the next track starting when autoplaying.
+
+        `None` if no track has been autoplayed yet.
+        """
+        return self._transition_gap
+
     @property
     def connected(self) -> bool:
         """Connected.
@@ -166,9 +291,25 @@ class Player:
         return self._connected
 
     @property
-    def queue(self) -> t.Sequence[track_.Track]:
-        """The current queue of tracks."""
-        return self._queue
+    def shuffled(self) -> bool:
+        """Whether shuffle mode is enabled."""
+        return self._shuffle_seed is not None
+
+    @property
+    def shuffle_seed(self) -> int | None:
+        """The seed of the current shuffle mode.
+
+        `None` if shuffle mode is disabled.
+        """
+        return self._shuffle_seed
+
+    @property
+    def queue(self) -> t.Sequence[track_.QueueEntry]:
+        """The current queue of tracks.
+
+        If shuffle mode is enabled, this is the shuffled order.
+        """
+        return self._ordered_queue()
 
     @property
     def voice(self) -> player_.Voice | None:
@@ -185,6 +326,7 @@ class Player:
         """Filters for the player."""
         return self._filters
 
+    @_command
     async def connect(
         self,
         channel: hikari.SnowflakeishOr[hikari.GuildVoiceChannel],
@@ -235,14 +377,24 @@ class Player:
 
         self._channel_id = hikari.Snowflake(channel)
 
+        bot = self.app.get_me()
+
+        if bot is None:
+            raise errors.PlayerConnectError(
+                "The bot user is not known yet, so the voice events cannot be received."
+            )
+
+        voice_events = self.session.client._voice_events.expect(self.guild_id, bot.id)
+
         try:
-            await self.app.update_voice_state(
+            await self.session.client._voice_scheduler.update(
                 self.guild_id,
                 self._channel_id,
                 self_mute=mute,
                 self_deaf=deaf,
             )
         except Exception as e:
+            voice_events.cancel()
             raise errors.PlayerConnectError(str(e))
 
         _logger.log(
@@ -251,16 +403,7 @@ class Player:
         )
 
         try:
-            state_event, server_event = await gather(
-                self.app.event_manager.wait_for(
-                    hikari.VoiceStateUpdateEvent,
-                    timeout=5,
-                ),
-                self.app.event_manager.wait_for(
-                    hikari.VoiceServerUpdateEvent,
-                    timeout=5,
-                ),
-            )
+            state_event, server_event = await asyncio.wait_for(voice_events, timeout=5)
         except TimeoutError:
             raise errors.PlayerConnectError(
                 f"Could not connect to voice channel {self.channel_id} in {self.guild_id} due to events not being received.",
@@ -284,14 +427,21 @@ class Player:
 
         self._voice = new_voice
 
-        player = await self.session.client.rest.update_player(
-            session,
-            self.guild_id,
-            voice=new_voice,
-            no_replace=False,
-            session=self.session,
+        voice_session = self.session.client.session_handler.fetch_voice_session(
+            self, server_event.raw_endpoint
         )
 
+        if voice_session is not self.session:
+            player = await self._move_session(voice_session, new_voice)
+        else:
+            player = await self.session.client.rest.update_player(
+                session,
+                self.guild_id,
+                voice=new_voice,
+                no_replace=False,
+                session=self.session,
+            )
+
         self._is_alive = True
 
         _logger.log(
@@ -301,6 +451,7 @@ class Player:
 
         self._update(player)
 
+    @_command
     async def disconnect(self) -> None:
         """
         Disconnect.
@@ -353,13 +504,17 @@ class Player:
             f"Updating voice state for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
-        await self.app.update_voice_state(self.guild_id, None)
+        # Leaving a channel is not urgent, so it is sent after any pending connects.
+        await self.session.client._voice_scheduler.update(
+            self.guild_id, None, priority=False
+        )
 
         _logger.log(
             TRACE_LEVEL,
             f"Successfully updated voice state for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
+    @_command
     async def play(
         self,
         track: track_.Track | None = None,
@@ -378,7 +533,7 @@ class Player:
         Parameters
         ----------
         track
-            The track you wish to play. If none, pulls from the queue.
+            The track you wish to play. If none, pulls from the queue. The track is added to the front of the queue as a [QueueEntry][ongaku.abc.track.QueueEntry].
         requestor
             The member who requested the track.
 
@@ -406,10 +561,16 @@ class Player:
             raise errors.PlayerQueueError("Queue is empty.")
 
         if track:
-            if requestor:
-                track._requestor = hikari.Snowflake(requestor)
+            entry = self._create_entry(
+                track,
+                hikari.Snowflake(requestor) if requestor else None,
+                datetime.datetime.now(datetime.timezone.utc),
+            )
+
+            self._queue.insert(0, entry)
 
-            self._queue.insert(0, track)
+            if self._shuffle_queue is not None:
+                self._shuffle_queue.insert(0, entry)
 
         player = await self.session.client.rest.update_player(
             session,
@@ -437,6 +598,9 @@ class Player:
             This will not automatically start playing the songs.
             please call `.play()` after, with no track, if the player is not already playing.
 
+        !!! note
+            Each track is added as a [QueueEntry][ongaku.abc.track.QueueEntry]. The tracks passed in are never modified, so the same track can be added to many players.
+
         Example
         -------
         ```py
@@ -450,34 +614,38 @@ class Player:
         requestor
             The user/member who requested the song.
         """
-        new_requestor = None
-
-        if requestor:
-            new_requestor = hikari.Snowflake(requestor)
+        new_requestor = hikari.Snowflake(requestor) if requestor else None
 
-        track_count = 0
+        enqueued_at = datetime.datetime.now(datetime.timezone.utc)
 
         if isinstance(tracks, track_.Track):
-            if new_requestor:
-                tracks._requestor = new_requestor
-            self._queue.append(tracks)
-            track_count = 1
-            return
-
-        if isinstance(tracks, playlist_.Playlist):
+            tracks = [tracks]
+        elif isinstance(tracks, playlist_.Playlist):
             tracks = tracks.tracks
 
+        start = len(self._queue)
+
         for track in tracks:
-            if new_requestor:
-                track._requestor = new_requestor
-            self._queue.append(track)
-            track_count += 1
+            self._queue.append(self._create_entry(track, new_requestor, enqueued_at))
+
+        track_count = len(self._queue) - start
+
+        # The shuffled queue is already sorted, so the new entries are inserted into it, instead of sorting it again.
+        if self._shuffle_queue is not None:
+            for entry in self._queue[start:]:
+                bisect.insort(
+                    self._shuffle_queue,
+                    entry,
+                    lo=1 if self._shuffle_queue else 0,
+                    key=self._shuffle_key,
+                )
 
         _logger.log(
             TRACE_LEVEL,
             f"Successfully added {track_count} track(s) to {self.guild_id}",
         )
 
+    @_command
     async def pause(self, value: bool | None = None) -> None:
         """
         Pause the player.
@@ -532,6 +700,7 @@ class Player:
 
         self._update(player)
 
+    @_command
     async def stop(self) -> None:
         """
         Stop current track.
@@ -576,7 +745,7 @@ class Player:
 
         self._update(player)
 
-    def shuffle(self) -> None:
+    def shuffle(self, seed: int | None = None) -> None:
         """Shuffle.
 
         Shuffle the current queue.
@@ -584,6 +753,14 @@ class Player:
         !!! note
             This will not touch the first track.
 
+        !!! tip
+            To shuffle the queue in a way that can be undone, see [set_shuffle][ongaku.player.Player.set_shuffle].
+
+        Parameters
+        ----------
+        seed
+            The seed to shuffle the queue with. If left empty, a random one will be used.
+
         Raises
         ------
         PlayerQueueError
@@ -594,21 +771,68 @@ class Player:
                 "Queue must have more than 2 tracks to shuffle.",
             )
 
-        new_queue = list(self.queue)
+        new_queue = list(self._queue)
 
         first_track = new_queue.pop(0)
 
-        random.shuffle(new_queue)
+        random.Random(seed).shuffle(new_queue)
 
         new_queue.insert(0, first_track)
 
         self._queue = new_queue
+        self._shuffle_queue = None
 
         _logger.log(
             TRACE_LEVEL,
             f"Successfully shuffled queue in guild {self.guild_id}",
         )
 
+    def set_shuffle(
+        self, enable: bool | None = None, *, seed: int | None = None
+    ) -> bool:
+        """
+        Set shuffle.
+
+        Whether to enable or disable shuffle mode.
+
+        While enabled, the [queue][ongaku.player.Player.queue] is played in a shuffled order, decided by the seed. The original order is kept, and is restored once shuffle mode is disabled.
+
+        !!! note
+            This will not touch the first track.
+
+        Example
+        -------
+        ```py
+        player.set_shuffle()
+        ```
+
+        Parameters
+        ----------
+        enable
+            Whether or not to enable shuffle mode. If left empty, it will toggle the current status.
+        seed
+            The seed to shuffle with. The same seed will always shuffle the queue into the same order. If left empty, a random one will be used.
+        """
+        if enable is None:
+            enable = not self.shuffled
+
+        self._shuffle_queue = None
+        self._shuffle_keys = {}
+
+        if not enable:
+            self._shuffle_seed = None
+            return False
+
+        self._shuffle_seed = random.getrandbits(64) if seed is None else seed
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Successfully enabled shuffle mode with seed {self._shuffle_seed} in guild {self.guild_id}",
+        )
+
+        return True
+
+    @_command
     async def skip(self, amount: int = 1) -> None:
         """
         Skip songs.
@@ -652,7 +876,7 @@ class Player:
         for _ in range(amount):
             if len(self._queue) == 0:
                 break
-            self._queue.pop(0)
+            self._pop_track(0)
             removed_tracks += 1
 
         _logger.log(
@@ -703,7 +927,7 @@ class Player:
         Parameters
         ----------
         value
-            Remove a selected track. If [Track][ongaku.abc.track.Track], then it will remove the first occurrence of that track. If an integer, it will remove the track at that position.
+            Remove a selected track. If a [QueueEntry][ongaku.abc.track.QueueEntry], then it will remove that entry. If any other [Track][ongaku.abc.track.Track], then it will remove the first entry holding that track, or playing the same audio, regardless of who requested it. If an integer, it will remove the track at that position.
 
         Raises
         ------
@@ -713,9 +937,13 @@ class Player:
         if len(self.queue) == 0:
             raise errors.PlayerQueueError("Queue is empty.")
 
+        queue = self._ordered_queue()
+
         try:
             index = (
-                self._queue.index(value) if isinstance(value, track_.Track) else value
+                self._find_entry(queue, value)
+                if isinstance(value, track_.Track)
+                else value
             )
         except ValueError:
             if isinstance(value, track_.Track):
@@ -727,7 +955,7 @@ class Player:
             )
 
         try:
-            self._queue.pop(index)
+            self._pop_track(index)
         except IndexError:
             if isinstance(value, track_.Track):
                 raise errors.PlayerQueueError(
@@ -739,6 +967,7 @@ class Player:
 
         _logger.log(TRACE_LEVEL, f"Successfully removed track in {self.guild_id}")
 
+    @_command
     async def clear(self) -> None:
         """
         Clear the queue.
@@ -765,6 +994,8 @@ class Player:
             Raised when a construction of a ABC class fails.
         """
         self._queue.clear()
+        self._shuffle_queue = None
+        self._shuffle_keys = {}
 
         session = self.session._get_session_id()
 
@@ -805,6 +1036,7 @@ class Player:
 
         return self._autoplay
 
+    @_command
     async def set_volume(self, volume: int = 100) -> None:
         """
         Set the volume.
@@ -863,6 +1095,7 @@ class Player:
             f"Successfully set volume to {volume} in {self.guild_id}",
         )
 
+    @_command
     async def set_position(self, value: int) -> None:
         """
         Set the position.
@@ -925,6 +1158,7 @@ class Player:
             f"Successfully set position ({value}) to track in {self.guild_id}",
         )
 
+    @_command
     async def set_filters(self, filters: Filters | None = None) -> None:
         """Set Filters.
 
@@ -976,11 +1210,43 @@ class Player:
 
         return self._loop
 
+    def set_prefetch(self, enable: bool | None = None) -> bool:
+        """
+        Set prefetch.
+
+        Whether to enable or disable prefetching of the next track.
+
+        While enabled, once a track starts, the next track in the queue is decoded by lavalink. If lavalink rejects its encoded data, it is loaded again from its uri, so autoplay does not fail on it once the current track ends.
+
+        !!! note
+            Decoding only reads the encoded data, and does not contact the source of the track. So only malformed encoded data is caught, and a track whose source link has expired still decodes, and fails when it is played.
+
+        Example
+        -------
+        ```py
+        player.set_prefetch()
+        ```
+
+        Parameters
+        ----------
+        enable
+            Whether or not to enable prefetching. If left empty, it will toggle the current status.
+        """
+        if enable is None:
+            enable = not self._prefetch
+
+        self._prefetch = enable
+
+        return self._prefetch
+
+    @_command
     async def transfer(self, session: Session) -> Player:
         """Transfer.
 
         Transfer this player to another session.
 
+        The new player is created on the new session with the current voice state, track, position, volume, filters and paused state, so the bot does not leave or rejoin the voice channel.
+
         !!! warning
             This will kill the current player, and return a new player.
 
@@ -993,6 +1259,19 @@ class Player:
         -------
         Player
             The new player.
+
+        Raises
+        ------
+        SessionStartError
+            Raised when the new session has not yet been started.
+        RestEmptyError
+            Raised when a return type was requested, yet nothing was received.
+        RestStatusError
+            Raised when nothing was received, but a 4XX/5XX error was reported.
+        RestRequestError
+            Raised when a rest error is returned with a 4XX/5XX error.
+        BuildError
+            Raised when a construction of a ABC class fails.
         """
         _logger.log(
             TRACE_LEVEL,
@@ -1001,15 +1280,46 @@ class Player:
 
         new_player = Player(session, self.guild_id)
 
-        new_player.add(self.queue)
+        new_player._queue.extend(self._queue)
+        new_player._shuffle_seed = self._shuffle_seed
+        new_player._shuffle_keys = dict(self._shuffle_keys)
+        new_player._shuffle_queue = (
+            None if self._shuffle_queue is None else list(self._shuffle_queue)
+        )
+        new_player._autoplay = self._autoplay
+        new_player._loop = self._loop
+        new_player._prefetch = self._prefetch
+        new_player._channel_id = self._channel_id
 
-        if self.connected and self.channel_id:
-            await self.disconnect()
+        if self.connected and self._voice is not None:
+            queue = self.queue
 
-            await new_player.connect(self.channel_id)
-            if self.is_paused is False:
-                await new_player.play()
-                await new_player.set_position(self.position)
+            player = await session.client.rest.update_player(
+                session._get_session_id(),
+                self.guild_id,
+                track=queue[0] if len(queue) > 0 else hikari.UNDEFINED,
+                position=self.position if len(queue) > 0 else hikari.UNDEFINED,
+                volume=self.volume if self.volume >= 0 else hikari.UNDEFINED,
+                paused=self.is_paused,
+                filters=self.filters if self.filters is not None else hikari.UNDEFINED,
+                voice=self._voice,
+                no_replace=False,
+                session=session,
+            )
+
+            new_player._is_alive = True
+            new_player._update(player)
+
+            await self._delete_remote()
+        else:
+            # The old session may still have a player for the guild, so it is deleted before the new player takes over.
+            await self._delete_remote()
+
+        # The old player must not act on events for the guild anymore.
+        self._queue.clear()
+        self._shuffle_queue = None
+        self._is_alive = False
+        self._connected = False
 
         _logger.log(
             TRACE_LEVEL,
@@ -1018,6 +1328,249 @@ class Player:
 
         return new_player
 
+    async def _move_session(self, session: Session, voice: Voice) -> player_.Player:
+        _logger.log(
+            TRACE_LEVEL,
+            f"Moving player in {self.guild_id} from session ({self.session.name}) to session ({session.name})",
+        )
+
+        session_id = session._get_session_id()
+
+        if not self.is_alive:
+            self._session = session
+
+            return await session.client.rest.update_player(
+                session_id,
+                self.guild_id,
+                voice=voice,
+                no_replace=False,
+                session=session,
+            )
+
+        # The old player is deleted, so what it was playing is carried over to the new session.
+        queue = self.queue
+        position = self.position
+
+        await self._delete_remote()
+
+        self._session = session
+
+        return await session.client.rest.update_player(
+            session_id,
+            self.guild_id,
+            track=queue[0] if len(queue) > 0 else hikari.UNDEFINED,
+            position=position if len(queue) > 0 else hikari.UNDEFINED,
+            volume=self.volume if self.volume >= 0 else hikari.UNDEFINED,
+            paused=self.is_paused,
+            filters=self.filters if self.filters is not None else hikari.UNDEFINED,
+            voice=voice,
+            no_replace=False,
+            session=session,
+        )
+
+    async def _delete_remote(self) -> None:
+        # The old session may be gone already, so failing to delete the player is not an issue.
+        try:
+            await self.session.client.rest.delete_player(
+                self.session._get_session_id(),
+                self.guild_id,
+                session=self.session,
+            )
+        except Exception as e:
+            _logger.log(
+                TRACE_LEVEL,
+                f"Failed to delete the old player in {self.guild_id} from session ({self.session.name}): {e}",
+            )
+
+    def _dump(self) -> typing.Mapping[str, typing.Any]:
+        return {
+            "guild_id": str(self.guild_id),
+            "channel_id": str(self.channel_id) if self.channel_id else None,
+            "autoplay": self._autoplay,
+            "loop": self._loop,
+            "prefetch": self._prefetch,
+            "shuffle_seed": self._shuffle_seed,
+            "queue": [
+                {
+                    "encoded": entry.encoded,
+                    "requestor": str(entry.requestor) if entry.requestor else None,
+                    "enqueued_at": entry.enqueued_at.isoformat(),
+                    "shuffle_key": self._shuffle_key(entry).hex()
+                    if self._shuffle_seed is not None
+                    else None,
+                }
+                for entry in self._queue
+            ],
+        }
+
+    @classmethod
+    async def _from_state(
+        cls,
+        session: Session,
+        player: player_.Player,
+        data: typing.Mapping[str, typing.Any] | None,
+    ) -> Player:
+        new_player = cls(session, player.guild_id)
+
+        new_player._update(player)
+        new_player._is_alive = True
+
+        if data is not None:
+            if data["channel_id"] is not None:
+                new_player._channel_id = hikari.Snowflake(int(data["channel_id"]))
+
+            new_player._autoplay = data["autoplay"]
+            new_player._loop = data["loop"]
+            new_player._prefetch = data["prefetch"]
+            new_player._shuffle_seed = data["shuffle_seed"]
+
+            entries: typing.Sequence[typing.Mapping[str, typing.Any]] = data["queue"]
+
+            if len(entries) > 0:
+                tracks = await session.client.rest.decode_tracks(
+                    [entry["encoded"] for entry in entries], session=session
+                )
+
+                for track, entry in zip(tracks, entries):
+                    new_entry = new_player._create_entry(
+                        track,
+                        hikari.Snowflake(int(entry["requestor"]))
+                        if entry["requestor"]
+                        else None,
+                        datetime.datetime.fromisoformat(entry["enqueued_at"]),
+                    )
+
+                    # The entries are given new ids, so their keys are kept, to keep the same shuffled order.
+                    if entry.get("shuffle_key", None):
+                        new_player._shuffle_keys[new_entry.entry_id] = bytes.fromhex(
+                            entry["shuffle_key"]
+                        )
+
+                    new_player._queue.append(new_entry)
+
+        # The track playing now, is the one lavalink has.
+        if player.track is not None and (
+            len(new_player._queue) == 0
+            or not new_player._queue[0].same_audio(player.track)
+        ):
+            new_player._queue.insert(
+                0,
+                new_player._create_entry(
+                    player.track,
+                    None,
+                    datetime.datetime.now(datetime.timezone.utc),
+                ),
+            )
+
+        return new_player
+
+    def _create_entry(
+        self,
+        track: track_.Track,
+        requestor: hikari.Snowflake | None,
+        enqueued_at: datetime.datetime,
+    ) -> track_.QueueEntry:
+        if isinstance(track, track_.QueueEntry):
+            requestor = requestor or track.requestor
+            track = track.track
+
+        return QueueEntry(
+            track,
+            requestor or track.requestor,
+            next(_entry_ids),
+            enqueued_at,
+        )
+
+    def _shuffle_key(self, entry: track_.QueueEntry) -> bytes:
+        key = self._shuffle_keys.get(entry.entry_id, None)
+
+        # Each entry is keyed once by its id, so its place in the shuffled order never changes, and duplicate tracks are spread out.
+        if key is None:
+            key = hashlib.blake2b(
+                f"{self._shuffle_seed}:{entry.entry_id}".encode(), digest_size=8
+            ).digest()
+            self._shuffle_keys[entry.entry_id] = key
+
+        return key
+
+    def _ordered_queue(self) -> typing.MutableSequence[track_.QueueEntry]:
+        if self._shuffle_seed is None:
+            return self._queue
+
+        if self._shuffle_queue is None:
+            self._shuffle_queue = [
+                *self._queue[:1],
+                *sorted(self._queue[1:], key=self._shuffle_key),
+            ]
+
+        return self._shuffle_queue
+
+    def _find_entry(
+        self, queue: typing.Sequence[track_.QueueEntry], value: track_.Track
+    ) -> int:
+        # Entries are only equal to entries, so an entry is found by its id.
+        if isinstance(value, track_.QueueEntry):
+            return queue.index(value)
+
+        # An entry is never equal to a plain track, so a plain track is found by identity, and then by its audio.
+        for index, entry in enumerate(queue):
+            if entry.track is value:
+                return index
+
+        for index, entry in enumerate(queue):
+            if entry.same_audio(value):
+                return index
+
+        raise ValueError(f"{value} is not in the queue.")
+
+    def _pop_track(self, index: int) -> track_.QueueEntry:
+        queue = self._ordered_queue()
+
+        track = queue.pop(index)
+
+        self._shuffle_keys.pop(track.entry_id, None)
+
+        if queue is self._queue:
+            return track
+
+        self._remove_original(track)
+
+        # The next shuffled track becomes the current track, so it is moved to the front of the original queue.
+        if index == 0 and len(queue) > 0:
+            self._remove_original(queue[0])
+            self._queue.insert(0, queue[0])
+
+        return track
+
+    def _remove_original(self, track: track_.QueueEntry) -> None:
+        for position, queued_track in enumerate(self._queue):
+            if queued_track is track:
+                del self._queue[position]
+                return
+
+    def _replace_entry(
+        self, entry: track_.QueueEntry, new_entry: track_.QueueEntry
+    ) -> None:
+        for queue in (self._queue, self._shuffle_queue):
+            if queue is None:
+                continue
+
+            for position, queued_entry in enumerate(queue):
+                if queued_entry is entry:
+                    queue[position] = new_entry
+                    break
+
+    def _playback_speed(self) -> float:
+        if self._filters is None or self._filters.timescale is None:
+            return 1.0
+
+        timescale = self._filters.timescale
+
+        speed = 1.0 if timescale.speed is None else timescale.speed
+        rate = 1.0 if timescale.rate is None else timescale.rate
+
+        return speed * rate
+
     def _update(self, player: player_.Player) -> None:
         _logger.log(
             TRACE_LEVEL,
@@ -1027,10 +1580,12 @@ class Player:
         self._volume = player.volume
         self._is_paused = player.is_paused
         self._state = player.state
+        self._state_received_at = time.monotonic()
         self._voice = player.voice
         self._filters = player.filters
         self._connected = player.state.connected
 
+    @_command
     async def _track_end_event(self, event: TrackEndEvent) -> None:
         self.session._get_session_id()
 
@@ -1058,6 +1613,13 @@ class Player:
             )
             return
 
+        if not self.queue[0].same_audio(event.track):
+            _logger.log(
+                TRACE_LEVEL,
+                f"current track has already been changed for channel: {self.channel_id} in guild: {self.guild_id}. Skipping.",
+            )
+            return
+
         if len(self.queue) == 1 and not self.loop:
             _logger.log(
                 TRACE_LEVEL,
@@ -1087,13 +1649,29 @@ class Player:
             f"Auto-playing next track for channel: {self.channel_id} in guild: {self.guild_id}. Track title: {self.queue[0].info.title}",
         )
 
-        await self.play()
+        self._track_end_time = time.monotonic()
+
+        if self.prefetch:
+            # The previous track has ended, so the next track must not replace one that has been started since.
+            player = await self.session.client.rest.update_player(
+                self.session._get_session_id(),
+                self.guild_id,
+                track=self.queue[0],
+                no_replace=True,
+                session=self.session,
+            )
+
+            self._is_paused = False
+
+            self._update(player)
+        else:
+            await self.play()
 
         self.app.event_manager.dispatch(
             events.QueueNextEvent.from_session(
                 self.session,
                 self.guild_id,
-                self._queue[0],
+                self.queue[0],
                 event.track,
             ),
             return_tasks=False,
@@ -1104,6 +1682,71 @@ class Player:
             f"Auto-playing successfully completed for channel: {self.channel_id} in guild: {self.guild_id}",
         )
 
+    async def _track_start_event(self, event: TrackStartEvent) -> None:
+        if event.guild_id != self.guild_id:
+            return
+
+        if self._track_end_time is not None:
+            self._transition_gap = (time.monotonic() - self._track_end_time) * 1000
+            self._track_end_time = None
+
+            _logger.log(
+                TRACE_LEVEL,
+                f"Track transition took {self._transition_gap:.2f}ms for channel: {self.channel_id} in guild: {self.guild_id}",
+            )
+
+        if self.prefetch and len(self.queue) > 1:
+            await self._prefetch_next(self.queue[1])
+
+    async def _prefetch_next(self, entry: track_.QueueEntry) -> None:
+        rest = self.session.client.rest
+
+        # Decoding does not contact the source, so this only catches encoded data lavalink can not read.
+        try:
+            await rest.decode_track(entry.encoded, session=self.session)
+        except errors.OngakuError as e:
+            _logger.log(
+                TRACE_LEVEL,
+                f"Next track could not be decoded for channel: {self.channel_id} in guild: {self.guild_id}: {e}",
+            )
+        else:
+            _logger.log(
+                TRACE_LEVEL,
+                f"Checked next track for channel: {self.channel_id} in guild: {self.guild_id}",
+            )
+            return
+
+        if entry.info.uri is None:
+            return
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Resolving the next track again for channel: {self.channel_id} in guild: {self.guild_id}",
+        )
+
+        # This runs from the track start event, so a failure is logged instead of raised.
+        try:
+            result = await rest.load_track(entry.info.uri, session=self.session)
+        except errors.OngakuError as e:
+            _logger.warning(
+                f"Failed to resolve the next track for channel: {self.channel_id} in guild: {self.guild_id}: {e}"
+            )
+            return
+
+        if isinstance(result, typing.Sequence):
+            result = result[0] if len(result) > 0 else None
+
+        if not isinstance(result, track_.Track):
+            return
+
+        new_entry = QueueEntry(
+            result, entry.requestor, entry.entry_id, entry.enqueued_at
+        )
+
+        # The queue may have changed while loading, so only the same entry is replaced, once no command is changing the queue.
+        async with self._command_lock:
+            self._replace_entry(entry, new_entry)
+
     async def _player_update_event(self, event: PlayerUpdateEvent) -> None:
         if event.guild_id != self.guild_id:
             return
@@ -1122,6 +1765,7 @@ class Player:
         )
 
         self._state = event.state
+        self._state_received_at = time.monotonic()
         self._connected = event.state.connected
 
 
@@ -6,12 +6,14 @@ All REST based actions, happen in here.
 
 from __future__ import annotations
 
+import asyncio
 import typing
 
 import hikari
 
 from ongaku import errors
 from ongaku.internal import routes
+from ongaku.internal.converters import json_loads
 from ongaku.internal.logger import TRACE_LEVEL
 from ongaku.internal.logger import logger
 
@@ -22,9 +24,11 @@ if typing.TYPE_CHECKING:
     from ongaku.abc.player import Player
     from ongaku.abc.player import Voice
     from ongaku.abc.playlist import Playlist
+    from ongaku.abc.playlist import PlaylistInfo
     from ongaku.abc.routeplanner import RoutePlannerStatus
     from ongaku.abc.statistics import Statistics
     from ongaku.abc.track import Track
+    from ongaku.builders import EntityBuilder
     from ongaku.session import Session
 
 _logger = logger.getChild("rest")
@@ -33,7 +37,10 @@ if typing.TYPE_CHECKING:
     from ongaku.client import Client
 
 
-__all__ = ("RESTClient",)
+__all__ = ("DEFAULT_OFFLOAD_THRESHOLD", "RESTClient")
+
+DEFAULT_OFFLOAD_THRESHOLD: typing.Final[int] = 262144
+"""The default length of a loaded response, above which it is decoded in a worker thread. This is roughly a playlist of 250 tracks."""
 
 
 class RESTClient:
@@ -44,14 +51,32 @@ class RESTClient:
 
     !!! warning
         Please do not create this on your own. Please use the rest attribute, in the base client object you created.
+
+    Parameters
+    ----------
+    client
+        The client this rest client belongs to.
+    offload_threshold
+        The length of a [`load_track`][ongaku.rest.RESTClient.load_track] response, above which it is decoded in a worker thread, instead of on the event loop. The tracks are still built on the event loop. If `None`, responses are always decoded on the event loop.
     """
 
-    __slots__: typing.Sequence[str] = "_client"
+    __slots__: typing.Sequence[str] = ("_client", "_offload_threshold")
 
-    def __init__(self, client: Client) -> None:
+    def __init__(
+        self,
+        client: Client,
+        *,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
         self._client = client
+        self._offload_threshold = offload_threshold
+
+    @property
+    def offload_threshold(self) -> int | None:
+        """The length of a loaded response, above which it is decoded in a worker thread."""
+        return self._offload_threshold
 
-    async def load_track(  # noqa: C901
+    async def load_track(
         self,
         query: str,
         *,
@@ -114,61 +139,162 @@ class RESTClient:
         if not session:
             session = self._client.session_handler.fetch_session()
 
+        builder = self._client.entity_builder
+
+        # The raw response is decoded by the builder, unless it is large enough to be decoded off the event loop.
         response = await session.request(
             route.method,
             route.path,
-            dict,
+            str,
             params={"identifier": query},
         )
 
         if response is None:
             raise ValueError("Response is required for this request.")
 
-        load_type: str = response["loadType"]
+        try:
+            if (
+                self._offload_threshold is not None
+                and len(response) > self._offload_threshold
+            ):
+                _logger.log(
+                    TRACE_LEVEL,
+                    f"Decoding {len(response)} characters in a worker thread.",
+                )
 
-        if load_type == "empty":
-            _logger.log(TRACE_LEVEL, "loadType is empty.")
-            return None
+                # Only the decode runs in the worker thread. The tracks are built on the event loop, as the builder (and its intern pool) is not thread safe.
+                return builder.build_load_result(await self._loads(response))
 
-        if load_type == "error":
-            _logger.log(TRACE_LEVEL, "loadType caused an error.")
+            return builder.build_load_result(response)
+        except (errors.RestExceptionError, errors.BuildError):
+            raise
+        except Exception as e:
+            raise errors.BuildError(e)
 
-            raise errors.RestExceptionError.from_error(
-                self._client.entity_builder.build_exception_error(response["data"]),
-            )
+    async def _loads(self, payload: str) -> typing.Any:
+        if (
+            self._offload_threshold is not None
+            and len(payload) > self._offload_threshold
+        ):
+            return await asyncio.to_thread(json_loads, payload)
 
-        if load_type == "search":
-            _logger.log(TRACE_LEVEL, "loadType was a search result.")
-            tracks: typing.Sequence[Track] = []
-            for track in response["data"]:
-                try:
-                    tracks.append(self._client.entity_builder.build_track(track))
-                except Exception as e:
-                    raise errors.BuildError(e)
+        return json_loads(payload)
 
-            build = tracks
+    async def stream_track(
+        self,
+        query: str,
+        *,
+        chunk_size: int = 100,
+        session: Session | None = None,
+    ) -> typing.AsyncIterator[PlaylistInfo | typing.Sequence[Track]]:
+        """
+        Stream tracks.
 
-        elif load_type == "track":
-            _logger.log(TRACE_LEVEL, "loadType was a track link.")
-            try:
-                build = self._client.entity_builder.build_track(response["data"])
-            except Exception as e:
-                raise errors.BuildError(e)
+        Loads tracks like [`load_track`][ongaku.rest.RESTClient.load_track], but yields them in chunks as they are built, so the first tracks can be played before the rest of a large playlist is built.
 
-        elif load_type == "playlist":
-            _logger.log(TRACE_LEVEL, "loadType was a playlist link.")
-            try:
-                build = self._client.entity_builder.build_playlist(response["data"])
-            except Exception as e:
-                raise errors.BuildError(e)
+        For a playlist, its info is yielded first. Then the tracks (of a playlist, a search, or the single track) are yielded in sequences of up to `chunk_size` tracks. Nothing is yielded, if no result was returned.
 
-        else:
-            raise errors.BuildError(
-                None,
-                f"An unknown loadType was received: {load_type}",
-            )
+        ![Lavalink](../assets/lavalink_logo.png){ .twemoji } [Reference](https://lavalink.dev/api/rest#track-loading)
 
-        return build
+        Example
+        -------
+        ```py
+        started = False
+
+        async for result in client.rest.stream_track(
+            "https://youtube.com/playlist?list=..."
+        ):
+            if isinstance(result, ongaku.abc.PlaylistInfo):
+                await ctx.respond(f"Loading {result.name}...")
+                continue
+
+            player.add(result)
+
+            if not started:
+                await player.play()
+                started = True
+        ```
+
+        Parameters
+        ----------
+        query
+            The query for the search/link.
+        chunk_size
+            The maximum amount of tracks in each chunk.
+        session
+            If provided, the session to use for this request.
+
+        Raises
+        ------
+        ValueError
+            Raised when the chunk size is less than 1.
+        NoSessionsError
+            Raised when there is no available sessions for this request to take place.
+        TimeoutError
+            Raised when the request takes too long to respond.
+        RestEmptyError
+            Raised when the request required a return type, but received nothing, or a 204 response.
+        RestStatusError
+            Raised when a 4XX or a 5XX status is received.
+        BuildError
+            Raised when the track, playlist or search could not be built.
+        RestRequestError
+            Raised when a 4XX or a 5XX status is received, and lavalink gives more information.
+        RestExceptionError
+            Raised when lavalink failed to load the tracks.
+        RestError
+            Raised when an unknown error is caught.
+
+        Yields
+        ------
+        PlaylistInfo
+            The info of the playlist, before any of its tracks.
+        typing.Sequence[Track]
+            The next chunk of tracks.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+
+        route = routes.GET_LOAD_TRACKS
+
+        _logger.log(TRACE_LEVEL, str(route))
+
+        if not session:
+            session = self._client.session_handler.fetch_session()
+
+        builder = self._client.entity_builder
+
+        response = await session.request(
+            route.method,
+            route.path,
+            str,
+            params={"identifier": query},
+        )
+
+        if response is None:
+            raise ValueError("Response is required for this request.")
+
+        try:
+            split = _split_load_result(builder, await self._loads(response))
+        except (errors.RestExceptionError, errors.BuildError):
+            raise
+        except Exception as e:
+            raise errors.BuildError(e)
+
+        if split is None:
+            return
+
+        info, track_payloads = split
+
+        if info is not None:
+            yield info
+
+        for start in range(0, len(track_payloads), chunk_size):
+            # Tracks that fail to build raise a bulk build error, once the rest of the chunk is built.
+            yield builder.build_tracks(track_payloads[start : start + chunk_size])
+
+            # Lets the event loop run between chunks, even if the caller does not await anything.
+            await asyncio.sleep(0)
 
     async def decode_track(
         self,
@@ -1273,6 +1399,34 @@ class RESTClient:
         )
 
 
+def _split_load_result(
+    builder: EntityBuilder,
+    data: typing.Mapping[str, typing.Any],
+) -> (
+    tuple[PlaylistInfo | None, typing.Sequence[typing.Mapping[str, typing.Any]]] | None
+):
+    load_type: str = data["loadType"]
+
+    if load_type == "empty":
+        return None
+
+    if load_type == "error":
+        raise errors.RestExceptionError.from_error(
+            builder.build_exception_error(data["data"])
+        )
+
+    if load_type == "playlist":
+        return builder.build_playlist_info(data["data"]["info"]), data["data"]["tracks"]
+
+    if load_type == "search":
+        return None, data["data"]
+
+    if load_type == "track":
+        return None, [data["data"]]
+
+    raise errors.BuildError(None, f"An unknown loadType was received: {load_type}")
+
+
 # MIT License
 
 # Copyright (c) 2023-present MPlatypus
@@ -7,6 +7,7 @@ Session related objects.
 from __future__ import annotations
 
 import asyncio
+import time
 import typing
 
 import aiohttp
@@ -31,6 +32,19 @@ if typing.TYPE_CHECKING:
 
 __all__ = ("Session",)
 
+_HEALTH_INTERVAL: typing.Final[float] = 30.0
+"""The time in seconds between each health check."""
+_HEALTH_TIMEOUT: typing.Final[float] = 5.0
+"""The time in seconds, before a health check is considered failed."""
+_LATENCY_SMOOTHING: typing.Final[float] = 0.3
+"""The weight of the newest latency sample in the average."""
+_DEGRADED_LATENCY: typing.Final[float] = 1000.0
+"""The average latency in milliseconds, above which a session is degraded."""
+_DEGRADED_SILENCE: typing.Final[float] = 90.0
+"""The time in seconds without a websocket message, after which a session is degraded."""
+_UNHEALTHY_SILENCE: typing.Final[float] = 150.0
+"""The time in seconds without a websocket message, after which a session is unhealthy."""
+
 
 class Session:
     """
@@ -54,6 +68,8 @@ class Session:
         The password of the lavalink server.
     attempts
         The attempts that the session is allowed to use, before completely shutting down.
+    region
+        The voice region the lavalink server is closest to.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -61,11 +77,17 @@ class Session:
         "_authorization_headers",
         "_base_uri",
         "_client",
+        "_draining",
+        "_health",
+        "_health_task",
         "_host",
+        "_last_message",
+        "_latency",
         "_name",
         "_password",
         "_players",
         "_port",
+        "_region",
         "_remaining_attempts",
         "_session_id",
         "_session_task",
@@ -83,6 +105,7 @@ class Session:
         port: int,
         password: str,
         attempts: int,
+        region: str | None = None,
     ) -> None:
         self._client = client
         self._name = name
@@ -91,10 +114,16 @@ class Session:
         self._port = port
         self._password = password
         self._attempts = attempts
+        self._region = region
         self._remaining_attempts = attempts
         self._base_uri = f"http{'s' if ssl else ''}://{host}:{port}"
         self._session_id: str | None = None
         self._session_task: asyncio.Task[None] | None = None
+        self._health_task: asyncio.Task[None] | None = None
+        self._health = session_.SessionHealth.HEALTHY
+        self._latency: float | None = None
+        self._last_message: float | None = None
+        self._draining = False
         self._status = session_.SessionStatus.NOT_CONNECTED
         self._players: typing.MutableMapping[hikari.Snowflake, Player] = {}
         self._websocket_headers: typing.MutableMapping[str, typing.Any] = {}
@@ -137,6 +166,14 @@ class Session:
         """The password for the server."""
         return self._password
 
+    @property
+    def region(self) -> str | None:
+        """The voice region the server is closest to.
+
+        `None` if no region was set.
+        """
+        return self._region
+
     @property
     def base_uri(self) -> str:
         """The base URI for the server."""
@@ -152,6 +189,30 @@ class Session:
         """The current status of the session."""
         return self._status
 
+    @property
+    def health(self) -> session_.SessionHealth:
+        """The current health of the session.
+
+        Checked in the background while the session is running. Always [UNHEALTHY][ongaku.abc.session.SessionHealth.UNHEALTHY] if the session is not connected.
+        """
+        if self.status != session_.SessionStatus.CONNECTED:
+            return session_.SessionHealth.UNHEALTHY
+
+        return self._health
+
+    @property
+    def is_draining(self) -> bool:
+        """Whether the session is being drained, and will not be given new players."""
+        return self._draining
+
+    @property
+    def latency(self) -> float | None:
+        """The average time in milliseconds, the lavalink server takes to respond to a request.
+
+        `None` if the latency has not been checked yet.
+        """
+        return self._latency
+
     @property
     def session_id(self) -> str | None:
         """
@@ -335,6 +396,8 @@ class Session:
     def _handle_ws_message(self, msg: aiohttp.WSMessage) -> bool:
         """Returns false if failure or closure, true otherwise."""
         if msg.type == aiohttp.WSMsgType.TEXT:
+            self._last_message = time.monotonic()
+
             payload_event = events.PayloadEvent.from_session(self, msg.data)
             event = self._handle_op_code(msg.data)
 
@@ -387,6 +450,11 @@ class Session:
         new_headers.update(self._websocket_headers)
 
         new_headers.update(self.auth_headers)
+
+        if self._session_id is not None:
+            # Lavalink resumes the session, if resuming was enabled for it.
+            new_headers.update({"Session-Id": self._session_id})
+
         while self._remaining_attempts >= 1:
             if self._remaining_attempts != self._attempts:
                 await asyncio.sleep(2.5)
@@ -404,6 +472,7 @@ class Session:
                         f"Successfully made connection to session {self.name}",
                     )
                     self._status = session_.SessionStatus.CONNECTED
+                    self._last_message = time.monotonic()
                     while True:
                         msg = await ws.receive()
 
@@ -427,39 +496,304 @@ class Session:
 
         raise errors.SessionStartError
 
-    async def transfer(self, session_handler: handler_.SessionHandler) -> None:
+    async def transfer(
+        self,
+        session_handler: handler_.SessionHandler,
+        *,
+        concurrency: int = 10,
+    ) -> None:
         """
         Transfer.
 
         Transfer all the players from this session, to a different one.
 
+        Players are moved a few at a time, with the players that are currently playing moved first. Each player is moved to the session the handler would give a new player in its guild, and stays connected to its voice channel while being moved.
+
+        A [SessionTransferEvent][ongaku.events.SessionTransferEvent] is dispatched after each player is moved.
+
         !!! warning
-            This will close the current sessions connection.
+            This will close the current sessions connection, once all of its players are moved. If any player could not be moved, the session is kept running.
 
         Parameters
         ----------
         session_handler
             The session handler, that will allow this session to move its players too.
+        concurrency
+            The amount of players to move at the same time.
+
+        Raises
+        ------
+        ValueError
+            Raised when the concurrency is below 1.
         """
-        session = session_handler.fetch_session()
+        if concurrency <= 0:
+            raise ValueError(f"Concurrency must be above 0. Value: {concurrency}")
+
+        # The session handler must not pick this session, as a target for its own players.
+        self._draining = True
 
         _logger.log(
             TRACE_LEVEL,
-            f"Attempting transfer players from session {self.name} to {session.name}",
+            f"Attempting transfer players from session {self.name}",
+        )
+
+        players = sorted(
+            (player for player in session_handler.players if player.session is self),
+            key=lambda player: not (
+                player.connected and not player.is_paused and len(player.queue) > 0
+            ),
         )
 
-        for player in self._players.values():
-            player = await player.transfer(session)
+        semaphore = asyncio.Semaphore(concurrency)
+        moved = 0
+        remaining = len(players)
+
+        async def move(player: Player) -> None:
+            nonlocal moved, remaining
+
+            async with semaphore:
+                session = self
+
+                try:
+                    # Each player is given the session the handler would give a new player in its guild.
+                    session = session_handler.fetch_player_session(player.guild_id)
+
+                    if session is self:
+                        raise errors.NoSessionsError
 
-            session_handler.add_player(player)
+                    session_handler.add_player(await player.transfer(session))
+                except errors.OngakuError as e:
+                    _logger.warning(
+                        f"Failed to transfer player in {player.guild_id} from session {self.name}: {e}"
+                    )
+                else:
+                    moved += 1
+
+                remaining -= 1
+
+                self.app.event_manager.dispatch(
+                    events.SessionTransferEvent.from_session(
+                        self, session, moved, remaining
+                    ),
+                    return_tasks=False,
+                )
+
+        try:
+            await asyncio.gather(*(move(player) for player in players))
+        except BaseException:
+            self._draining = False
+            raise
+
+        # The players that could not be moved still need this session, so it is kept running.
+        if moved < len(players):
+            self._draining = False
+
+            _logger.warning(
+                f"Session {self.name} was not stopped, as {len(players) - moved} player(s) could not be moved"
+            )
+            return
 
         await self.stop()
 
         _logger.log(
             TRACE_LEVEL,
-            f"Successfully transferred and stopped session {self.name} and moved players to session {session.name}",
+            f"Successfully transferred and stopped session {self.name} and moved {moved} of {len(players)} players",
+        )
+
+    async def drain(
+        self,
+        session_handler: handler_.SessionHandler,
+        *,
+        batch_size: int = 10,
+        interval: float = 5.0,
+    ) -> None:
+        """
+        Drain.
+
+        Gradually move all the players from this session to other sessions, and stop it once it holds no players.
+
+        Players that fail to move are skipped. If any are left, the session is kept running, and stops draining.
+
+        The session handler will not give the session any new players while it is draining. Players that are not playing anything are moved first.
+
+        A [SessionDrainEvent][ongaku.events.SessionDrainEvent] is dispatched after each batch of players is moved.
+
+        !!! tip
+            Once drained, the lavalink server can be restarted, and the session started again with [start][ongaku.session.Session.start].
+
+        Parameters
+        ----------
+        session_handler
+            The session handler, that will allow this session to move its players too.
+        batch_size
+            The amount of players to move at a time.
+        interval
+            The time in seconds to wait between each batch.
+
+        Raises
+        ------
+        ValueError
+            Raised when the batch size is below 1.
+        NoSessionsError
+            Raised when there is no other session to move the players to.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Batch size must be above 0. Value: {batch_size}")
+
+        self._draining = True
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Draining session {self.name}",
         )
 
+        moved = 0
+        failed: set[hikari.Snowflake] = set()
+
+        try:
+            while True:
+                players = sorted(
+                    (
+                        player
+                        for player in session_handler.players
+                        if player.session is self and player.guild_id not in failed
+                    ),
+                    key=lambda player: (
+                        player.connected
+                        and not player.is_paused
+                        and len(player.queue) > 0
+                    ),
+                )
+
+                self.app.event_manager.dispatch(
+                    events.SessionDrainEvent.from_session(self, moved, len(players)),
+                    return_tasks=False,
+                )
+
+                if len(players) == 0:
+                    break
+
+                moved += await self._drain_players(
+                    session_handler, players[:batch_size], failed
+                )
+
+                _logger.log(
+                    TRACE_LEVEL,
+                    f"Moved {moved} players from session {self.name}, {len(players) - min(batch_size, len(players))} remaining",
+                )
+
+                if len(players) > batch_size:
+                    await asyncio.sleep(interval)
+        except BaseException:
+            self._draining = False
+            raise
+
+        # The players that could not be moved still need this session, so it is kept running.
+        if failed:
+            self._draining = False
+
+            _logger.warning(
+                f"Session {self.name} was not stopped, as {len(failed)} player(s) could not be moved"
+            )
+            return
+
+        await self.stop()
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Successfully drained and stopped session {self.name}",
+        )
+
+    async def _drain_players(
+        self,
+        session_handler: handler_.SessionHandler,
+        players: typing.Sequence[Player],
+        failed: set[hikari.Snowflake],
+    ) -> int:
+        moved = 0
+
+        for player in players:
+            session = session_handler.fetch_player_session(player.guild_id)
+
+            if session is self or session.status != session_.SessionStatus.CONNECTED:
+                raise errors.NoSessionsError
+
+            try:
+                session_handler.add_player(await player.transfer(session))
+            except errors.OngakuError as e:
+                _logger.warning(
+                    f"Failed to drain player in {player.guild_id} from session {self.name}: {e}"
+                )
+
+                failed.add(player.guild_id)
+            else:
+                moved += 1
+
+        return moved
+
+    async def check_health(self) -> session_.SessionHealth:
+        """
+        Check health.
+
+        Check how well the lavalink server is responding, and update the sessions [health][ongaku.session.Session.health].
+
+        !!! note
+            This is ran in the background every 30 seconds while the session is running.
+
+        Returns
+        -------
+        SessionHealth
+            The new health of the session.
+        """
+        started = time.monotonic()
+
+        try:
+            await asyncio.wait_for(
+                self.client.rest.fetch_version(session=self),
+                timeout=_HEALTH_TIMEOUT,
+            )
+        except Exception as e:
+            _logger.warning(f"Health check failed for session {self.name}: {e}")
+
+            self._health = session_.SessionHealth.UNHEALTHY
+
+            return self.health
+
+        latency = (time.monotonic() - started) * 1000
+
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency = (
+                _LATENCY_SMOOTHING * latency + (1 - _LATENCY_SMOOTHING) * self._latency
+            )
+
+        silence = 0.0
+
+        if self._last_message is not None:
+            silence = time.monotonic() - self._last_message
+
+        if silence > _UNHEALTHY_SILENCE:
+            self._health = session_.SessionHealth.UNHEALTHY
+        elif silence > _DEGRADED_SILENCE or self._latency > _DEGRADED_LATENCY:
+            self._health = session_.SessionHealth.DEGRADED
+        else:
+            self._health = session_.SessionHealth.HEALTHY
+
+        _logger.log(
+            TRACE_LEVEL,
+            f"Session {self.name} is {self._health.name} with a latency of {self._latency:.2f}ms and {silence:.2f}s since the last message",
+        )
+
+        return self.health
+
+    async def _health_monitor(self) -> None:
+        while True:
+            await asyncio.sleep(_HEALTH_INTERVAL)
+
+            if self.status == session_.SessionStatus.CONNECTED:
+                await self.check_health()
+
     async def start(self) -> None:
         """
         Start the session.
@@ -470,7 +804,9 @@ class Session:
             TRACE_LEVEL,
             f"Starting up session {self.name}",
         )
+        self._draining = False
         self._session_task = asyncio.create_task(self._websocket())
+        self._health_task = asyncio.create_task(self._health_monitor())
         _logger.log(
             TRACE_LEVEL,
             f"Successfully started session {self.name}",
@@ -494,6 +830,14 @@ class Session:
             except asyncio.CancelledError:
                 self._session_task = None
 
+        if self._health_task:
+            self._health_task.cancel()
+
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                self._health_task = None
+
         _logger.log(
             TRACE_LEVEL,
             f"Successfully shut down session {self.name}",
@@ -28,7 +28,7 @@ ENCODED_TRACK: typing.Final[str] = (
 
 @pytest.fixture
 def gateway_bot() -> gateway_bot_.GatewayBot:
-    return mock.Mock()
+    return mock.Mock(shard_count=1)
 
 
 @pytest.fixture
@@ -50,6 +50,7 @@ def ongaku_session(
         port=1234,
         password="password",
         attempts=3,
+        is_draining=False,
     )
 
 
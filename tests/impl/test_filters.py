@@ -50,6 +50,9 @@ def test_filters():
     assert filters.low_pass == low_pass
     assert filters.plugin_filters == {}
 
+    assert Filters.__doc__ is not None
+    assert not hasattr(filters, "__dict__")
+
 
 class TestFilterFunctions:
     def test_from_filter(self, ongaku_filters: Filters):
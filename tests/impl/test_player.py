@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+import pickle
 from typing import TYPE_CHECKING
 
 from hikari.snowflakes import Snowflake
@@ -54,3 +55,17 @@ def test_player_voice():
     assert player_voice.token == "token"
     assert player_voice.endpoint == "endpoint"
     assert player_voice.session_id == "session_id"
+
+
+def test_player_pickle(ongaku_track: Track, ongaku_filters: Filters):
+    player = Player(
+        Snowflake(1234567890),
+        ongaku_track,
+        1,
+        True,
+        State(datetime.datetime.now(), 2, True, 3),
+        Voice("token", "endpoint", "session_id"),
+        ongaku_filters,
+    )
+
+    assert pickle.loads(pickle.dumps(player)) == player
@@ -1,6 +1,7 @@
 # ruff: noqa: D100, D101, D102, D103
 from __future__ import annotations
 
+import pickle
 import typing
 
 import pytest
@@ -9,6 +10,7 @@ from ongaku.impl.playlist import Playlist
 from ongaku.impl.playlist import PlaylistInfo
 from ongaku.impl.track import Track
 from ongaku.impl.track import TrackInfo
+from ongaku.internal.types import EMPTY_MAPPING
 
 
 @pytest.fixture
@@ -45,3 +47,12 @@ def test_playlist(track: Track):
     assert isinstance(playlist.tracks, typing.Sequence)
     assert len(playlist.tracks) == 1
     assert playlist.tracks[0] == track
+
+
+def test_playlist_pickle(track: Track):
+    playlist = Playlist(PlaylistInfo("name", 1), [track], EMPTY_MAPPING)
+
+    unpickled_playlist = pickle.loads(pickle.dumps(playlist))
+
+    assert unpickled_playlist == playlist
+    assert unpickled_playlist.tracks[0] == track
@@ -1,8 +1,20 @@
 # ruff: noqa: D100, D101, D102, D103
 from __future__ import annotations
 
+import datetime
+import pickle
+from unittest import mock
+
+import hikari
+import pytest
+
+from ongaku import errors
+from ongaku.builders import EntityBuilder
+from ongaku.impl.track import LazyTrack
+from ongaku.impl.track import QueueEntry
 from ongaku.impl.track import Track
 from ongaku.impl.track import TrackInfo
+from ongaku.internal.types import EMPTY_MAPPING
 
 
 def test_track():
@@ -28,6 +40,81 @@ def test_track():
     assert track.requestor is None
 
 
+def test_queue_entry():
+    track_info = TrackInfo(
+        "identifier",
+        False,
+        "author",
+        1,
+        True,
+        2,
+        "title",
+        "source_name",
+        "uri",
+        "artwork_url",
+        "isrc",
+    )
+    track = Track("encoded", track_info, {"plugin": 1}, {"user": 2}, None)
+    enqueued_at = datetime.datetime.now(datetime.timezone.utc)
+    entry = QueueEntry(track, hikari.Snowflake(1234), 1, enqueued_at)
+
+    assert entry.track is track
+    assert entry.entry_id == 1
+    assert entry.enqueued_at == enqueued_at
+    assert entry.encoded == "encoded"
+    assert entry.info == track_info
+    assert entry.plugin_info == {"plugin": 1}
+    assert entry.user_data == {"user": 2}
+    assert entry.requestor == hikari.Snowflake(1234)
+    assert track.requestor is None
+
+
+def test_lazy_track():
+    builder = mock.Mock()
+    payload = {
+        "encoded": "encoded",
+        "info": {"identifier": "identifier"},
+        "pluginInfo": {"plugin": 1},
+        "userData": {"ongaku_requestor": "1234", "user": 2},
+    }
+    track = LazyTrack(payload, builder)
+
+    assert track.encoded == "encoded"
+    builder.build_track_info.assert_not_called()
+
+    assert track.info == builder.build_track_info.return_value
+    assert track.info == builder.build_track_info.return_value
+    builder.build_track_info.assert_called_once_with({"identifier": "identifier"})
+
+    assert track.plugin_info == {"plugin": 1}
+    assert track.requestor == hikari.Snowflake(1234)
+    assert track.user_data == {"user": 2}
+
+    # Once everything is built, the payload is released.
+    assert not track._payload
+
+
+def test_lazy_track_malformed():
+    builder = mock.Mock()
+    builder.build_track_info.side_effect = KeyError("identifier")
+
+    track = LazyTrack(
+        {"encoded": "encoded", "info": {}, "userData": {"ongaku_requestor": "user"}},
+        builder,
+    )
+
+    with pytest.raises(errors.BuildError) as exc_info:
+        track.info
+
+    assert isinstance(exc_info.value.exception, KeyError)
+
+    with pytest.raises(errors.BuildError):
+        track.plugin_info
+
+    with pytest.raises(errors.BuildError):
+        track.requestor
+
+
 def test_track_info():
     track_info = TrackInfo(
         "identifier",
@@ -54,3 +141,157 @@ def test_track_info():
     assert track_info.uri == "uri"
     assert track_info.artwork_url == "artwork_url"
     assert track_info.isrc == "isrc"
+
+
+def test_slots():
+    track_info = TrackInfo(
+        "identifier",
+        False,
+        "author",
+        1,
+        True,
+        2,
+        "title",
+        "source_name",
+        "uri",
+        "artwork_url",
+        "isrc",
+    )
+    track = Track("encoded", track_info, {}, {}, None)
+    entry = QueueEntry(track, None, 1, datetime.datetime.now(datetime.timezone.utc))
+
+    assert not hasattr(track_info, "__dict__")
+    assert not hasattr(track, "__dict__")
+    assert not hasattr(entry, "__dict__")
+
+
+def test_track_hash():
+    track_info = TrackInfo(
+        "identifier",
+        False,
+        "author",
+        1,
+        True,
+        2,
+        "title",
+        "source_name",
+        "uri",
+        "artwork_url",
+        "isrc",
+    )
+    track = Track("encoded", track_info, {}, {}, None)
+    same_track = Track("encoded", track_info, {}, {}, None)
+    requested_track = Track("encoded", track_info, {}, {}, hikari.Snowflake(1234))
+    other_track = Track("other_encoded", track_info, {}, {}, None)
+
+    assert track == same_track
+    assert hash(track) == hash(same_track)
+    assert len({track, same_track, other_track}) == 2
+    assert track in {same_track: 1}
+
+    assert track != requested_track
+    assert track.same_audio(requested_track)
+    assert not track.same_audio(other_track)
+
+
+def test_queue_entry_equality():
+    track_info = TrackInfo(
+        "identifier",
+        False,
+        "author",
+        1,
+        True,
+        2,
+        "title",
+        "source_name",
+        "uri",
+        "artwork_url",
+        "isrc",
+    )
+    track = Track("encoded", track_info, {}, {}, None)
+    enqueued_at = datetime.datetime.now(datetime.timezone.utc)
+    entry = QueueEntry(track, None, 1, enqueued_at)
+    same_entry = QueueEntry(track, None, 1, enqueued_at)
+    other_entry = QueueEntry(track, None, 2, enqueued_at)
+
+    assert entry == same_entry
+    assert entry != other_entry
+    assert entry.same_audio(other_entry)
+    assert entry.same_audio(track)
+    assert hash(entry) == hash(track)
+
+    # Entries are never equal to plain tracks, from either side.
+    assert entry != track
+    assert track != entry
+    assert len({entry, same_entry, other_entry}) == 2
+
+
+def test_pickle():
+    track_info = TrackInfo(
+        "identifier",
+        False,
+        "author",
+        1,
+        True,
+        2,
+        "title",
+        "source_name",
+        "uri",
+        "artwork_url",
+        "isrc",
+    )
+    track = Track("encoded", track_info, EMPTY_MAPPING, EMPTY_MAPPING, None)
+    requested_track = Track(
+        "encoded", track_info, {"plugin": 1}, {"user": 2}, hikari.Snowflake(1234)
+    )
+    entry = QueueEntry(
+        requested_track, None, 1, datetime.datetime.now(datetime.timezone.utc)
+    )
+
+    assert pickle.loads(pickle.dumps(track_info)) == track_info
+
+    unpickled_track = pickle.loads(pickle.dumps(track))
+
+    assert unpickled_track == track
+    assert unpickled_track.plugin_info is EMPTY_MAPPING
+    assert unpickled_track.user_data is EMPTY_MAPPING
+
+    unpickled_track = pickle.loads(pickle.dumps(requested_track))
+
+    assert unpickled_track == requested_track
+    assert unpickled_track.plugin_info == {"plugin": 1}
+    assert unpickled_track.user_data == {"user": 2}
+    assert unpickled_track.requestor == hikari.Snowflake(1234)
+
+    unpickled_entry = pickle.loads(pickle.dumps(entry))
+
+    assert unpickled_entry == entry
+    assert unpickled_entry.enqueued_at == entry.enqueued_at
+
+
+def test_pickle_lazy_track():
+    builder = EntityBuilder(lazy=True)
+    track = builder.build_track(
+        {
+            "encoded": "encoded",
+            "info": {
+                "identifier": "identifier",
+                "isSeekable": False,
+                "author": "author",
+                "length": 1,
+                "isStream": True,
+                "position": 2,
+                "title": "title",
+                "sourceName": "source_name",
+            },
+            "pluginInfo": {},
+            "userData": {"ongaku_requestor": "1234"},
+        }
+    )
+
+    unpickled_track = pickle.loads(pickle.dumps(track))
+
+    assert isinstance(unpickled_track, Track)
+    assert unpickled_track == track
+    assert unpickled_track.info == track.info
+    assert unpickled_track.requestor == hikari.Snowflake(1234)
@@ -0,0 +1,41 @@
+# ruff: noqa: D100, D101, D102, D103
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ongaku.internal.ratelimit import SlidingWindowRateLimiter
+
+
+class TestSlidingWindowRateLimiter:
+    def test_properties(self):
+        limiter = SlidingWindowRateLimiter(5, 10.0)
+
+        assert limiter.limit == 5
+        assert limiter.period == 10.0
+        assert limiter.remaining == 5
+
+        with pytest.raises(ValueError):
+            SlidingWindowRateLimiter(0, 10.0)
+
+    @pytest.mark.asyncio
+    async def test_acquire(self):
+        limiter = SlidingWindowRateLimiter(3, 0.2)
+
+        with pytest.raises(ValueError):
+            await limiter.acquire(4)
+
+        started = time.monotonic()
+
+        await limiter.acquire(2)
+        await limiter.acquire()
+
+        assert limiter.remaining == 0
+        assert time.monotonic() - started < 0.1
+
+        # The window is full, so this waits for the first acquisitions to expire.
+
+        await limiter.acquire(2)
+
+        assert time.monotonic() - started >= 0.2
@@ -0,0 +1,116 @@
+# ruff: noqa: D100, D101, D102, D103
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+from ongaku.builders import EntityBuilder
+from ongaku.internal.schema import Field
+from ongaku.internal.schema import compile_schema
+
+
+class Entity:
+    def __init__(
+        self,
+        name: str,
+        count: int,
+        child: Entity | None,
+        children: typing.Sequence[Entity],
+        note: str | None,
+    ) -> None:
+        self.name = name
+        self.count = count
+        self.child = child
+        self.children = children
+        self.note = note
+
+
+class Builder:
+    def build_child(self, payload: typing.Mapping[str, typing.Any]) -> str:
+        return payload["value"]
+
+
+SCHEMA = compile_schema(
+    Entity,
+    (
+        Field("name", "name"),
+        Field("count", "entityCount", converter=int),
+        Field("child", "child", optional=True, nested="build_child"),
+        Field(
+            "children", "children", optional=True, nested="build_child", sequence=True
+        ),
+        Field("note", "note", optional=True),
+    ),
+)
+
+
+class TestSchema:
+    def test_required(self):
+        entity = SCHEMA(Builder(), {"name": "entity", "entityCount": "5"})
+
+        assert entity.name == "entity"
+        assert entity.count == 5
+        assert entity.child is None
+        assert entity.children == []
+        assert entity.note is None
+
+    def test_optional(self):
+        entity = SCHEMA(
+            Builder(),
+            {
+                "name": "entity",
+                "entityCount": 5,
+                "child": {"value": "child"},
+                "children": [{"value": "first"}, {"value": "second"}],
+                "note": "note",
+            },
+        )
+
+        assert entity.child == "child"
+        assert entity.children == ["first", "second"]
+        assert entity.note == "note"
+
+    def test_missing_required(self):
+        with pytest.raises(KeyError):
+            SCHEMA(Builder(), {"name": "entity"})
+
+    def test_missing_field(self):
+        with pytest.raises(TypeError):
+            compile_schema(Entity, (Field("name", "name"),))
+
+    def test_unknown_field(self):
+        with pytest.raises(TypeError):
+            compile_schema(
+                Entity,
+                (
+                    Field("name", "name"),
+                    Field("count", "count"),
+                    Field("child", "child"),
+                    Field("children", "children"),
+                    Field("note", "note"),
+                    Field("unknown", "unknown"),
+                ),
+            )
+
+    def test_duplicate_field(self):
+        with pytest.raises(TypeError):
+            compile_schema(
+                Entity,
+                (
+                    Field("name", "name"),
+                    Field("name", "otherName"),
+                    Field("count", "count"),
+                    Field("child", "child"),
+                    Field("children", "children"),
+                    Field("note", "note"),
+                ),
+            )
+
+    def test_builder_name(self):
+        assert SCHEMA.__name__ == "build_Entity"
+
+    def test_entity_builder(self):
+        builder = EntityBuilder()
+
+        assert builder.build_session({"resuming": True, "timeout": 60}).timeout == 60
@@ -0,0 +1,65 @@
+# ruff: noqa: D100, D101, D102, D103
+from __future__ import annotations
+
+import pytest
+
+from ongaku.builders import EntityBuilder
+from ongaku.errors import RestExceptionError
+from ongaku.internal.converters import json_dumps
+from tests import payloads
+
+pytest.importorskip("msgspec")
+
+
+@pytest.fixture
+def builder() -> EntityBuilder:
+    return EntityBuilder(structs=False)
+
+
+@pytest.fixture
+def struct_builder() -> EntityBuilder:
+    return EntityBuilder(structs=True)
+
+
+class TestStructs:
+    def test_track(self, builder: EntityBuilder, struct_builder: EntityBuilder):
+        parsed_result = struct_builder.build_track(json_dumps(payloads.TRACK_PAYLOAD))
+
+        assert parsed_result == builder.build_track(payloads.TRACK_PAYLOAD)
+
+    def test_track_with_requestor(self, struct_builder: EntityBuilder):
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["userData"] = {"ongaku_requestor": "1234", "user": 1}
+
+        parsed_result = struct_builder.build_track(json_dumps(payload))
+
+        assert parsed_result.requestor == 1234
+        assert parsed_result.user_data == {"user": 1}
+
+    def test_playlist(self, builder: EntityBuilder, struct_builder: EntityBuilder):
+        parsed_result = struct_builder.build_playlist(
+            json_dumps(payloads.PLAYLIST_PAYLOAD)
+        )
+
+        assert parsed_result == builder.build_playlist(payloads.PLAYLIST_PAYLOAD)
+
+    def test_load_result(self, builder: EntityBuilder, struct_builder: EntityBuilder):
+        for load_type, data in (
+            ("search", [payloads.TRACK_PAYLOAD]),
+            ("track", payloads.TRACK_PAYLOAD),
+            ("playlist", payloads.PLAYLIST_PAYLOAD),
+            ("empty", {}),
+        ):
+            payload = {"loadType": load_type, "data": data}
+
+            assert struct_builder.build_load_result(
+                json_dumps(payload)
+            ) == builder.build_load_result(payload)
+
+    def test_load_result_error(self, struct_builder: EntityBuilder):
+        with pytest.raises(RestExceptionError):
+            struct_builder.build_load_result(
+                json_dumps(
+                    {"loadType": "error", "data": payloads.EXCEPTION_ERROR_PAYLOAD}
+                )
+            )
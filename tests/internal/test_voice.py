@@ -0,0 +1,180 @@
+# ruff: noqa: D100, D101, D102, D103
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+from hikari.events.voice_events import VoiceServerUpdateEvent
+from hikari.events.voice_events import VoiceStateUpdateEvent
+from hikari.snowflakes import Snowflake
+
+from ongaku.internal.voice import VoiceEventCollector
+from ongaku.internal.voice import VoiceStateScheduler
+
+
+def state_event(guild: int, user: int) -> VoiceStateUpdateEvent:
+    return VoiceStateUpdateEvent(
+        shard=mock.Mock(),
+        old_state=None,
+        state=mock.Mock(guild_id=Snowflake(guild), user_id=Snowflake(user)),
+    )
+
+
+def server_event(guild: int) -> VoiceServerUpdateEvent:
+    return VoiceServerUpdateEvent(
+        app=mock.Mock(),
+        shard=mock.Mock(),
+        guild_id=Snowflake(guild),
+        token="token",
+        raw_endpoint="raw_endpoint",
+    )
+
+
+class TestVoiceEventCollector:
+    def test_subscribe(self):
+        app = mock.Mock()
+
+        collector = VoiceEventCollector(app)
+
+        app.event_manager.subscribe.assert_any_call(
+            VoiceStateUpdateEvent, collector._state_event
+        )
+        app.event_manager.subscribe.assert_any_call(
+            VoiceServerUpdateEvent, collector._server_event
+        )
+
+    @pytest.mark.asyncio
+    async def test_expect(self):
+        collector = VoiceEventCollector(mock.Mock())
+
+        future = collector.expect(Snowflake(1), Snowflake(10))
+
+        # Events for other guilds and users are ignored.
+
+        await collector._state_event(state_event(2, 10))
+        await collector._state_event(state_event(1, 20))
+        await collector._server_event(server_event(2))
+
+        assert future.done() is False
+
+        state = state_event(1, 10)
+        server = server_event(1)
+
+        await collector._server_event(server)
+
+        assert future.done() is False
+
+        await collector._state_event(state)
+
+        assert await future == (state, server)
+
+        await asyncio.sleep(0)
+
+        assert collector._states == {}
+        assert collector._servers == {}
+
+    @pytest.mark.asyncio
+    async def test_expect_again(self):
+        collector = VoiceEventCollector(mock.Mock())
+
+        old_future = collector.expect(Snowflake(1), Snowflake(10))
+        future = collector.expect(Snowflake(1), Snowflake(10))
+
+        assert old_future.cancelled() is True
+
+        await asyncio.sleep(0)
+
+        # The newer future is still expecting the events.
+
+        assert len(collector._states) == 1
+        assert len(collector._servers) == 1
+
+        future.cancel()
+
+        await asyncio.sleep(0)
+
+        assert collector._states == {}
+        assert collector._servers == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent(self):
+        collector = VoiceEventCollector(mock.Mock())
+
+        futures = [
+            collector.expect(Snowflake(guild), Snowflake(10)) for guild in range(100)
+        ]
+
+        for guild in reversed(range(100)):
+            await collector._server_event(server_event(guild))
+            await collector._state_event(state_event(guild, 10))
+
+        for guild, future in enumerate(futures):
+            state, server = await future
+
+            assert state.guild_id == Snowflake(guild)
+            assert server.guild_id == Snowflake(guild)
+
+
+class TestVoiceStateScheduler:
+    @pytest.mark.asyncio
+    async def test_update(self):
+        app = mock.Mock(shard_count=2, update_voice_state=mock.AsyncMock())
+
+        scheduler = VoiceStateScheduler(app)
+
+        await scheduler.update(
+            Snowflake(1), Snowflake(10), self_mute=False, self_deaf=True
+        )
+        await scheduler.update(Snowflake(1 << 22), None)
+
+        assert app.update_voice_state.call_args_list == [
+            mock.call(Snowflake(1), Snowflake(10), self_mute=False, self_deaf=True),
+            mock.call(Snowflake(1 << 22), None),
+        ]
+
+        # Each shard has its own queue.
+
+        assert len(scheduler._shards) == 2
+
+        # Errors are raised to the caller.
+
+        app.update_voice_state.side_effect = Exception("Failed.")
+
+        with pytest.raises(Exception, match="Failed."):
+            await scheduler.update(Snowflake(1), None)
+
+    @pytest.mark.asyncio
+    async def test_superseded_and_priority(self):
+        app = mock.Mock(shard_count=1, update_voice_state=mock.AsyncMock())
+
+        scheduler = VoiceStateScheduler(app)
+
+        await asyncio.gather(
+            scheduler.update(Snowflake(1), Snowflake(10), priority=False),
+            scheduler.update(Snowflake(2), Snowflake(20)),
+            scheduler.update(Snowflake(1), Snowflake(11), priority=False),
+        )
+
+        # Priority updates are sent first, and the older update for a guild is not sent.
+
+        assert app.update_voice_state.call_args_list == [
+            mock.call(Snowflake(2), Snowflake(20)),
+            mock.call(Snowflake(1), Snowflake(11)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self):
+        app = mock.Mock(shard_count=1, update_voice_state=mock.AsyncMock())
+
+        scheduler = VoiceStateScheduler(app, limit=1, period=0.1)
+
+        started = time.monotonic()
+
+        await scheduler.update(Snowflake(1), Snowflake(10))
+        await scheduler.update(Snowflake(2), Snowflake(20))
+
+        assert time.monotonic() - started >= 0.1
+
+        assert app.update_voice_state.call_count == 2
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import datetime
+import gc
+import pickle
 import typing
 
 import hikari
@@ -14,6 +16,12 @@ from ongaku.abc.filters import BandType
 from ongaku.abc.routeplanner import IPBlockType
 from ongaku.abc.routeplanner import RoutePlannerType
 from ongaku.builders import EntityBuilder
+from ongaku.errors import BuildError
+from ongaku.errors import BulkBuildError
+from ongaku.errors import RestExceptionError
+from ongaku.impl.track import LazyTrack
+from ongaku.internal.structs import STRUCTS_AVAILABLE
+from ongaku.internal.types import EMPTY_MAPPING
 from tests import payloads
 
 if typing.TYPE_CHECKING:
@@ -30,6 +38,37 @@ def test_properties():
 
     assert builder._dumps == orjson.dumps
     assert builder._loads == orjson.loads
+    assert builder.uses_structs is STRUCTS_AVAILABLE
+    assert EntityBuilder(structs=False).uses_structs is False
+
+
+def test_lazy_structs():
+    lazy_builder = EntityBuilder(lazy=True)
+    eager_builder = EntityBuilder(lazy=False)
+
+    assert lazy_builder.uses_structs is False
+    assert eager_builder.uses_structs is STRUCTS_AVAILABLE
+
+    payload = orjson.dumps({"loadType": "track", "data": payloads.TRACK_PAYLOAD})
+
+    lazy_result = lazy_builder.build_load_result(payload)
+    eager_result = eager_builder.build_load_result(payload)
+
+    assert isinstance(lazy_result, LazyTrack)
+    assert not isinstance(eager_result, LazyTrack)
+    assert lazy_result == eager_result
+
+
+@pytest.mark.skipif(not STRUCTS_AVAILABLE, reason="msgspec is not installed.")
+def test_lazy_structs_conflict():
+    with pytest.raises(ValueError):
+        EntityBuilder(lazy=True, structs=True)
+
+
+@pytest.mark.skipif(STRUCTS_AVAILABLE, reason="msgspec is installed.")
+def test_structs_missing():
+    with pytest.raises(ImportError):
+        EntityBuilder(structs=True)
 
 
 class TestBuilderErrors:
@@ -53,6 +92,23 @@ class TestBuilderErrors:
         assert parsed_result.severity == SeverityType.COMMON
         assert parsed_result.cause == "cause"
 
+    def test_pickle_errors(self, builder: EntityBuilder):
+        rest_error = pickle.loads(
+            pickle.dumps(builder.build_rest_error(payloads.REST_ERROR_PAYLOAD))
+        )
+
+        assert rest_error.status == 2
+        assert rest_error.trace == "trace"
+
+        exception_error = pickle.loads(
+            pickle.dumps(
+                builder.build_exception_error(payloads.EXCEPTION_ERROR_PAYLOAD)
+            )
+        )
+
+        assert exception_error.severity == SeverityType.COMMON
+        assert exception_error.cause == "cause"
+
 
 class TestBuilderEvents:
     def test_build_ready_event(self, ongaku_session: Session, builder: EntityBuilder):
@@ -383,6 +439,15 @@ class TestBuilderPlaylist:
         assert len(parsed_result.tracks) == 1
         assert parsed_result.tracks[0] == builder.build_track(payloads.TRACK_PAYLOAD)
 
+    def test_build_playlist_lazy(self, builder: EntityBuilder):
+        parsed_result = EntityBuilder(lazy=True).build_playlist(
+            payloads.PLAYLIST_PAYLOAD
+        )
+
+        assert len(parsed_result.tracks) == 1
+        assert isinstance(parsed_result.tracks[0], LazyTrack)
+        assert parsed_result.tracks[0] == builder.build_track(payloads.TRACK_PAYLOAD)
+
     def test_build_playlist_info(self, builder: EntityBuilder):
         parsed_result = builder.build_playlist_info(payloads.PLAYLIST_INFO_PAYLOAD)
 
@@ -495,6 +560,46 @@ class TestBuilderStatistics:
         assert parsed_result.deficit == 3
 
 
+class TestBuilderLoadResult:
+    def test_build_load_result_empty(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result({"loadType": "empty", "data": {}})
+
+        assert parsed_result is None
+
+    def test_build_load_result_error(self, builder: EntityBuilder):
+        with pytest.raises(RestExceptionError) as rest_exception_error:
+            builder.build_load_result(
+                {"loadType": "error", "data": payloads.EXCEPTION_ERROR_PAYLOAD}
+            )
+
+        assert rest_exception_error.value.message == "message"
+
+    def test_build_load_result_search(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "search", "data": [payloads.TRACK_PAYLOAD]}
+        )
+
+        assert parsed_result == [builder.build_track(payloads.TRACK_PAYLOAD)]
+
+    def test_build_load_result_track(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+        )
+
+        assert parsed_result == builder.build_track(payloads.TRACK_PAYLOAD)
+
+    def test_build_load_result_playlist(self, builder: EntityBuilder):
+        parsed_result = builder.build_load_result(
+            {"loadType": "playlist", "data": payloads.PLAYLIST_PAYLOAD}
+        )
+
+        assert parsed_result == builder.build_playlist(payloads.PLAYLIST_PAYLOAD)
+
+    def test_build_load_result_unknown(self, builder: EntityBuilder):
+        with pytest.raises(BuildError):
+            builder.build_load_result({"loadType": "unknown", "data": {}})
+
+
 class TestBuilderTrack:
     def test_track(self, builder: EntityBuilder):
         parsed_result = builder.build_track(payloads.TRACK_PAYLOAD)
@@ -507,6 +612,81 @@ class TestBuilderTrack:
         assert parsed_result.user_data == {}
         assert parsed_result.requestor is None
 
+    def test_track_empty_mappings(self, builder: EntityBuilder):
+        first_result = builder.build_track(payloads.TRACK_PAYLOAD)
+        second_result = builder.build_track(payloads.TRACK_PAYLOAD)
+
+        assert first_result.plugin_info is EMPTY_MAPPING
+        assert first_result.user_data is EMPTY_MAPPING
+        assert second_result.plugin_info is first_result.plugin_info
+        assert second_result.user_data is first_result.user_data
+
+    def test_track_lazy(self, builder: EntityBuilder):
+        lazy_builder = EntityBuilder(lazy=True)
+
+        payload = dict(payloads.TRACK_PAYLOAD)
+
+        payload["userData"] = {"ongaku_requestor": "1234", "user": 1}
+        parsed_result = lazy_builder.build_track(payload)
+
+        assert isinstance(parsed_result, LazyTrack)
+        assert parsed_result.encoded == "encoded"
+        assert parsed_result._info is None
+        assert parsed_result._user_data is None
+
+        assert parsed_result.info == builder.build_track_info(
+            payloads.TRACK_INFO_PAYLOAD,
+        )
+        assert parsed_result.plugin_info is EMPTY_MAPPING
+        assert parsed_result.user_data == {"user": 1}
+        assert parsed_result.requestor == hikari.Snowflake(1234)
+        assert payload["userData"] == {"ongaku_requestor": "1234", "user": 1}
+
+        assert parsed_result == builder.build_track(payload)
+
+    def test_track_intern(self):
+        builder = EntityBuilder(intern=True)
+
+        first_result = builder.build_track(payloads.TRACK_PAYLOAD)
+
+        assert builder.intern_hit_ratio == 0
+        assert builder.intern_saved_bytes == 0
+
+        second_result = builder.build_track(payloads.TRACK_PAYLOAD)
+
+        assert second_result is first_result
+        assert builder.intern_hit_ratio == 0.5
+        assert builder.intern_saved_bytes > 0
+
+    def test_track_intern_user_data(self):
+        builder = EntityBuilder(intern=True)
+
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["userData"] = {"ongaku_requestor": "1234"}
+
+        first_result = builder.build_track(payloads.TRACK_PAYLOAD)
+        second_result = builder.build_track(payload)
+
+        assert second_result is not first_result
+        assert second_result.requestor == hikari.Snowflake(1234)
+        assert builder.intern_hit_ratio == 0
+
+    def test_track_intern_released(self):
+        builder = EntityBuilder(intern=True)
+
+        assert builder._intern_pool is not None
+
+        builder.build_track(payloads.TRACK_PAYLOAD)
+
+        gc.collect()
+
+        assert len(builder._intern_pool) == 0
+
+        parsed_result = builder.build_track(payloads.TRACK_PAYLOAD)
+
+        assert builder.intern_hit_ratio == 0
+        assert builder._intern_pool[parsed_result.encoded] is parsed_result
+
     def test_track_with_requestor(self, builder: EntityBuilder):
         payload = dict(payloads.TRACK_PAYLOAD)
 
@@ -521,6 +701,135 @@ class TestBuilderTrack:
         assert parsed_result.user_data == {}
         assert parsed_result.requestor == hikari.Snowflake(1234)
 
+    def test_build_tracks(self, builder: EntityBuilder):
+        parsed_result = builder.build_tracks([payloads.TRACK_PAYLOAD] * 3)
+
+        assert list(parsed_result) == [builder.build_track(payloads.TRACK_PAYLOAD)] * 3
+
+        assert parsed_result[0].plugin_info is EMPTY_MAPPING
+        assert parsed_result[0].user_data is EMPTY_MAPPING
+
+    def test_build_tracks_raw(self, builder: EntityBuilder):
+        parsed_result = builder.build_tracks(
+            orjson.dumps([payloads.TRACK_PAYLOAD] * 3).decode()
+        )
+
+        assert list(parsed_result) == [builder.build_track(payloads.TRACK_PAYLOAD)] * 3
+
+    def test_build_tracks_mapping(self, builder: EntityBuilder):
+        with pytest.raises(TypeError):
+            builder.build_tracks(orjson.dumps(payloads.TRACK_PAYLOAD).decode())
+
+    @pytest.mark.parametrize("raw", [False, True])
+    def test_build_tracks_failures(self, builder: EntityBuilder, raw: bool):
+        track_payloads = [
+            payloads.TRACK_PAYLOAD,
+            {"encoded": "encoded"},
+            payloads.TRACK_PAYLOAD,
+            "track",
+        ]
+
+        with pytest.raises(BulkBuildError) as bulk_build_error:
+            builder.build_tracks(
+                orjson.dumps(track_payloads).decode() if raw else track_payloads
+            )
+
+        assert isinstance(bulk_build_error.value, BuildError)
+        assert (
+            list(bulk_build_error.value.tracks)
+            == [builder.build_track(payloads.TRACK_PAYLOAD)] * 2
+        )
+        assert list(bulk_build_error.value.failures) == [1, 3]
+        assert isinstance(bulk_build_error.value.failures[1], KeyError)
+        assert bulk_build_error.value.exception is bulk_build_error.value.failures[1]
+        assert bulk_build_error.value.reason == "2 of 4 tracks failed to build."
+
+    def test_build_tracks_with_requestor(self, builder: EntityBuilder):
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["userData"] = {"ongaku_requestor": "1234", "user": 1}
+
+        parsed_result = builder.build_tracks([payload])
+
+        assert parsed_result[0].user_data == {"user": 1}
+        assert parsed_result[0].requestor == hikari.Snowflake(1234)
+
+    def test_build_tracks_retry(self, builder: EntityBuilder):
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["userData"] = {"ongaku_requestor": "1234", "user": 1}
+
+        track_payloads = [payload, {"encoded": "encoded"}]
+
+        for _ in range(2):
+            with pytest.raises(BulkBuildError) as bulk_build_error:
+                builder.build_tracks(track_payloads)
+
+            # The payloads are not modified, so a retry builds the same tracks.
+            assert bulk_build_error.value.tracks[0].user_data == {"user": 1}
+            assert bulk_build_error.value.tracks[0].requestor == hikari.Snowflake(1234)
+
+        assert payload["userData"] == {"ongaku_requestor": "1234", "user": 1}
+
+    def test_build_tracks_lazy(self):
+        builder = EntityBuilder(lazy=True)
+
+        parsed_result = builder.build_tracks([payloads.TRACK_PAYLOAD] * 2)
+
+        assert all(isinstance(track, LazyTrack) for track in parsed_result)
+        assert parsed_result[0].info == builder.build_track_info(
+            payloads.TRACK_INFO_PAYLOAD
+        )
+
+    def test_build_tracks_intern(self):
+        builder = EntityBuilder(intern=True)
+
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["userData"] = {"ongaku_requestor": "1234"}
+
+        parsed_result = builder.build_tracks(
+            [payloads.TRACK_PAYLOAD, payloads.TRACK_PAYLOAD, payload]
+        )
+
+        assert parsed_result[1] is parsed_result[0]
+        assert parsed_result[2] is not parsed_result[0]
+        assert parsed_result[2].requestor == hikari.Snowflake(1234)
+        assert builder.intern_hit_ratio == 0.5
+        assert builder.build_track(payloads.TRACK_PAYLOAD) is parsed_result[0]
+
+    def test_dump_tracks(self, builder: EntityBuilder):
+        payload = dict(payloads.TRACK_PAYLOAD)
+        payload["pluginInfo"] = {"plugin": 1}
+        payload["userData"] = {"ongaku_requestor": "1234", "user": 2}
+
+        tracks = [
+            builder.build_track(payloads.TRACK_PAYLOAD),
+            builder.build_track(payload),
+            EntityBuilder(lazy=True).build_track(payloads.TRACK_PAYLOAD),
+        ]
+
+        dumped = builder.dump_tracks(tracks)
+
+        assert isinstance(dumped, bytes)
+
+        parsed_result = builder.build_dumped_tracks(dumped)
+
+        assert list(parsed_result) == tracks
+        assert parsed_result[0].info == tracks[0].info
+        assert parsed_result[0].plugin_info is EMPTY_MAPPING
+        assert parsed_result[0].user_data is EMPTY_MAPPING
+        assert parsed_result[1].plugin_info == {"plugin": 1}
+        assert parsed_result[1].user_data == {"user": 2}
+        assert parsed_result[1].requestor == hikari.Snowflake(1234)
+
+    def test_dump_tracks_empty(self, builder: EntityBuilder):
+        assert builder.build_dumped_tracks(builder.dump_tracks([])) == []
+
+    @pytest.mark.parametrize(
+        "payload", [b"[2, []]", b"[1]", b'[1, [["encoded", [], null, null, null]]]']
+    )
+    def test_build_dumped_tracks_invalid(self, builder: EntityBuilder, payload: bytes):
+        with pytest.raises(BuildError):
+            builder.build_dumped_tracks(payload)
+
     def test_build_track_info(self, builder: EntityBuilder):
         parsed_result = builder.build_track_info(payloads.TRACK_INFO_PAYLOAD)
 
@@ -1,6 +1,7 @@
 # ruff: noqa: D100, D101, D102, D103
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -12,14 +13,20 @@ from tanjun.clients import Client as TanjunClient
 
 from ongaku import Player
 from ongaku import errors
+from ongaku import events
 from ongaku.abc.handler import SessionHandler
+from ongaku.abc.session import SessionStatus
 from ongaku.builders import EntityBuilder
 from ongaku.client import Client
+from ongaku.impl import player as player_
 from ongaku.rest import RESTClient
 
 if TYPE_CHECKING:
+    import pathlib
+
     from hikari.impl import gateway_bot as gateway_bot_
 
+    from ongaku.impl.track import Track
     from ongaku.session import Session
 
 
@@ -113,9 +120,9 @@ class TestClient:
             mock.patch.object(client, "_session_handler"),
             mock.patch.object(
                 client.session_handler,
-                "fetch_session",
+                "fetch_player_session",
                 return_value=ongaku_session,
-            ),
+            ) as patched_fetch_player_session,
             mock.patch.object(
                 client.session_handler,
                 "fetch_player",
@@ -129,6 +136,8 @@ class TestClient:
         ):
             player = client.create_player(1234567890)
 
+            patched_fetch_player_session.assert_called_once_with(Snowflake(1234567890))
+
             patched_add_player.assert_called_once()
 
             assert player.guild_id == Snowflake(1234567890)
@@ -139,7 +148,7 @@ class TestClient:
             mock.patch.object(client, "_session_handler"),
             mock.patch.object(
                 client.session_handler,
-                "fetch_session",
+                "fetch_player_session",
                 return_value=ongaku_session,
             ),
             mock.patch.object(
@@ -200,3 +209,182 @@ class TestClient:
             await client.session_handler.delete_player(Snowflake(1234567890))
 
             patched_delete_player.assert_called_once_with(Snowflake(1234567890))
+
+    @pytest.mark.asyncio
+    async def test_state(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        ongaku_track: Track,
+        tmp_path: pathlib.Path,
+    ):
+        state_file = tmp_path / "state.json"
+
+        # Save the sessions and players on shutdown.
+
+        client = Client(gateway_bot, state_file=state_file)
+
+        session = client.create_session("session")
+        session._session_id = "session_id"
+        session._status = SessionStatus.CONNECTED
+
+        client.create_session("not_connected")
+
+        player = client.create_player(Snowflake(1234567890))
+        player.add([ongaku_track, ongaku_track], requestor=Snowflake(1))
+        player._channel_id = Snowflake(987654321)
+        player.set_loop(True)
+        player.set_shuffle(True, seed=1234)
+
+        shuffle_keys = [player._shuffle_key(entry) for entry in player._queue]
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.update_session", new_callable=mock.AsyncMock
+            ) as patched_update_session,
+            mock.patch("ongaku.session.Session.stop", new_callable=mock.AsyncMock),
+        ):
+            await client._stop_event(mock.Mock())
+
+            patched_update_session.assert_called_once_with(
+                "session_id", resuming=True, timeout=60, session=session
+            )
+
+        assert state_file.exists()
+
+        # Resume the sessions on start up.
+
+        client = Client(gateway_bot, state_file=state_file)
+
+        session = client.create_session("session")
+
+        with mock.patch(
+            "ongaku.impl.handlers.BasicSessionHandler.start",
+            new_callable=mock.AsyncMock,
+        ):
+            await client._start_event(mock.Mock())
+
+        assert session.session_id == "session_id"
+
+        # Adopt the players, once the session is resumed.
+
+        state = player_.State(datetime.datetime.now(), 30, True, 2)
+        voice = player_.Voice("token", "endpoint", "session_id")
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.fetch_players",
+                new_callable=mock.AsyncMock,
+                return_value=[
+                    player_.Player(
+                        Snowflake(1234567890),
+                        ongaku_track,
+                        50,
+                        False,
+                        state,
+                        voice,
+                        None,
+                    )
+                ],
+            ) as patched_fetch_players,
+            mock.patch(
+                "ongaku.rest.RESTClient.decode_tracks",
+                new_callable=mock.AsyncMock,
+                return_value=[ongaku_track, ongaku_track],
+            ) as patched_decode_tracks,
+        ):
+            await client._ready_event(
+                events.ReadyEvent.from_session(session, True, "session_id")
+            )
+
+            patched_fetch_players.assert_called_once_with("session_id", session=session)
+            patched_decode_tracks.assert_called_once_with(
+                [ongaku_track.encoded, ongaku_track.encoded], session=session
+            )
+
+        player = client.fetch_player(Snowflake(1234567890))
+
+        assert player.session is session
+        assert player.is_alive is True
+        assert player.connected is True
+        assert player.volume == 50
+        assert player.voice == voice
+        assert player.channel_id == Snowflake(987654321)
+        assert player.loop is True
+        assert player.shuffle_seed == 1234
+        assert [player._shuffle_key(entry) for entry in player._queue] == shuffle_keys
+        assert [entry.track for entry in player.queue] == [ongaku_track, ongaku_track]
+        assert [entry.requestor for entry in player.queue] == [
+            Snowflake(1),
+            Snowflake(1),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "state",
+        [
+            "{}",
+            "[]",
+            '{"sessions": []}',
+            '{"sessions": {"session": {"players": []}}}',
+            '{"sessions": {"session": {"session_id": "session_id"}}}',
+            '{"sessions": {"session": {"session_id": 1, "players": []}}}',
+            '{"sessions": {"session": {"session_id": "session_id", "players": {}}}}',
+            '{"sessions": {"session": {"session_id": "session_id", "players": [{}]}}}',
+        ],
+    )
+    async def test_state_invalid(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        tmp_path: pathlib.Path,
+        state: str,
+    ):
+        state_file = tmp_path / "state.json"
+        state_file.write_text(state)
+
+        client = Client(gateway_bot, state_file=state_file)
+
+        session = client.create_session("session")
+
+        # The sessions still start, without resuming.
+        with mock.patch(
+            "ongaku.impl.handlers.BasicSessionHandler.start",
+            new_callable=mock.AsyncMock,
+        ) as patched_start:
+            await client._start_event(mock.Mock())
+
+            patched_start.assert_called_once()
+
+        assert session.session_id is None
+        assert len(client._saved_players) == 0
+
+    @pytest.mark.asyncio
+    async def test_state_not_resumed(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        tmp_path: pathlib.Path,
+    ):
+        state_file = tmp_path / "state.json"
+        state_file.write_text(
+            '{"sessions": {"session": {"session_id": "session_id", "players": []}}}'
+        )
+
+        client = Client(gateway_bot, state_file=state_file)
+
+        session = client.create_session("session")
+
+        with mock.patch(
+            "ongaku.impl.handlers.BasicSessionHandler.start",
+            new_callable=mock.AsyncMock,
+        ):
+            await client._start_event(mock.Mock())
+
+        with mock.patch(
+            "ongaku.rest.RESTClient.fetch_players", new_callable=mock.AsyncMock
+        ) as patched_fetch_players:
+            await client._ready_event(
+                events.ReadyEvent.from_session(session, False, "new_session_id")
+            )
+
+            patched_fetch_players.assert_not_called()
+
+        assert len(client.session_handler.players) == 0
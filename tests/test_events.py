@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import datetime
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import hikari
 
@@ -455,3 +456,84 @@ class TestQueueNextEvent:
         assert event.guild_id == hikari.Snowflake(1234567890)
         assert event.old_track == ongaku_track
         assert event.track == ongaku_track
+
+
+class TestSessionDrainEvent:
+    def test_event(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        event = events.SessionDrainEvent(
+            gateway_bot,
+            ongaku_client,
+            ongaku_session,
+            2,
+            3,
+        )
+
+        assert event.app == gateway_bot
+        assert event.client == ongaku_client
+        assert event.session == ongaku_session
+        assert event.moved == 2
+        assert event.remaining == 3
+
+    def test_from_session(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        event = events.SessionDrainEvent.from_session(ongaku_session, 2, 3)
+
+        assert event.app == gateway_bot
+        assert event.client == ongaku_client
+        assert event.session == ongaku_session
+        assert event.moved == 2
+        assert event.remaining == 3
+
+
+class TestSessionTransferEvent:
+    def test_event(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        new_session = mock.Mock()
+
+        event = events.SessionTransferEvent(
+            gateway_bot,
+            ongaku_client,
+            ongaku_session,
+            new_session,
+            2,
+            3,
+        )
+
+        assert event.app == gateway_bot
+        assert event.client == ongaku_client
+        assert event.session == ongaku_session
+        assert event.new_session == new_session
+        assert event.moved == 2
+        assert event.remaining == 3
+
+    def test_from_session(
+        self,
+        gateway_bot: gateway_bot_.GatewayBot,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        new_session = mock.Mock()
+
+        event = events.SessionTransferEvent.from_session(
+            ongaku_session, new_session, 2, 3
+        )
+
+        assert event.app == gateway_bot
+        assert event.client == ongaku_client
+        assert event.session == ongaku_session
+        assert event.new_session == new_session
+        assert event.moved == 2
+        assert event.remaining == 3
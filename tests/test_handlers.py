@@ -8,8 +8,16 @@ import pytest
 from hikari.snowflakes import Snowflake
 
 from ongaku import errors
+from ongaku import events
+from ongaku.abc.session import SessionHealth
 from ongaku.abc.session import SessionStatus
+from ongaku.impl.handlers import BalancedSessionHandler
 from ongaku.impl.handlers import BasicSessionHandler
+from ongaku.impl.handlers import ConsistentHashSessionHandler
+from ongaku.impl.handlers import RegionSessionHandler
+from ongaku.impl.statistics import Cpu
+from ongaku.impl.statistics import FrameStatistics
+from ongaku.impl.statistics import Memory
 from ongaku.player import Player
 from ongaku.session import Session
 
@@ -188,6 +196,56 @@ class TestBasicSessionHandler:
         with pytest.raises(errors.SessionMissingError):
             handler.fetch_session("session_1")
 
+    def test_fetch_session_health(self, ongaku_client: Client):
+        handler = BasicSessionHandler(ongaku_client)
+
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2", "session_3"):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        session_1, session_2, session_3 = sessions
+
+        assert handler.fetch_session() == session_1
+
+        # Degraded sessions are still used.
+
+        session_1._health = SessionHealth.DEGRADED
+
+        assert handler.fetch_session() == session_1
+
+        # Unhealthy sessions are replaced with the healthiest session.
+
+        session_1._health = SessionHealth.UNHEALTHY
+        session_2._health = SessionHealth.DEGRADED
+
+        assert handler.fetch_session() == session_3
+
+        assert handler._current_session == session_3
+
+        # Draining sessions are not used.
+
+        session_3._draining = True
+
+        assert handler.fetch_session() == session_2
+
+        # All sessions are unhealthy.
+
+        for session in sessions:
+            session._health = SessionHealth.UNHEALTHY
+
+        assert handler.fetch_session() in sessions
+
     @pytest.mark.asyncio
     async def test_delete_session(self, ongaku_client: Client, ongaku_session: Session):
         handler = BasicSessionHandler(ongaku_client)
@@ -243,6 +301,21 @@ class TestBasicSessionHandler:
         with pytest.raises(errors.UniqueError):
             handler.add_player(ongaku_player)
 
+        # Players that are no longer alive are replaced.
+
+        new_player = Player(ongaku_player.session, ongaku_player.guild_id)
+
+        ongaku_player.is_alive = True
+
+        with pytest.raises(errors.UniqueError):
+            handler.add_player(new_player)
+
+        ongaku_player.is_alive = False
+
+        handler.add_player(new_player)
+
+        assert handler.players == (new_player,)
+
     @pytest.mark.asyncio
     async def test_fetch_player(self, ongaku_client: Client, ongaku_session: Session):
         handler = BasicSessionHandler(ongaku_client)
@@ -313,3 +386,365 @@ class TestBasicSessionHandler:
             assert len(handler.players) == 0
 
             patched_player.assert_called_once()
+
+
+def statistics_event(
+    session: Session,
+    playing_players: int,
+    lavalink_load: float,
+    frame_statistics: FrameStatistics | None = None,
+) -> events.StatisticsEvent:
+    return events.StatisticsEvent.from_session(
+        session,
+        playing_players,
+        playing_players,
+        1000,
+        Memory(1, 2, 3, 4),
+        Cpu(4, 0.5, lavalink_load),
+        frame_statistics,
+    )
+
+
+class TestBalancedSessionHandler:
+    def create_sessions(
+        self, handler: BalancedSessionHandler, client: Client
+    ) -> tuple[Session, Session]:
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2"):
+            session = Session(
+                client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        return sessions[0], sessions[1]
+
+    @pytest.mark.asyncio
+    async def test_fetch_session(self, ongaku_client: Client):
+        handler = BalancedSessionHandler(ongaku_client)
+
+        with pytest.raises(errors.NoSessionsError):
+            handler.fetch_session()
+
+        session_1, session_2 = self.create_sessions(handler, ongaku_client)
+
+        # Least loaded session is picked.
+
+        await handler._statistics_event(statistics_event(session_1, 10, 0.5))
+        await handler._statistics_event(statistics_event(session_2, 2, 0.1))
+
+        assert handler.fetch_session() == session_2
+
+        # Frame issues are penalised.
+
+        await handler._statistics_event(
+            statistics_event(session_2, 2, 0.1, FrameStatistics(3000, 600, 600))
+        )
+
+        assert handler.fetch_session() == session_1
+
+        # Sessions that are not connected are skipped.
+
+        session_1._status = SessionStatus.FAILURE
+
+        assert handler.fetch_session() == session_2
+
+        # Healthier sessions are picked first.
+
+        session_1._status = SessionStatus.CONNECTED
+        session_1._health = SessionHealth.DEGRADED
+
+        assert handler.fetch_session() == session_2
+
+        session_2._health = SessionHealth.UNHEALTHY
+
+        assert handler.fetch_session() == session_1
+
+        # Test with name set
+
+        assert handler.fetch_session("session_1") == session_1
+
+    @pytest.mark.asyncio
+    async def test_players_since_statistics(self, ongaku_client: Client):
+        handler = BalancedSessionHandler(ongaku_client, cpu_weight=0)
+
+        session_1, session_2 = self.create_sessions(handler, ongaku_client)
+
+        await handler._statistics_event(statistics_event(session_1, 1, 0))
+        await handler._statistics_event(statistics_event(session_2, 2, 0))
+
+        assert handler.calculate_penalty(session_1) == 1
+
+        handler.add_player(Player(handler.fetch_session(), Snowflake(1)))
+        handler.add_player(Player(handler.fetch_session(), Snowflake(2)))
+
+        assert handler.calculate_penalty(session_1) == 3
+        assert handler.fetch_session() == session_2
+
+        # New statistics include the players.
+
+        await handler._statistics_event(statistics_event(session_1, 3, 0))
+
+        assert handler.calculate_penalty(session_1) == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_statistics(self, ongaku_client: Client):
+        handler = BalancedSessionHandler(ongaku_client, stale_after=60)
+
+        session_1, session_2 = self.create_sessions(handler, ongaku_client)
+
+        with mock.patch("ongaku.impl.handlers.time.monotonic", return_value=0):
+            await handler._statistics_event(statistics_event(session_1, 0, 0))
+            await handler._statistics_event(statistics_event(session_2, 50, 0.9))
+
+        handler.add_player(Player(session_1, Snowflake(1)))
+        handler.add_player(Player(session_1, Snowflake(2)))
+
+        with mock.patch("ongaku.impl.handlers.time.monotonic", return_value=30):
+            assert handler.fetch_session() == session_1
+
+        # Statistics are out of date, so only the players are counted.
+
+        with mock.patch("ongaku.impl.handlers.time.monotonic", return_value=61):
+            assert handler.calculate_penalty(session_1) == 2
+            assert handler.calculate_penalty(session_2) == 0
+            assert handler.fetch_session() == session_2
+
+    @pytest.mark.asyncio
+    async def test_delete_session(self, ongaku_client: Client):
+        handler = BalancedSessionHandler(ongaku_client)
+
+        session_1, _ = self.create_sessions(handler, ongaku_client)
+
+        await handler._statistics_event(statistics_event(session_1, 1, 0))
+
+        with mock.patch("ongaku.session.Session.stop", new_callable=mock.AsyncMock):
+            await handler.delete_session("session_1")
+
+        assert handler._statistics == {}
+
+        # Statistics for unknown sessions are ignored.
+
+        await handler._statistics_event(statistics_event(session_1, 1, 0))
+
+        assert handler._statistics == {}
+
+
+class TestRegionSessionHandler:
+    def test_fetch_region(self, ongaku_client: Client):
+        handler = RegionSessionHandler(ongaku_client, regions={"xyz": "custom"})
+
+        assert handler.fetch_region("c-fra06-7a6b5c4d.discord.media:443") == "europe"
+        assert handler.fetch_region("C-SYD01-7A6B5C4D.discord.media:443") == "sydney"
+        assert handler.fetch_region("us-east1234.discord.gg:443") == "us-east"
+        assert handler.fetch_region("c-xyz01-7a6b5c4d.discord.media:443") == "custom"
+        assert handler.fetch_region("c-abc01-7a6b5c4d.discord.media:443") is None
+        assert handler.fetch_region("localhost") is None
+
+    def test_fetch_voice_session(self, ongaku_client: Client):
+        handler = RegionSessionHandler(ongaku_client)
+
+        sessions: list[Session] = []
+
+        for name, region in (
+            ("session_1", "europe"),
+            ("session_2", "sydney"),
+            ("session_3", "sydney"),
+        ):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+                region,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        player = handler.add_player(Player(sessions[0], Snowflake(1)))
+        handler.add_player(Player(sessions[1], Snowflake(2)))
+
+        # Same region as the current session.
+
+        assert (
+            handler.fetch_voice_session(player, "c-fra06-1a.discord.media:443")
+            is sessions[0]
+        )
+
+        # The least used session in the region is picked.
+
+        assert (
+            handler.fetch_voice_session(player, "c-syd01-1a.discord.media:443")
+            is sessions[2]
+        )
+
+        # No connected session in the region, or an unknown region.
+
+        sessions[2]._status = SessionStatus.FAILURE
+
+        assert (
+            handler.fetch_voice_session(player, "c-syd01-1a.discord.media:443")
+            is sessions[1]
+        )
+        assert (
+            handler.fetch_voice_session(player, "c-gru01-1a.discord.media:443")
+            is sessions[0]
+        )
+        assert handler.fetch_voice_session(player, "localhost") is sessions[0]
+
+        # Unhealthy sessions are not used.
+
+        sessions[1]._health = SessionHealth.UNHEALTHY
+
+        assert (
+            handler.fetch_voice_session(player, "c-syd01-1a.discord.media:443")
+            is sessions[0]
+        )
+
+
+class TestConsistentHashSessionHandler:
+    def create_session(
+        self, handler: ConsistentHashSessionHandler, client: Client, name: str
+    ) -> Session:
+        session = Session(
+            client,
+            name,
+            False,
+            "127.0.0.1",
+            2333,
+            "youshallnotpass",
+            3,
+        )
+        session._status = SessionStatus.CONNECTED
+
+        return handler.add_session(session)
+
+    def test_replicas(self, ongaku_client: Client):
+        with pytest.raises(ValueError):
+            ConsistentHashSessionHandler(ongaku_client, replicas=0)
+
+    def test_fetch_player_session(self, ongaku_client: Client):
+        handler = ConsistentHashSessionHandler(ongaku_client)
+
+        with pytest.raises(errors.NoSessionsError):
+            handler.fetch_player_session(Snowflake(1))
+
+        for index in range(3):
+            self.create_session(handler, ongaku_client, f"session_{index}")
+
+        guilds = [Snowflake(guild) for guild in range(1000)]
+
+        assignments = {
+            guild: handler.fetch_player_session(guild).name for guild in guilds
+        }
+
+        # Guilds are spread across all sessions, and always land on the same one.
+
+        assert set(assignments.values()) == {"session_0", "session_1", "session_2"}
+
+        for guild in guilds:
+            assert handler.fetch_player_session(guild).name == assignments[guild]
+
+        # Adding a session only moves the guilds that now belong to it.
+
+        self.create_session(handler, ongaku_client, "session_3")
+
+        moved = [
+            guild
+            for guild in guilds
+            if handler.fetch_player_session(guild).name != assignments[guild]
+        ]
+
+        assert 0 < len(moved) < len(guilds) / 2
+
+        for guild in moved:
+            assert handler.fetch_player_session(guild).name == "session_3"
+
+    @pytest.mark.asyncio
+    async def test_unavailable_session(self, ongaku_client: Client):
+        handler = ConsistentHashSessionHandler(ongaku_client)
+
+        sessions = [
+            self.create_session(handler, ongaku_client, f"session_{index}")
+            for index in range(3)
+        ]
+
+        guilds = [Snowflake(guild) for guild in range(300)]
+
+        assignments = {
+            guild: handler.fetch_player_session(guild).name for guild in guilds
+        }
+
+        # Guilds on a failed session use the next session, the rest do not move.
+
+        sessions[0]._status = SessionStatus.FAILURE
+
+        for guild in guilds:
+            name = handler.fetch_player_session(guild).name
+
+            assert name != "session_0"
+
+            if assignments[guild] != "session_0":
+                assert name == assignments[guild]
+
+        # Deleting a session behaves the same.
+
+        with mock.patch("ongaku.session.Session.stop", new_callable=mock.AsyncMock):
+            await handler.delete_session("session_0")
+
+        sessions[0]._status = SessionStatus.CONNECTED
+
+        for guild in guilds:
+            assert handler.fetch_player_session(guild).name != "session_0"
+
+        # No sessions connected.
+
+        for session in sessions:
+            session._status = SessionStatus.FAILURE
+
+        with pytest.raises(errors.NoSessionsError):
+            handler.fetch_player_session(Snowflake(1))
+
+    def test_unhealthy_session(self, ongaku_client: Client):
+        handler = ConsistentHashSessionHandler(ongaku_client)
+
+        sessions = [
+            self.create_session(handler, ongaku_client, f"session_{index}")
+            for index in range(3)
+        ]
+
+        guilds = [Snowflake(guild) for guild in range(300)]
+
+        assignments = {
+            guild: handler.fetch_player_session(guild).name for guild in guilds
+        }
+
+        # Guilds on an unhealthy session use the next session.
+
+        sessions[0]._health = SessionHealth.UNHEALTHY
+
+        for guild in guilds:
+            name = handler.fetch_player_session(guild).name
+
+            assert name != "session_0"
+
+            if assignments[guild] != "session_0":
+                assert name == assignments[guild]
+
+        # If every session is unhealthy, the connected sessions are still used.
+
+        for session in sessions:
+            session._health = SessionHealth.UNHEALTHY
+
+        for guild in guilds:
+            assert handler.fetch_player_session(guild).name == assignments[guild]
@@ -1,10 +1,13 @@
 # ruff: noqa: D100, D101, D102, D103
 from __future__ import annotations
 
+import asyncio
 import datetime
+import itertools
 import typing
 from unittest import mock
 
+import hikari
 import pytest
 from hikari.events.voice_events import VoiceServerUpdateEvent
 from hikari.events.voice_events import VoiceStateUpdateEvent
@@ -13,46 +16,58 @@ from hikari.snowflakes import Snowflake
 from ongaku import errors
 from ongaku import events
 from ongaku.abc.events import TrackEndReasonType
+from ongaku.impl import filters as filters_
 from ongaku.impl import player as player_
 from ongaku.impl import playlist
 from ongaku.impl.player import Voice
 from ongaku.impl.track import Track
 from ongaku.impl.track import TrackInfo
+from ongaku.internal.voice import VoiceStateScheduler
 from ongaku.player import Player
 from ongaku.session import Session
 
 if typing.TYPE_CHECKING:
-    from hikari import Event
     from hikari.impl import gateway_bot as gateway_bot_
 
     from ongaku.abc.filters import Filters
     from ongaku.client import Client
 
 
-async def connect_events(
-    event_type: type[Event],
-    /,
-    timeout: float | None,
-):
-    if event_type == VoiceServerUpdateEvent:
-        return VoiceServerUpdateEvent(
-            app=mock.Mock(),
-            shard=mock.Mock(),
-            guild_id=Snowflake(1234567890),
-            token="token",
-            raw_endpoint="raw_endpoint",
-        )
+def connect_events(
+    client: Client, raw_endpoint: str | None = "raw_endpoint"
+) -> typing.Callable[..., typing.Awaitable[None]]:
+    async def update_voice_state(
+        guild: Snowflake, channel: Snowflake | None, **kwargs: typing.Any
+    ) -> None:
+        # Events for other guilds and users are ignored.
+        for guild_id, user_id in (
+            (Snowflake(1), client.app.get_me().id),
+            (guild, Snowflake(1)),
+            (guild, client.app.get_me().id),
+        ):
+            await client._voice_events._state_event(
+                VoiceStateUpdateEvent(
+                    shard=mock.Mock(),
+                    old_state=mock.Mock(),
+                    state=mock.Mock(
+                        guild_id=guild_id,
+                        user_id=user_id,
+                        session_id="session_id",
+                    ),
+                )
+            )
 
-    if event_type == VoiceStateUpdateEvent:
-        return VoiceStateUpdateEvent(
-            shard=mock.Mock(),
-            old_state=mock.Mock(),
-            state=mock.Mock(
-                session_id="session_id",
-            ),
+        await client._voice_events._server_event(
+            VoiceServerUpdateEvent(
+                app=mock.Mock(),
+                shard=mock.Mock(),
+                guild_id=guild,
+                token="token",
+                raw_endpoint=raw_endpoint,
+            )
         )
 
-    raise Exception("Invalid event requested.")
+    return update_voice_state
 
 
 class TestPlayer:
@@ -111,8 +126,8 @@ class TestPlayer:
                 ongaku_session.client.app,
                 "update_voice_state",
                 new_callable=mock.AsyncMock,
+                side_effect=connect_events(ongaku_session.client),
             ) as patched_voice_state,
-            mock.patch.object(new_player.app.event_manager, "wait_for", connect_events),
             mock.patch(
                 "ongaku.rest.RESTClient.update_player",
                 new_callable=mock.AsyncMock,
@@ -164,17 +179,127 @@ class TestPlayer:
                 ongaku_session.client.app,
                 "update_voice_state",
                 new_callable=mock.AsyncMock,
+                side_effect=connect_events(ongaku_session.client, None),
             ) as patched_voice_state,
+            pytest.raises(errors.PlayerConnectError),
+        ):
+            await new_player.connect(987654321)
+
+    @pytest.mark.asyncio
+    async def test_connect_voice_session(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        voice_session = mock.Mock(client=ongaku_session.client)
+        voice_session._get_session_id.return_value = "voice_session_id"
+
+        with (
             mock.patch.object(
-                new_player.app.event_manager,
-                "wait_for",
+                ongaku_session,
+                "_get_session_id",
+                return_value="session_id",
+            ),
+            mock.patch.object(
+                ongaku_session.client.app,
+                "update_voice_state",
                 new_callable=mock.AsyncMock,
-                return_value=mock.Mock(raw_endpoint=None),
+                side_effect=connect_events(ongaku_session.client),
             ),
-            pytest.raises(errors.PlayerConnectError),
+            mock.patch(
+                "ongaku.impl.handlers.BasicSessionHandler.fetch_voice_session",
+                return_value=voice_session,
+            ) as patched_fetch_voice_session,
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                new_callable=mock.AsyncMock,
+            ) as patched_update,
+            mock.patch(
+                "ongaku.rest.RESTClient.delete_player",
+                new_callable=mock.AsyncMock,
+            ) as patched_delete,
+        ):
+            await new_player.connect(987654321)
+
+            patched_fetch_voice_session.assert_called_once_with(
+                new_player, "raw_endpoint"
+            )
+
+            # The player was not alive, so there is nothing to delete.
+            patched_delete.assert_not_called()
+
+            patched_update.assert_called_once_with(
+                "voice_session_id",
+                Snowflake(1234567890),
+                voice=Voice("token", "raw_endpoint", "session_id"),
+                no_replace=False,
+                session=voice_session,
+            )
+
+            assert new_player.session is voice_session
+
+    @pytest.mark.asyncio
+    async def test_connect_voice_session_playing(
+        self, ongaku_session: Session, ongaku_track: Track
+    ):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.add([ongaku_track])
+        new_player._is_alive = True
+        new_player._is_paused = True
+        new_player._position = 1000
+        new_player._volume = 50
+        new_player._filters = filters_.Filters(volume=1.2)
+
+        voice_session = mock.Mock(client=ongaku_session.client)
+        voice_session._get_session_id.return_value = "voice_session_id"
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "_get_session_id",
+                return_value="session_id",
+            ),
+            mock.patch.object(
+                ongaku_session.client.app,
+                "update_voice_state",
+                new_callable=mock.AsyncMock,
+                side_effect=connect_events(ongaku_session.client),
+            ),
+            mock.patch(
+                "ongaku.impl.handlers.BasicSessionHandler.fetch_voice_session",
+                return_value=voice_session,
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                new_callable=mock.AsyncMock,
+            ) as patched_update,
+            mock.patch(
+                "ongaku.rest.RESTClient.delete_player",
+                new_callable=mock.AsyncMock,
+            ) as patched_delete,
+            mock.patch("ongaku.player.Player._update"),
         ):
             await new_player.connect(987654321)
 
+            patched_delete.assert_called_once_with(
+                "session_id", Snowflake(1234567890), session=ongaku_session
+            )
+
+            # The track keeps playing on the new session, from where it was.
+            patched_update.assert_called_once_with(
+                "voice_session_id",
+                Snowflake(1234567890),
+                track=new_player.queue[0],
+                position=1000,
+                volume=50,
+                paused=True,
+                filters=new_player._filters,
+                voice=Voice("token", "raw_endpoint", "session_id"),
+                no_replace=False,
+                session=voice_session,
+            )
+
+            assert new_player.session is voice_session
+
     @pytest.mark.asyncio
     async def test_disconnect(self, ongaku_session: Session):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -189,8 +314,8 @@ class TestPlayer:
                 ongaku_session.client.app,
                 "update_voice_state",
                 new_callable=mock.AsyncMock,
+                side_effect=connect_events(ongaku_session.client),
             ) as patched_voice_state,
-            mock.patch.object(new_player.app.event_manager, "wait_for", connect_events),
             mock.patch(
                 "ongaku.rest.RESTClient.update_player",
             ) as patched_update,
@@ -216,7 +341,17 @@ class TestPlayer:
                 session=ongaku_session,
             )
 
-            await new_player.disconnect()
+            with mock.patch(
+                "ongaku.internal.voice.VoiceStateScheduler.update",
+                autospec=True,
+                side_effect=VoiceStateScheduler.update,
+            ) as patched_scheduler_update:
+                await new_player.disconnect()
+
+            # Disconnecting does not hold up other players connecting.
+            patched_scheduler_update.assert_called_once_with(
+                mock.ANY, Snowflake(1234567890), None, priority=False
+            )
 
             patched_clear.assert_called_once()
 
@@ -265,7 +400,7 @@ class TestPlayer:
             patched_update.assert_called_once_with(
                 ongaku_session._get_session_id(),
                 Snowflake(1234567890),
-                track=ongaku_track,
+                track=new_player.queue[0],
                 no_replace=False,
                 session=ongaku_session,
             )
@@ -275,6 +410,8 @@ class TestPlayer:
             assert len(new_player.queue) == 1
 
             assert new_player.queue[0].requestor == Snowflake(123454321)
+            assert new_player.queue[0].track is ongaku_track
+            assert ongaku_track.requestor is None
 
         # No session_id
 
@@ -374,6 +511,26 @@ class TestPlayer:
         assert new_player.queue[4].requestor == Snowflake(333)
         assert new_player.queue[5].requestor is None
 
+        # The added tracks are never modified.
+
+        assert tracks[0].requestor is None
+        assert new_player.queue[1].track is tracks[0]
+
+        other_player = Player(ongaku_session, Snowflake(1234567890))
+
+        other_player.add(tracks, Snowflake(4444))
+
+        assert other_player.queue[0].requestor == Snowflake(4444)
+        assert new_player.queue[1].requestor == Snowflake(22)
+
+        # Re-adding an entry keeps its requestor, under a new entry.
+
+        other_player.add(new_player.queue[1])
+
+        assert other_player.queue[2].track is tracks[0]
+        assert other_player.queue[2].requestor == Snowflake(22)
+        assert other_player.queue[2].entry_id != new_player.queue[1].entry_id
+
     @pytest.mark.asyncio
     async def test_pause(self, ongaku_session: Session, ongaku_track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -467,12 +624,12 @@ class TestPlayer:
 
         new_player.add(tracks)
 
-        assert new_player.queue == tracks
+        assert [entry.track for entry in new_player.queue] == tracks
 
         new_player.shuffle()
 
         assert new_player.queue[0].encoded == tracks[0].encoded
-        assert new_player.queue != tracks
+        assert [entry.track for entry in new_player.queue] != tracks
 
         # Queue has 1 track
 
@@ -492,6 +649,125 @@ class TestPlayer:
         with pytest.raises(errors.PlayerQueueError):
             new_player.shuffle()
 
+    @pytest.mark.asyncio
+    async def test_set_shuffle(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        tracks: list[Track] = [
+            mock.Mock(encoded=f"test_track_{i}") for i in range(1, 10)
+        ]
+
+        new_player.add(tracks)
+
+        assert new_player.shuffled is False
+        assert new_player.shuffle_seed is None
+
+        assert new_player.set_shuffle(seed=1234) is True
+
+        assert new_player.shuffled is True
+        assert new_player.shuffle_seed == 1234
+
+        shuffled_tracks = [entry.track for entry in new_player.queue]
+
+        assert shuffled_tracks[0] is tracks[0]
+        assert shuffled_tracks != tracks
+        assert sorted(shuffled_tracks, key=lambda t: t.encoded) == tracks
+        assert [entry.track for entry in new_player._queue] == tracks
+
+        # The same seed results in the same order.
+
+        new_player.set_shuffle(True, seed=1234)
+
+        assert [entry.track for entry in new_player.queue] == shuffled_tracks
+
+        # Removing the current track, moves to the next shuffled track.
+
+        new_player.remove(0)
+
+        assert [entry.track for entry in new_player.queue] == shuffled_tracks[1:]
+
+        # Disabling restores the original order.
+
+        assert new_player.set_shuffle() is False
+
+        assert new_player.shuffle_seed is None
+        assert new_player.queue[0].track is shuffled_tracks[1]
+        assert [entry.track for entry in new_player.queue[1:]] == [
+            track for track in tracks[1:] if track is not shuffled_tracks[1]
+        ]
+
+    def test_set_shuffle_duplicates(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        tracks: list[Track] = [
+            mock.Mock(encoded=f"test_track_{i}") for i in range(1, 4)
+        ]
+
+        new_player.add(tracks * 3)
+
+        for seed in range(10):
+            new_player.set_shuffle(True, seed=seed)
+
+            shuffled_tracks = [entry.track for entry in new_player.queue]
+
+            # Identical tracks are not all played back to back.
+            assert (
+                sum(
+                    current is following
+                    for current, following in itertools.pairwise(shuffled_tracks)
+                )
+                < 6
+            )
+
+    def test_set_shuffle_large_seed(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.add([mock.Mock(encoded=f"test_track_{i}") for i in range(1, 10)])
+
+        assert new_player.set_shuffle(seed=10**70) is True
+
+        assert len(new_player.queue) == 9
+
+    def test_set_shuffle_add(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        tracks: list[Track] = [
+            mock.Mock(encoded=f"test_track_{i}") for i in range(1, 20)
+        ]
+
+        new_player.add(tracks[:10])
+
+        new_player.set_shuffle(seed=1234)
+
+        assert len(new_player.queue) == 10
+
+        shuffled_entries = list(new_player.queue)
+
+        # Adding to a shuffled queue, keeps the order of the entries already in it.
+
+        new_player.remove(3)
+        new_player.add(tracks[10:])
+
+        assert [entry for entry in new_player.queue if entry in shuffled_entries] == [
+            entry for entry in shuffled_entries if entry is not shuffled_entries[3]
+        ]
+
+        # Shuffling the queue again results in the same order.
+
+        queue = list(new_player.queue)
+
+        new_player._shuffle_queue = None
+
+        assert list(new_player.queue) == queue
+
+        new_player.set_shuffle(True, seed=1234)
+
+        assert list(new_player.queue) == queue
+
+        # No two entries share a key, even after tracks before them are removed.
+
+        assert len({new_player._shuffle_key(entry) for entry in queue}) == len(queue)
+
     @pytest.mark.asyncio
     async def test_skip(self, ongaku_session: Session):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -527,6 +803,8 @@ class TestPlayer:
 
             new_player.add(tracks)
 
+            entries = list(new_player.queue)
+
             # Skip to new song.
 
             await new_player.skip()
@@ -534,7 +812,7 @@ class TestPlayer:
             patched_update.assert_called_with(
                 ongaku_session._get_session_id(),
                 Snowflake(1234567890),
-                track=tracks[1],
+                track=entries[1],
                 no_replace=False,
                 session=ongaku_session,
             )
@@ -555,6 +833,138 @@ class TestPlayer:
 
             assert len(new_player.queue) == 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_commands(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        sent_tracks: list[typing.Any] = []
+
+        async def update_player(*args: typing.Any, **kwargs: typing.Any):
+            sent_tracks.append(kwargs.get("track"))
+            await asyncio.sleep(0.01)
+            return player_.Player(
+                Snowflake(1234567890),
+                None,
+                3,
+                False,
+                mock.Mock(),
+                mock.Mock(),
+                mock.Mock(),
+            )
+
+        tracks: list[Track] = [
+            mock.Mock(encoded="test_track_1"),
+            mock.Mock(encoded="test_track_2"),
+            mock.Mock(encoded="test_track_3"),
+        ]
+
+        new_player.add(tracks)
+
+        event = events.TrackEndEvent.from_session(
+            ongaku_session,
+            Snowflake(1234567890),
+            track=tracks[0],
+            reason=TrackEndReasonType.FINISHED,
+        )
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "_get_session_id",
+                return_value="session_id",
+            ),
+            mock.patch.object(
+                new_player,
+                "_channel_id",
+                return_value=Snowflake(987654321),
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player", update_player),
+        ):
+            # Two skips, and an autoplay for the first track, at the same time.
+            await asyncio.gather(
+                new_player.skip(),
+                new_player._track_end_event(event),
+                new_player.skip(),
+            )
+
+        assert [entry.track for entry in sent_tracks] == [tracks[1], tracks[2]]
+        assert [entry.track for entry in new_player.queue] == [tracks[2]]
+
+    @pytest.mark.asyncio
+    async def test_add_during_skip(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        sent_tracks: list[typing.Any] = []
+        updating = asyncio.Event()
+        release = asyncio.Event()
+
+        async def update_player(*args: typing.Any, **kwargs: typing.Any):
+            sent_tracks.append(kwargs.get("track"))
+            updating.set()
+            await release.wait()
+            return player_.Player(
+                Snowflake(1234567890),
+                None,
+                3,
+                False,
+                mock.Mock(),
+                mock.Mock(),
+                mock.Mock(),
+            )
+
+        tracks: list[Track] = [
+            mock.Mock(encoded="test_track_1"),
+            mock.Mock(encoded="test_track_2"),
+            mock.Mock(encoded="test_track_3"),
+        ]
+
+        new_player.add(tracks)
+        new_player.set_shuffle(True, seed=1234)
+
+        entries = list(new_player.queue)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "_get_session_id",
+                return_value="session_id",
+            ),
+            mock.patch.object(
+                new_player,
+                "_channel_id",
+                return_value=Snowflake(987654321),
+            ),
+            mock.patch("ongaku.rest.RESTClient.update_player", update_player),
+        ):
+            skip = asyncio.create_task(new_player.skip())
+
+            # The skip has changed the queue, and is waiting on lavalink.
+            await updating.wait()
+
+            new_track: Track = mock.Mock(encoded="test_track_4")
+
+            new_player.add([new_track])
+
+            release.set()
+            await skip
+
+        assert sent_tracks == [entries[1]]
+        assert new_player.queue[0] is entries[1]
+        assert len(new_player.queue) == 3
+        assert {entry.track for entry in new_player.queue} == {
+            tracks[1],
+            tracks[2],
+            new_track,
+        }
+
+        new_player.set_shuffle(False)
+
+        assert [entry.track for entry in new_player.queue] == [
+            tracks[1],
+            tracks[2],
+            new_track,
+        ]
+
     @pytest.mark.asyncio
     async def test_remove(self, ongaku_session: Session, ongaku_track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -575,14 +985,18 @@ class TestPlayer:
         new_player.remove(ongaku_track)
 
         assert len(new_player.queue) == 3
-        assert new_player.queue == [tracks[0], tracks[1], tracks[3]]
+        assert [entry.track for entry in new_player.queue] == [
+            tracks[0],
+            tracks[1],
+            tracks[3],
+        ]
 
         # Remove track based on position
 
         new_player.remove(1)
 
         assert len(new_player.queue) == 2
-        assert new_player.queue == [tracks[0], tracks[3]]
+        assert [entry.track for entry in new_player.queue] == [tracks[0], tracks[3]]
 
         # Test empty queue
 
@@ -601,6 +1015,29 @@ class TestPlayer:
         with pytest.raises(errors.PlayerQueueError):
             new_player.remove(ongaku_track)
 
+    @pytest.mark.asyncio
+    async def test_remove_with_requestor(
+        self, ongaku_session: Session, ongaku_track: Track
+    ):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        other_track = mock.Mock(encoded="test_encoded_1")
+
+        new_player.add([other_track])
+        new_player.add(ongaku_track, requestor=Snowflake(1234))
+
+        new_player.remove(ongaku_track)
+
+        assert [entry.track for entry in new_player.queue] == [other_track]
+
+        new_player.add(ongaku_track, requestor=Snowflake(1234))
+
+        entry = new_player.queue[1]
+
+        new_player.remove(entry)
+
+        assert [entry.track for entry in new_player.queue] == [other_track]
+
     @pytest.mark.asyncio
     async def test_clear(self, ongaku_session: Session, ongaku_track: Track):
         new_player = Player(ongaku_session, Snowflake(1234567890))
@@ -861,87 +1298,109 @@ class TestPlayer:
 
         new_player.add(tracks)
 
-        new_player = await new_player.transfer(new_session)
-
-        assert new_player.queue == new_player.queue
-
-        # Test connected.
-
         with (
             mock.patch.object(
                 ongaku_session,
                 "_get_session_id",
                 return_value="session_id",
             ),
+            mock.patch("ongaku.rest.RESTClient.update_player") as patched_update,
+            mock.patch("ongaku.rest.RESTClient.delete_player") as patched_delete,
+        ):
+            transferred_player = await new_player.transfer(new_session)
+
+            patched_update.assert_not_called()
+
+            # No player is left behind on the old session.
+            patched_delete.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                session=ongaku_session,
+            )
+
+        assert transferred_player.session is new_session
+        assert [entry.track for entry in transferred_player.queue] == tracks
+        assert len(new_player.queue) == 0
+
+        # Test connected.
+
+        state = player_.State(datetime.datetime.now(), 30, True, 2)
+        voice = Voice("token", "endpoint", "session_id")
+
+        old_player = Player(ongaku_session, Snowflake(1234567890))
+        old_player.add(tracks)
+
+        old_player._connected = True
+        old_player._is_alive = True
+        old_player._is_paused = False
+        old_player._volume = 50
+        old_player._voice = voice
+        old_player._channel_id = Snowflake(987654321)
+        old_player.set_loop(True)
+
+        with (
             mock.patch(
                 "ongaku.session.Session._get_session_id",
+                return_value="new_session_id",
+            ),
+            mock.patch.object(
+                ongaku_session,
+                "_get_session_id",
                 return_value="session_id",
             ),
             mock.patch.object(
                 new_session.client.app,
                 "update_voice_state",
                 new_callable=mock.AsyncMock,
-            ),
-            mock.patch.object(
-                new_session.app.event_manager,
-                "wait_for",
-                connect_events,
+            ) as patched_update_voice_state,
+            mock.patch(
+                "ongaku.player.Player.position",
+                new_callable=mock.PropertyMock(return_value=30),
             ),
             mock.patch(
                 "ongaku.rest.RESTClient.update_player",
+                return_value=player_.Player(
+                    Snowflake(1234567890), None, 50, False, state, voice, None
+                ),
             ) as patched_update,
-            mock.patch.object(
-                new_player,
-                "_connected",
-                new_callable=mock.PropertyMock(return_value=True),
-            ),
-            mock.patch.object(
-                new_player,
-                "_is_paused",
-                new_callable=mock.PropertyMock(return_value=False),
-            ),
-            mock.patch.object(
-                new_player,
-                "_position",
-                new_callable=mock.PropertyMock(return_value=30),
-            ),
-            mock.patch.object(
-                new_player,
-                "_channel_id",
-                return_value=Snowflake(987654321),
-            ),
-            mock.patch("ongaku.player.Player.disconnect") as patch_disconnect,
+            mock.patch("ongaku.rest.RESTClient.delete_player") as patched_delete,
         ):
-            new_player = await new_player.transfer(new_session)
+            new_player = await old_player.transfer(new_session)
 
-            patch_disconnect.assert_called_once()
-
-            # Check .connect() method of the new player was called.
-            patched_update.assert_any_call(
-                ongaku_session._get_session_id(),
+            # The player is created on the new session in one request.
+            patched_update.assert_called_once_with(
+                "new_session_id",
                 Snowflake(1234567890),
-                voice=Voice("token", "raw_endpoint", "session_id"),
+                track=new_player.queue[0],
+                position=30,
+                volume=50,
+                paused=False,
+                filters=hikari.UNDEFINED,
+                voice=voice,
                 no_replace=False,
                 session=new_session,
             )
 
-            # Check .play() method of the new player was called.
-            patched_update.assert_any_call(
-                ongaku_session._get_session_id(),
+            # The old player is destroyed, without touching the gateway.
+            patched_delete.assert_called_once_with(
+                "session_id",
                 Snowflake(1234567890),
-                track=tracks[0],
-                no_replace=False,
-                session=new_session,
+                session=ongaku_session,
             )
 
-            # Check .set_position() method of the new player was called.
-            patched_update.assert_any_call(
-                ongaku_session._get_session_id(),
-                Snowflake(1234567890),
-                position=30,
-                no_replace=False,
-                session=new_session,
-            )
+            patched_update_voice_state.assert_not_called()
+
+        assert new_player.session is new_session
+        assert new_player.is_alive is True
+        assert new_player.connected is True
+        assert new_player.voice == voice
+        assert new_player.channel_id == Snowflake(987654321)
+        assert new_player.loop is True
+        assert [entry.track for entry in new_player.queue] == tracks
+
+        assert old_player.session is ongaku_session
+        assert old_player.is_alive is False
+        assert len(old_player.queue) == 0
 
     @pytest.mark.asyncio
     async def test_update(self, ongaku_session: Session, ongaku_filters: Filters):
@@ -994,6 +1453,66 @@ class TestPlayer:
         assert new_player.state == state
         assert new_player.connected is True
 
+    @pytest.mark.asyncio
+    async def test_position(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        track_info = TrackInfo(
+            "identifier",
+            True,
+            "author",
+            100,
+            False,
+            0,
+            "title",
+            "source_name",
+            "uri",
+            "artwork_url",
+            "isrc",
+        )
+
+        new_player.add(Track("encoded", track_info, {}, {}, None))
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=0.0):
+            await new_player._player_update_event(
+                events.PlayerUpdateEvent.from_session(
+                    ongaku_session,
+                    Snowflake(1234567890),
+                    player_.State(datetime.datetime.now(), 20, True, 2),
+                )
+            )
+
+        # Paused, so the position does not move.
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=0.05):
+            assert new_player.position == 20
+
+        new_player._is_paused = False
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=0.05):
+            assert new_player.position == 70
+
+        # Timescale speed and rate are accounted for.
+
+        new_player._filters = filters_.Filters(
+            timescale=filters_.Timescale(2, None, 0.5)
+        )
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=0.05):
+            assert new_player.position == 70
+
+        new_player._filters = filters_.Filters(
+            timescale=filters_.Timescale(1.5, None, None)
+        )
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=0.04):
+            assert new_player.position == 80
+
+        # Never goes past the length of the track.
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=10.0):
+            assert new_player.position == track_info.length
+
 
 class TestPlayerTrackEndEvent:
     @pytest.mark.asyncio
@@ -1216,7 +1735,7 @@ class TestPlayerTrackEndEvent:
         event = events.TrackEndEvent.from_session(
             ongaku_session,
             Snowflake(1234567890),
-            track=mock.Mock(encoded="encoded"),
+            track=ongaku_track,
             reason=TrackEndReasonType.FINISHED,
         )
 
@@ -1237,7 +1756,7 @@ class TestPlayerTrackEndEvent:
             new_player.add(ongaku_track)
 
             assert len(new_player.queue) == 1
-            assert new_player.queue[0] == ongaku_track
+            assert new_player.queue[0].track == ongaku_track
 
             await new_player._track_end_event(event)
 
@@ -1252,7 +1771,7 @@ class TestPlayerTrackEndEvent:
         event = events.TrackEndEvent.from_session(
             ongaku_session,
             Snowflake(1234567890),
-            track=mock.Mock(encoded="encoded"),
+            track=mock.Mock(encoded="encoded_1"),
             reason=TrackEndReasonType.FINISHED,
         )
 
@@ -1304,7 +1823,7 @@ class TestPlayerTrackEndEvent:
         event = events.TrackEndEvent.from_session(
             ongaku_session,
             Snowflake(1234567890),
-            track=mock.Mock(encoded="encoded"),
+            track=ongaku_track,
             reason=TrackEndReasonType.LOADFAILED,
         )
 
@@ -1325,7 +1844,7 @@ class TestPlayerTrackEndEvent:
             new_player.add(ongaku_track)
 
             assert len(new_player.queue) == 1
-            assert new_player.queue[0] == ongaku_track
+            assert new_player.queue[0].track == ongaku_track
 
             await new_player._track_end_event(event)
 
@@ -1340,7 +1859,7 @@ class TestPlayerTrackEndEvent:
         event = events.TrackEndEvent.from_session(
             ongaku_session,
             Snowflake(1234567890),
-            track=mock.Mock(encoded="encoded"),
+            track=mock.Mock(encoded="encoded_1"),
             reason=TrackEndReasonType.LOADFAILED,
         )
 
@@ -1380,3 +1899,200 @@ class TestPlayerTrackEndEvent:
             assert len(new_player.queue) == 1
 
             assert new_player.queue[0].encoded == "encoded_2"
+
+
+class TestPlayerPrefetch:
+    @pytest.mark.asyncio
+    async def test_set_prefetch(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        assert new_player.prefetch is False
+
+        assert new_player.set_prefetch() is True
+        assert new_player.set_prefetch(True) is True
+        assert new_player.set_prefetch(False) is False
+
+    @pytest.mark.asyncio
+    async def test_prefetch_valid(self, ongaku_session: Session, ongaku_track: Track):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.set_prefetch(True)
+
+        new_player.add([ongaku_track, ongaku_track])
+
+        entry = new_player.queue[1]
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.decode_track",
+                new_callable=mock.AsyncMock,
+                return_value=ongaku_track,
+            ) as patched_decode,
+            mock.patch(
+                "ongaku.rest.RESTClient.load_track",
+                new_callable=mock.AsyncMock,
+            ) as patched_load,
+        ):
+            await new_player._track_start_event(
+                events.TrackStartEvent.from_session(
+                    ongaku_session, Snowflake(1234567890), ongaku_track
+                )
+            )
+
+            patched_decode.assert_called_once_with(
+                ongaku_track.encoded, session=ongaku_session
+            )
+            patched_load.assert_not_called()
+
+        assert new_player.queue[1] is entry
+
+    @pytest.mark.asyncio
+    async def test_prefetch_malformed(
+        self,
+        ongaku_session: Session,
+        ongaku_track: Track,
+        ongaku_track_info: TrackInfo,
+    ):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.set_prefetch(True)
+
+        malformed_track = Track("malformed", ongaku_track_info, {}, {}, None)
+        resolved_track = Track("resolved", ongaku_track_info, {}, {}, None)
+
+        new_player.add(ongaku_track)
+        new_player.add(malformed_track, Snowflake(1234))
+
+        entry = new_player.queue[1]
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.decode_track",
+                new_callable=mock.AsyncMock,
+                side_effect=errors.RestStatusError(400, "Bad Request"),
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.load_track",
+                new_callable=mock.AsyncMock,
+                return_value=resolved_track,
+            ) as patched_load,
+        ):
+            await new_player._track_start_event(
+                events.TrackStartEvent.from_session(
+                    ongaku_session, Snowflake(1234567890), ongaku_track
+                )
+            )
+
+            patched_load.assert_called_once_with(
+                ongaku_track_info.uri, session=ongaku_session
+            )
+
+        assert new_player.queue[1].track is resolved_track
+        assert new_player.queue[1].requestor == Snowflake(1234)
+        assert new_player.queue[1].entry_id == entry.entry_id
+
+    @pytest.mark.asyncio
+    async def test_prefetch_failed(
+        self,
+        ongaku_session: Session,
+        ongaku_track: Track,
+        ongaku_track_info: TrackInfo,
+    ):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.set_prefetch(True)
+
+        malformed_track = Track("malformed", ongaku_track_info, {}, {}, None)
+
+        new_player.add([ongaku_track, malformed_track])
+
+        entry = new_player.queue[1]
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.decode_track",
+                new_callable=mock.AsyncMock,
+                side_effect=errors.BuildError(None, "Failed to build."),
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.load_track",
+                new_callable=mock.AsyncMock,
+                side_effect=errors.BuildError(None, "Failed to build."),
+            ) as patched_load,
+        ):
+            await new_player._track_start_event(
+                events.TrackStartEvent.from_session(
+                    ongaku_session, Snowflake(1234567890), ongaku_track
+                )
+            )
+
+            patched_load.assert_called_once_with(
+                ongaku_track_info.uri, session=ongaku_session
+            )
+
+        assert new_player.queue[1] is entry
+
+    @pytest.mark.asyncio
+    async def test_transition_gap(self, ongaku_session: Session):
+        new_player = Player(ongaku_session, Snowflake(1234567890))
+
+        new_player.set_prefetch(True)
+
+        tracks: list[Track] = [
+            mock.Mock(encoded="encoded_1"),
+            mock.Mock(encoded="encoded_2"),
+        ]
+
+        new_player.add(tracks)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "_get_session_id",
+                return_value="session_id",
+            ),
+            mock.patch.object(
+                ongaku_session.client.app.event_manager,
+                "dispatch",
+            ),
+            mock.patch(
+                "ongaku.rest.RESTClient.update_player",
+                return_value=player_.Player(
+                    Snowflake(1234567890),
+                    None,
+                    3,
+                    False,
+                    mock.Mock(),
+                    mock.Mock(),
+                    mock.Mock(),
+                ),
+            ) as patched_update,
+            mock.patch("ongaku.player.time.monotonic", return_value=1.0),
+        ):
+            await new_player._track_end_event(
+                events.TrackEndEvent.from_session(
+                    ongaku_session,
+                    Snowflake(1234567890),
+                    tracks[0],
+                    TrackEndReasonType.FINISHED,
+                )
+            )
+
+            patched_update.assert_called_once_with(
+                "session_id",
+                Snowflake(1234567890),
+                track=new_player.queue[0],
+                no_replace=True,
+                session=ongaku_session,
+            )
+
+        assert new_player.transition_gap is None
+
+        with mock.patch("ongaku.player.time.monotonic", return_value=1.25):
+            await new_player._track_start_event(
+                events.TrackStartEvent.from_session(
+                    ongaku_session, Snowflake(1234567890), tracks[1]
+                )
+            )
+
+        assert new_player.transition_gap == 250
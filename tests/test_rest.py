@@ -1,6 +1,7 @@
 # ruff: noqa: D100, D101, D102, D103
 from __future__ import annotations
 
+import asyncio
 import typing
 from unittest import mock
 
@@ -9,8 +10,13 @@ from hikari.snowflakes import Snowflake
 
 from ongaku import Playlist
 from ongaku import errors
+from ongaku.abc import PlaylistInfo
 from ongaku.abc.track import Track
 from ongaku.impl import player as player
+from ongaku.internal.converters import json_dumps
+from ongaku.internal.converters import json_loads
+from ongaku.internal.structs import STRUCTS_AVAILABLE
+from ongaku.rest import DEFAULT_OFFLOAD_THRESHOLD
 from ongaku.rest import RESTClient
 from tests import payloads
 
@@ -24,9 +30,124 @@ def test_properties(ongaku_client: Client):
     rest = RESTClient(ongaku_client)
 
     assert rest._client == ongaku_client
+    assert rest.offload_threshold == DEFAULT_OFFLOAD_THRESHOLD
+
+    rest = RESTClient(ongaku_client, offload_threshold=None)
+
+    assert rest.offload_threshold is None
 
 
 class TestRestTrack:
+    @pytest.fixture(autouse=True)
+    def mapping_backend(self) -> typing.Iterator[None]:
+        # These tests return decoded mappings, so the struct backend is disabled, even if msgspec is installed.
+        with mock.patch(
+            "ongaku.builders.EntityBuilder.uses_structs",
+            new_callable=mock.PropertyMock,
+            return_value=False,
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not STRUCTS_AVAILABLE, reason="msgspec is not installed.")
+    async def test_load_track_with_structs(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with (
+            mock.patch(
+                "ongaku.builders.EntityBuilder.uses_structs",
+                new_callable=mock.PropertyMock,
+                return_value=True,
+            ),
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps(
+                    {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+                ).decode(),
+            ) as patched_request,
+        ):
+            new_track = await rest.load_track(
+                "https://youtube.com/watch?v=video",
+                session=ongaku_session,
+            )
+
+            patched_request.assert_called_once_with(
+                "GET",
+                "/loadtracks",
+                str,
+                params={"identifier": "https://youtube.com/watch?v=video"},
+            )
+
+            assert isinstance(new_track, Track)
+
+            assert new_track.encoded == "encoded"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("offload_threshold", "offloaded"), [(0, True), (1000000, False), (None, False)]
+    )
+    async def test_load_track_offloaded(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+        offload_threshold: int | None,
+        offloaded: bool,
+    ):
+        rest = RESTClient(ongaku_client, offload_threshold=offload_threshold)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps(
+                    {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+                ).decode(),
+            ),
+            mock.patch(
+                "ongaku.rest.asyncio.to_thread", wraps=asyncio.to_thread
+            ) as patched_to_thread,
+        ):
+            new_track = await rest.load_track(
+                "https://youtube.com/watch?v=video",
+                session=ongaku_session,
+            )
+
+        assert patched_to_thread.called is offloaded
+
+        if offloaded:
+            # Only the decode is offloaded, the track is built on the event loop.
+            assert patched_to_thread.call_args.args[0] is json_loads
+
+        assert isinstance(new_track, Track)
+
+        assert new_track.encoded == "encoded"
+
+    @pytest.mark.asyncio
+    async def test_load_track_offloaded_malformed(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client, offload_threshold=0)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps({"loadType": "track", "data": {}}).decode(),
+            ),
+            pytest.raises(errors.BuildError),
+        ):
+            await rest.load_track("ytsearch:malformed-track", session=ongaku_session)
+
     @pytest.mark.asyncio
     async def test_load_track_with_custom_session(
         self,
@@ -59,7 +180,7 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                str,
                 params={"identifier": "https://youtube.com/watch?v=video"},
             )
 
@@ -96,7 +217,7 @@ class TestRestTrack:
             patched_request.assert_called_once_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                str,
                 params={"identifier": "https://youtube.com/watch?v=video"},
             )
 
@@ -134,7 +255,7 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            str,
             params={"identifier": "ytsearch:malformed-track"},
         )
 
@@ -174,7 +295,7 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                str,
                 params={
                     "identifier": "https://www.youtube.com/watch?v=video&list=playlist",
                 },
@@ -214,7 +335,7 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            str,
             params={"identifier": "ytsearch:malformed-playlist"},
         )
 
@@ -249,7 +370,7 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                str,
                 params={"identifier": "ytsearch:a-track"},
             )
 
@@ -287,7 +408,7 @@ class TestRestTrack:
         patched_request.assert_called_once_with(
             "GET",
             "/loadtracks",
-            dict,
+            str,
             params={"identifier": "ytsearch:malformed-search"},
         )
 
@@ -322,7 +443,7 @@ class TestRestTrack:
             patched_request.assert_called_with(
                 "GET",
                 "/loadtracks",
-                dict,
+                str,
                 params={"identifier": "ytsearch:not-a-track"},
             )
 
@@ -361,12 +482,215 @@ class TestRestTrack:
         patched_request.assert_called_with(
             "GET",
             "/loadtracks",
-            dict,
+            str,
             params={"identifier": "https://youtube.com/watch?v=a-broken-video"},
         )
 
         assert isinstance(rest_exception_error.value, errors.RestExceptionError)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("offload_threshold", [0, None])
+    async def test_stream_track_as_playlist(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+        offload_threshold: int | None,
+    ):
+        rest = RESTClient(ongaku_client, offload_threshold=offload_threshold)
+
+        playlist_payload = dict(payloads.PLAYLIST_PAYLOAD)
+        playlist_payload["tracks"] = [payloads.TRACK_PAYLOAD] * 5
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=json_dumps(
+                {"loadType": "playlist", "data": playlist_payload}
+            ).decode(),
+        ) as patched_request:
+            results = [
+                result
+                async for result in rest.stream_track(
+                    "https://youtube.com/playlist?list=playlist",
+                    chunk_size=2,
+                    session=ongaku_session,
+                )
+            ]
+
+        patched_request.assert_called_once_with(
+            "GET",
+            "/loadtracks",
+            str,
+            params={"identifier": "https://youtube.com/playlist?list=playlist"},
+        )
+
+        assert isinstance(results[0], PlaylistInfo)
+        assert results[0].name == "name"
+
+        chunks = typing.cast("list[typing.Sequence[Track]]", results[1:])
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+        for chunk in chunks:
+            for track in chunk:
+                assert isinstance(track, Track)
+                assert track.encoded == "encoded"
+
+    @pytest.mark.asyncio
+    async def test_stream_track_as_search(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with (
+            mock.patch.object(rest._client, "_session_handler"),
+            mock.patch.object(
+                rest._client.session_handler,
+                "fetch_session",
+                return_value=ongaku_session,
+            ) as patched_fetch_session,
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps(
+                    {"loadType": "search", "data": [payloads.TRACK_PAYLOAD] * 3}
+                ).decode(),
+            ),
+        ):
+            results = [result async for result in rest.stream_track("ytsearch:a-track")]
+
+        patched_fetch_session.assert_called_once()
+
+        assert [
+            len(typing.cast("typing.Sequence[Track]", result)) for result in results
+        ] == [3]
+
+    @pytest.mark.asyncio
+    async def test_stream_track_as_track(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=json_dumps(
+                {"loadType": "track", "data": payloads.TRACK_PAYLOAD}
+            ).decode(),
+        ):
+            results = [
+                result
+                async for result in rest.stream_track(
+                    "https://youtube.com/watch?v=video", session=ongaku_session
+                )
+            ]
+
+        assert len(results) == 1
+
+        chunk = typing.cast("typing.Sequence[Track]", results[0])
+
+        assert len(chunk) == 1
+        assert chunk[0].encoded == "encoded"
+
+    @pytest.mark.asyncio
+    async def test_stream_track_as_empty(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with mock.patch.object(
+            ongaku_session,
+            "request",
+            new_callable=mock.AsyncMock,
+            return_value=json_dumps({"loadType": "empty", "data": {}}).decode(),
+        ):
+            results = [
+                result
+                async for result in rest.stream_track(
+                    "ytsearch:not-a-track", session=ongaku_session
+                )
+            ]
+
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_stream_track_as_exception(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps(
+                    {"loadType": "error", "data": payloads.EXCEPTION_ERROR_PAYLOAD}
+                ).decode(),
+            ),
+            pytest.raises(errors.RestExceptionError),
+        ):
+            async for _ in rest.stream_track(
+                "https://youtube.com/watch?v=a-broken-video", session=ongaku_session
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"loadType": "unknown", "data": {}},
+            {"loadType": "search", "data": [{}]},
+            {"loadType": "playlist", "data": {}},
+        ],
+    )
+    async def test_stream_track_malformed(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+        response: typing.Mapping[str, typing.Any],
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with (
+            mock.patch.object(
+                ongaku_session,
+                "request",
+                new_callable=mock.AsyncMock,
+                return_value=json_dumps(response).decode(),
+            ),
+            pytest.raises(errors.BuildError),
+        ):
+            async for _ in rest.stream_track(
+                "ytsearch:malformed", session=ongaku_session
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_track_invalid_chunk_size(
+        self,
+        ongaku_client: Client,
+        ongaku_session: Session,
+    ):
+        rest = RESTClient(ongaku_client)
+
+        with pytest.raises(ValueError):
+            async for _ in rest.stream_track(
+                "ytsearch:a-track", chunk_size=0, session=ongaku_session
+            ):
+                pass
+
     @pytest.mark.asyncio
     async def test_decode_track_with_session(
         self,
@@ -15,6 +15,7 @@ from hikari.snowflakes import Snowflake
 import ongaku
 from ongaku import errors
 from ongaku import events
+from ongaku.abc.session import SessionHealth
 from ongaku.abc.session import SessionStatus
 from ongaku.client import Client
 from ongaku.player import Player
@@ -52,6 +53,8 @@ class TestSession:
 
         assert session.password == "youshallnotpass"
 
+        assert session.region is None
+
         if session.ssl:
             assert session.base_uri == f"https://{session.host}:{session.port}"
         else:
@@ -119,18 +122,40 @@ class TestSession:
 
         handler.players = tuple(session._players.values())
 
+        other_session = Session(
+            ongaku_client,
+            "test_session_2",
+            False,
+            "127.0.0.1",
+            2333,
+            "youshallnotpass",
+            3,
+        )
+
+        # Each player is moved to the session picked for its guild.
+        guild_sessions = {
+            player_1.guild_id: new_session,
+            player_2.guild_id: other_session,
+        }
+
         with (
-            mock.patch.object(handler, "fetch_session", return_value=new_session),
+            mock.patch.object(
+                handler, "fetch_player_session", side_effect=guild_sessions.get
+            ),
             mock.patch(
                 "ongaku.player.Player.transfer",
+                autospec=True,
             ) as patched_player_transfer,
         ):
             await session.transfer(handler)
 
-            patched_player_transfer.assert_called_with(handler.fetch_session())
-
             assert patched_player_transfer.call_count == 2
 
+            assert {
+                call.args[0].guild_id: call.args[1]
+                for call in patched_player_transfer.call_args_list
+            } == guild_sessions
+
             assert len(handler.players) == 2
 
             assert handler.players[0].guild_id == player_1.guild_id
@@ -215,6 +240,271 @@ class TestSession:
 
             patched_transfer.assert_called_once_with(ongaku_client.session_handler)
 
+    @pytest.mark.asyncio
+    async def test_transfer_concurrency(
+        self, gateway_bot: gateway_bot_.GatewayBot, ongaku_client: Client
+    ):
+        handler = ongaku_client.session_handler
+
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2"):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        session_1, session_2 = sessions
+
+        handler._current_session = session_2
+
+        idle_player = handler.add_player(Player(session_1, Snowflake(1)))
+        playing_player = handler.add_player(Player(session_1, Snowflake(2)))
+        failed_player = handler.add_player(Player(session_1, Snowflake(3)))
+
+        playing_player._connected = True
+        playing_player._is_paused = False
+        playing_player._queue.append(mock.Mock())
+
+        with pytest.raises(ValueError):
+            await session_1.transfer(handler, concurrency=0)
+
+        async def transfer(player: Player, session: Session) -> Player:
+            if player is failed_player:
+                raise errors.TimeoutError
+
+            return Player(session, player.guild_id)
+
+        with (
+            mock.patch(
+                "ongaku.player.Player.transfer",
+                autospec=True,
+                side_effect=transfer,
+            ) as patched_transfer,
+            mock.patch.object(
+                gateway_bot.event_manager, "dispatch"
+            ) as patched_dispatch,
+            mock.patch(
+                "ongaku.session.Session.stop", new_callable=mock.AsyncMock
+            ) as patched_stop,
+        ):
+            await session_1.transfer(handler, concurrency=1)
+
+            # The player left behind still needs the session.
+            patched_stop.assert_not_called()
+
+            # Playing players are moved first.
+
+            assert [call.args[0] for call in patched_transfer.call_args_list] == [
+                playing_player,
+                idle_player,
+                failed_player,
+            ]
+
+        assert [call.args[0] for call in patched_dispatch.call_args_list] == [
+            events.SessionTransferEvent.from_session(session_1, session_2, 1, 2),
+            events.SessionTransferEvent.from_session(session_1, session_2, 2, 1),
+            events.SessionTransferEvent.from_session(session_1, session_2, 2, 0),
+        ]
+
+        assert handler.fetch_player(Snowflake(1)).session is session_2
+        assert handler.fetch_player(Snowflake(2)).session is session_2
+        assert handler.fetch_player(Snowflake(3)) is failed_player
+        assert session_1.is_draining is False
+
+    @pytest.mark.asyncio
+    async def test_transfer_connected(self, ongaku_client: Client):
+        handler = ongaku_client.session_handler
+
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2"):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        session_1, session_2 = sessions
+
+        # The handler would give new players to the session being transferred.
+        handler._current_session = session_1
+
+        for guild in range(3):
+            handler.add_player(Player(session_1, Snowflake(guild)))
+
+        async def transfer(player: Player, session: Session) -> Player:
+            return Player(session, player.guild_id)
+
+        with (
+            mock.patch(
+                "ongaku.player.Player.transfer",
+                autospec=True,
+                side_effect=transfer,
+            ) as patched_transfer,
+            mock.patch(
+                "ongaku.session.Session.stop", new_callable=mock.AsyncMock
+            ) as patched_stop,
+        ):
+            await session_1.transfer(handler)
+
+            assert patched_transfer.call_count == 3
+
+            patched_stop.assert_called_once()
+
+        assert all(player.session is session_2 for player in handler.players)
+        assert len(handler.players) == 3
+
+    @pytest.mark.asyncio
+    async def test_drain(self, ongaku_client: Client):
+        handler = ongaku_client.session_handler
+
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2"):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        session_1, session_2 = sessions
+
+        for guild in range(3):
+            handler.add_player(Player(session_1, Snowflake(guild)))
+
+        handler.add_player(Player(session_2, Snowflake(3)))
+
+        with pytest.raises(ValueError):
+            await session_1.drain(handler, batch_size=0)
+
+        async def transfer(player: Player, session: Session) -> Player:
+            # Draining sessions are not given new players.
+            assert handler.fetch_session() == session_2
+
+            return Player(session, player.guild_id)
+
+        with (
+            mock.patch(
+                "ongaku.player.Player.transfer",
+                autospec=True,
+                side_effect=transfer,
+            ) as patched_transfer,
+            mock.patch.object(
+                ongaku_client.app.event_manager, "dispatch"
+            ) as patched_dispatch,
+            mock.patch(
+                "ongaku.session.Session.stop", new_callable=mock.AsyncMock
+            ) as patched_stop,
+        ):
+            await session_1.drain(handler, batch_size=2, interval=0)
+
+            assert patched_transfer.call_count == 3
+
+            assert session_1.is_draining is True
+
+            patched_stop.assert_called_once()
+
+        assert [call.args[0] for call in patched_dispatch.call_args_list] == [
+            events.SessionDrainEvent.from_session(session_1, 0, 3),
+            events.SessionDrainEvent.from_session(session_1, 2, 1),
+            events.SessionDrainEvent.from_session(session_1, 3, 0),
+        ]
+
+        assert all(player.session is session_2 for player in handler.players)
+        assert len(handler.players) == 4
+
+        # No other session to move players to.
+
+        handler.add_player(Player(session_1, Snowflake(4)))
+        session_2._status = SessionStatus.FAILURE
+
+        with pytest.raises(errors.NoSessionsError):
+            await session_1.drain(handler)
+
+        # An aborted drain lets the session be given players again.
+
+        assert session_1.is_draining is False
+
+    @pytest.mark.asyncio
+    async def test_drain_failure(self, ongaku_client: Client):
+        handler = ongaku_client.session_handler
+
+        sessions: list[Session] = []
+
+        for name in ("session_1", "session_2"):
+            session = Session(
+                ongaku_client,
+                name,
+                False,
+                "127.0.0.1",
+                2333,
+                "youshallnotpass",
+                3,
+            )
+            session._status = SessionStatus.CONNECTED
+            sessions.append(handler.add_session(session))
+
+        session_1, session_2 = sessions
+
+        for guild in range(3):
+            handler.add_player(Player(session_1, Snowflake(guild)))
+
+        async def transfer(player: Player, session: Session) -> Player:
+            if player.guild_id == Snowflake(1):
+                raise errors.RestStatusError(500, "Internal Server Error")
+
+            return Player(session, player.guild_id)
+
+        with (
+            mock.patch(
+                "ongaku.player.Player.transfer",
+                autospec=True,
+                side_effect=transfer,
+            ) as patched_transfer,
+            mock.patch.object(
+                ongaku_client.app.event_manager, "dispatch"
+            ) as patched_dispatch,
+            mock.patch(
+                "ongaku.session.Session.stop", new_callable=mock.AsyncMock
+            ) as patched_stop,
+        ):
+            await session_1.drain(handler, batch_size=1, interval=0)
+
+            # The failed player is not retried.
+            assert patched_transfer.call_count == 3
+
+            # The player left behind still needs the session.
+            patched_stop.assert_not_called()
+
+        assert [call.args[0] for call in patched_dispatch.call_args_list][-1] == (
+            events.SessionDrainEvent.from_session(session_1, 2, 0)
+        )
+
+        assert session_1.is_draining is False
+        assert handler.fetch_player(Snowflake(0)).session is session_2
+        assert handler.fetch_player(Snowflake(1)).session is session_1
+        assert handler.fetch_player(Snowflake(2)).session is session_2
+
     @pytest.mark.asyncio
     async def test_start(self, ongaku_client: Client):
         session = Session(
@@ -262,6 +552,76 @@ class TestSession:
             await session.stop()
 
             assert session._session_task is None
+            assert session._health_task is None
+
+    @pytest.mark.asyncio
+    async def test_check_health(self, ongaku_client: Client):
+        session = Session(
+            ongaku_client,
+            "test_session",
+            False,
+            "host",
+            2333,
+            "password",
+            3,
+        )
+
+        # Not connected sessions are always unhealthy.
+
+        assert session.health == SessionHealth.UNHEALTHY
+        assert session.latency is None
+
+        session._status = SessionStatus.CONNECTED
+        session._last_message = 0
+
+        assert session.health == SessionHealth.HEALTHY
+
+        with (
+            mock.patch(
+                "ongaku.rest.RESTClient.fetch_version",
+                new_callable=mock.AsyncMock,
+            ) as patched_fetch_version,
+            mock.patch("ongaku.session.time") as patched_time,
+        ):
+            # Healthy, fast response.
+
+            patched_time.monotonic.side_effect = [10, 10.1, 10.1]
+
+            assert await session.check_health() == SessionHealth.HEALTHY
+
+            patched_fetch_version.assert_called_once_with(session=session)
+
+            assert session.latency == pytest.approx(100)
+
+            # Slow responses are smoothed, then degraded.
+
+            patched_time.monotonic.side_effect = [20, 25, 25]
+
+            assert await session.check_health() == SessionHealth.DEGRADED
+
+            assert session.latency == pytest.approx(1570)
+
+            # No messages received for a while.
+
+            session._latency = None
+            patched_time.monotonic.side_effect = [100, 100, 100]
+
+            assert await session.check_health() == SessionHealth.DEGRADED
+
+            patched_time.monotonic.side_effect = [200, 200, 200]
+
+            assert await session.check_health() == SessionHealth.UNHEALTHY
+
+            # Failed requests.
+
+            session._last_message = 200
+            patched_time.monotonic.side_effect = None
+            patched_time.monotonic.return_value = 200
+            patched_fetch_version.side_effect = errors.RestStatusError(
+                500, "Internal Server Error"
+            )
+
+            assert await session.check_health() == SessionHealth.UNHEALTHY
 
 
 class TestRequest: